@@ -0,0 +1,35 @@
+"""Add partial covering index on users.email (including id) for subscribed users
+
+Revision ID: 011_add_subscribed_users_index
+Revises: 010_add_podcast_to_issues
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011_add_subscribed_users_index"
+down_revision: str = "010_add_podcast_to_issues"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Lets the daily email fan-out read subscriber (id, email) pairs with an
+    # index-only scan
+    op.create_index(
+        "ix_users_subscribed_email",
+        "users",
+        ["email"],
+        postgresql_where=sa.text("is_subscribed"),
+        postgresql_include=["id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_subscribed_email", table_name="users")
@@ -0,0 +1,35 @@
+"""Add partial covering index on issues for published podcast episodes
+
+Revision ID: 012_add_issue_podcast_index
+Revises: 011_add_subscribed_users_index
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012_add_issue_podcast_index"
+down_revision: str = "011_add_subscribed_users_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Serves the RSS episode list (index-only scan, newest first) and the
+    # episode-number count over issues that have a podcast
+    op.create_index(
+        "ix_issues_podcast_issue_date",
+        "issues",
+        ["issue_date"],
+        postgresql_where=sa.text("podcast_audio_url IS NOT NULL"),
+        postgresql_include=["podcast_audio_url", "podcast_duration_seconds", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_issues_podcast_issue_date", table_name="issues")
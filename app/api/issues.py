@@ -2,7 +2,7 @@ from datetime import date
 
 from fastapi import APIRouter, HTTPException, Query, status
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager
 
 from app.config import get_config
 from app.dependencies import CurrentUser, CurrentUserOptional, DBSession
@@ -135,10 +135,12 @@ async def get_issue(
             detail=f"No issue found for {issue_date}",
         )
 
-    # Get clusters with summaries for this date, ordered by score
+    # Get clusters with summaries for this date, ordered by score. The INNER JOIN
+    # drops unsummarized clusters in SQL, so the LIMIT counts only displayable items.
     clusters_result = await db.execute(
         select(Cluster)
-        .options(selectinload(Cluster.summary))
+        .join(Cluster.summary)
+        .options(contains_eager(Cluster.summary))
         .where(Cluster.issue_date == issue_date)
         .order_by(Cluster.cluster_score.desc())
         .limit(config.digest.max_items)
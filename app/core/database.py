@@ -59,8 +59,8 @@ engine = create_async_engine(
     clean_url,
     echo=settings.debug,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
     pool_recycle=120,  # Recycle connections before Neon's 5min idle timeout
     connect_args=connect_args,
 )
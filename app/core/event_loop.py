@@ -0,0 +1,27 @@
+"""Event loop helpers for job entrypoints.
+
+Jobs run on uvloop where it is available; it is a libuv-backed drop-in
+replacement for the default asyncio loop with much higher I/O throughput.
+"""
+
+import asyncio
+import sys
+from collections.abc import Coroutine
+from typing import Any
+
+
+def run[T](main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a job's main coroutine, on uvloop outside Windows.
+
+    Args:
+        main: Top-level coroutine of the job
+
+    Returns:
+        The coroutine's result
+    """
+    if sys.platform != "win32":
+        import uvloop
+
+        return uvloop.run(main)
+    return asyncio.run(main)
@@ -0,0 +1,13 @@
+"""Filesystem helpers shared by the local media caches."""
+
+import os
+import shutil
+from pathlib import Path
+
+
+def copy_into_cache(source: Path, cached_path: Path) -> None:
+    """Copy a file into a cache directory, atomically so readers never see partial files."""
+    cached_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cached_path.with_suffix(f".{os.getpid()}.tmp")
+    shutil.copyfile(source, tmp_path)
+    tmp_path.replace(cached_path)
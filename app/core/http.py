@@ -0,0 +1,36 @@
+"""Shared HTTP client helpers.
+
+Dispatchers accept an optional injected httpx.AsyncClient so a single
+keep-alive connection pool can be reused across a whole run.
+"""
+
+from contextlib import AbstractAsyncContextManager, nullcontext
+
+import httpx
+
+# Connection pool limits for the client shared by a daily dispatch run
+DISPATCH_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+def create_dispatch_client() -> httpx.AsyncClient:
+    """Create the HTTP/2, keep-alive client shared by all dispatchers in a run."""
+    return httpx.AsyncClient(timeout=30.0, http2=True, limits=DISPATCH_LIMITS)
+
+
+def client_or_new(
+    client: httpx.AsyncClient | None,
+    timeout: float | httpx.Timeout = 30.0,
+) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+    """
+    Use an injected client without closing it, or open a short-lived one.
+
+    Args:
+        client: Shared client owned by the caller, if any
+        timeout: Timeout for the short-lived client
+
+    Returns:
+        Async context manager yielding the client to use
+    """
+    if client is not None:
+        return nullcontext(client)
+    return httpx.AsyncClient(timeout=timeout)
@@ -33,7 +33,7 @@ async def hourly_job() -> None:
     logger.info("scheduled_hourly_job_started")
     async with AsyncSessionLocal() as db:
         try:
-            stats = await run_hourly_ingest(db)
+            stats = await run_hourly_ingest(db, max_concurrency=get_settings().ingest_concurrency)
             logger.bind(**stats).info("scheduled_hourly_job_completed")
         except Exception as e:
             logger.bind(error=str(e)).error("scheduled_hourly_job_failed")
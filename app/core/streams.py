@@ -0,0 +1,99 @@
+"""Async iterator utilities for streaming pipelines.
+
+Helpers here let a consumer overlap its own work (e.g. database writes)
+with the network I/O of the async iterator feeding it.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator, AsyncIterator
+from dataclasses import dataclass
+
+# Marks the end of the source iterator in the prefetch queue
+_DONE = object()
+
+
+@dataclass
+class _Failure:
+    """Carries an exception raised by the source iterator to the consumer."""
+
+    error: Exception
+
+
+async def _drain_into(source: AsyncIterator[object], queue: asyncio.Queue[object]) -> None:
+    """Push every item of source into queue, then a _Failure or the _DONE marker."""
+    try:
+        async for item in source:
+            await queue.put(item)
+    except Exception as e:
+        await queue.put(_Failure(e))
+        return
+    await queue.put(_DONE)
+
+
+async def _stop(producer: asyncio.Task[None]) -> None:
+    """Cancel a producer task and wait for it to finish."""
+    producer.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await producer
+
+
+async def batched[T](
+    source: AsyncIterator[T],
+    max_items: int = 100,
+    max_latency: float = 1.0,
+) -> AsyncGenerator[list[T]]:
+    """
+    Group items from an async iterator into batches by count or by age.
+
+    A batch is yielded as soon as it holds max_items items, or max_latency
+    seconds after its first item arrived, whichever comes first. A fast source
+    never builds oversized batches and a slow one never holds items back
+    indefinitely. The source is prefetched in a background task, so it keeps
+    producing while the consumer handles the previous batch.
+
+    If source raises, the items received before the error are yielded as a
+    final batch and the error is then re-raised in the consumer.
+
+    Args:
+        source: Async iterator to drain
+        max_items: Maximum batch size
+        max_latency: Maximum seconds an item waits before its batch is yielded
+
+    Yields:
+        Non-empty lists of items from source, in order
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[object] = asyncio.Queue(maxsize=max_items)
+    producer = asyncio.create_task(_drain_into(source, queue))
+    batch: list[T] = []
+    deadline: float | None = None
+    try:
+        while True:
+            timeout = None if deadline is None else max(deadline - loop.time(), 0.0)
+            try:
+                # Cancelling a pending Queue.get() on timeout loses no items
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except TimeoutError:
+                yield batch
+                batch, deadline = [], None
+                continue
+
+            if item is _DONE:
+                break
+            if isinstance(item, _Failure):
+                if batch:
+                    yield batch
+                raise item.error
+
+            batch.append(item)  # type: ignore[arg-type]
+            if deadline is None:
+                deadline = loop.time() + max_latency
+            if len(batch) >= max_items:
+                yield batch
+                batch, deadline = [], None
+
+        if batch:
+            yield batch
+    finally:
+        await _stop(producer)
@@ -28,6 +28,10 @@ class BaseFetcher(ABC):
         """
         Fetch and yield normalized content items from this source.
 
+        Items should be yielded as soon as they are parsed rather than collected
+        first: consumers batch and persist them while the fetch is still running,
+        so peak memory stays bounded by the consumer's batch size.
+
         Yields:
             RawContent items with normalized fields
         """
@@ -1,4 +1,8 @@
-from sqlalchemy import select
+import asyncio
+import uuid
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import AppConfig, get_config
@@ -14,6 +18,21 @@ from app.models.content import ContentItem, ContentSource, MetricsSnapshot
 
 logger = get_logger(__name__)
 
+# Rows per multi-row INSERT (and per transaction) during hourly ingest
+INGEST_BATCH_SIZE = 500
+
+# Map source string to enum
+SOURCE_MAP = {
+    "x": ContentSource.X,
+    "reddit": ContentSource.REDDIT,
+    "github": ContentSource.GITHUB,
+    "youtube": ContentSource.YOUTUBE,
+    "devto": ContentSource.DEVTO,
+    "rss": ContentSource.RSS,
+    "status": ContentSource.STATUS,
+    "bluesky": ContentSource.BLUESKY,
+}
+
 
 def create_all_fetchers(config: AppConfig) -> list[BaseFetcher]:
     """Create all configured fetchers."""
@@ -45,77 +64,115 @@ def create_all_fetchers(config: AppConfig) -> list[BaseFetcher]:
     return fetchers
 
 
-async def upsert_content_item(
+async def upsert_content_items(
     db: AsyncSession,
-    raw: RawContent,
-) -> ContentItem:
+    raws: list[RawContent],
+) -> list[tuple[uuid.UUID, bool]]:
     """
-    Upsert a content item by URL.
+    Bulk upsert content items by URL.
+
+    New items are inserted with a single multi-row INSERT ... ON CONFLICT DO NOTHING;
+    existing items are left untouched. An item is new exactly when its row comes
+    back from the INSERT's RETURNING clause, so no timestamp heuristics are needed.
 
-    If item exists, returns existing item.
-    If item is new, creates and returns it.
+    Returns:
+        (item_id, is_new) for each input item, in input order
     """
-    # Check if item exists
-    result = await db.execute(select(ContentItem).where(ContentItem.url == raw.url))
-    existing = result.scalar_one_or_none()
-
-    if existing:
-        item: ContentItem = existing
-        return item
-
-    # Map source string to enum
-    source_map = {
-        "x": ContentSource.X,
-        "reddit": ContentSource.REDDIT,
-        "github": ContentSource.GITHUB,
-        "youtube": ContentSource.YOUTUBE,
-        "devto": ContentSource.DEVTO,
-        "rss": ContentSource.RSS,
-        "status": ContentSource.STATUS,
-        "bluesky": ContentSource.BLUESKY,
-    }
-    source = source_map.get(raw.source, ContentSource.RSS)
-
-    # Create new item
-    item = ContentItem(
-        source=source,
-        source_id=raw.source_id,
-        url=raw.url,
-        title=raw.title,
-        author=raw.author,
-        published_at=to_naive_utc(raw.published_at),
-        text=raw.text,
+    if not raws:
+        return []
+
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "source": SOURCE_MAP.get(raw.source, ContentSource.RSS),
+            "source_id": raw.source_id,
+            "url": raw.url,
+            "title": raw.title,
+            "author": raw.author,
+            "published_at": to_naive_utc(raw.published_at),
+            "text": raw.text,
+        }
+        for raw in raws
+    ]
+    # Passing rows as executemany parameters (rather than .values(rows)) keeps the
+    # statement text constant, so it is cached, and SQLAlchemy's insertmanyvalues
+    # still sends it as multi-row INSERT ... RETURNING batches
+    result = await db.execute(
+        pg_insert(ContentItem)
+        .on_conflict_do_nothing(index_elements=[ContentItem.url])
+        .returning(ContentItem.url, ContentItem.id),
+        rows,
     )
-    db.add(item)
-    await db.flush()
+    ids_by_url = {url: (item_id, True) for url, item_id in result.all()}
 
-    logger.bind(url=raw.url, source=raw.source).debug("content_item_created")
+    # Rows skipped by ON CONFLICT already exist; look up their ids
+    existing_urls = [raw.url for raw in raws if raw.url not in ids_by_url]
+    if existing_urls:
+        existing = await db.execute(
+            select(ContentItem.url, ContentItem.id).where(ContentItem.url.in_(existing_urls))
+        )
+        for url, item_id in existing.all():
+            ids_by_url[url] = (item_id, False)
 
-    return item
+    return [ids_by_url[raw.url] for raw in raws]
 
 
-async def create_metrics_snapshot(
+async def create_metrics_snapshots(
     db: AsyncSession,
-    item_id: str,
-    metrics: dict,
-) -> MetricsSnapshot:
-    """Create a metrics snapshot for an item."""
-    snapshot = MetricsSnapshot(
-        item_id=item_id,
-        captured_at=utc_now(),
-        metrics_json=metrics,
-    )
-    db.add(snapshot)
-    await db.flush()
-    return snapshot
+    snapshots: list[tuple[uuid.UUID, dict]],
+) -> int:
+    """
+    Create metrics snapshots for many items with one batched INSERT.
 
+    Items with empty metrics are skipped: scoring treats an empty snapshot
+    the same as a missing one.
 
-async def run_hourly_ingest(db: AsyncSession) -> dict:
+    Returns:
+        Number of snapshots created
+    """
+    captured_at = utc_now()
+    rows = [
+        {"item_id": item_id, "captured_at": captured_at, "metrics_json": metrics}
+        for item_id, metrics in snapshots
+        if metrics
+    ]
+    if not rows:
+        return 0
+
+    await db.execute(insert(MetricsSnapshot), rows)
+    return len(rows)
+
+
+async def _collect_fetcher_items(
+    fetcher: BaseFetcher,
+    semaphore: asyncio.Semaphore,
+) -> tuple[list[RawContent], Exception | None]:
+    """
+    Drain a fetcher into memory while holding a slot of the shared semaphore.
+
+    Returns the items fetched so far and the error that stopped the fetcher, if any,
+    so items yielded before a failure are still ingested.
+    """
+    items: list[RawContent] = []
+    async with semaphore:
+        try:
+            async for raw_item in fetcher.fetch():
+                items.append(raw_item)
+        except Exception as e:
+            return items, e
+    return items, None
+
+
+async def run_hourly_ingest(db: AsyncSession, max_concurrency: int = 16) -> dict:
     """
     Run the hourly ingest job.
 
-    Fetches from all sources, upserts content items,
-    and creates metrics snapshots.
+    Fetches from all sources concurrently, then bulk upserts content items
+    and creates metrics snapshots in batches through the single session.
+
+    Args:
+        db: Database session
+        max_concurrency: Maximum number of fetchers running at once
 
     Returns:
         Dict with stats about the ingest run
@@ -131,50 +188,57 @@ async def run_hourly_ingest(db: AsyncSession) -> dict:
         "errors": 0,
     }
 
-    logger.bind(fetcher_count=len(fetchers)).info("hourly_ingest_started")
+    logger.bind(fetcher_count=len(fetchers), max_concurrency=max_concurrency).info(
+        "hourly_ingest_started"
+    )
+
+    # Fetching is network-bound, so overlap it; DB writes stay sequential
+    # because an AsyncSession must not be used from concurrent tasks
+    semaphore = asyncio.Semaphore(max_concurrency)
+    fetched = await asyncio.gather(
+        *[_collect_fetcher_items(fetcher, semaphore) for fetcher in fetchers]
+    )
 
-    for fetcher in fetchers:
+    for fetcher, (raw_items, fetch_error) in zip(fetchers, fetched, strict=True):
         fetcher_stats = {
             "items": 0,
             "errors": 0,
         }
 
-        try:
-            async for raw_item in fetcher.fetch():
-                try:
-                    # Upsert content item
-                    item = await upsert_content_item(db, raw_item)
-
-                    # Track if new or existing
-                    if item.fetched_at and (utc_now() - item.fetched_at).seconds < 60:
-                        stats["new_items"] += 1
-                    else:
-                        stats["existing_items"] += 1
-
-                    # Create metrics snapshot
-                    await create_metrics_snapshot(db, str(item.id), raw_item.metrics)
-                    stats["snapshots_created"] += 1
-
-                    fetcher_stats["items"] += 1
-                    stats["total_items"] += 1
-
-                except Exception as e:
-                    logger.warning(
-                        f"ingest_item_error: {fetcher.source_name} | {raw_item.url} | {e}"
-                    )
-                    fetcher_stats["errors"] += 1
-                    stats["errors"] += 1
-
-        except Exception as e:
-            logger.error(f"fetcher_error: {fetcher.source_name} | {e}")
+        for start in range(0, len(raw_items), INGEST_BATCH_SIZE):
+            batch = raw_items[start : start + INGEST_BATCH_SIZE]
+            try:
+                upserted = await upsert_content_items(db, batch)
+                snapshots = [
+                    (item_id, raw.metrics)
+                    for (item_id, _), raw in zip(upserted, batch, strict=True)
+                ]
+                snapshot_count = await create_metrics_snapshots(db, snapshots)
+                # One transaction per batch keeps WAL pressure and lock time bounded
+                await db.commit()
+            except Exception as e:
+                await db.rollback()
+                logger.warning(
+                    f"ingest_batch_error: {fetcher.source_name} | items={len(batch)} | {e}"
+                )
+                fetcher_stats["errors"] += len(batch)
+                stats["errors"] += len(batch)
+                continue
+
+            new_count = sum(1 for _, is_new in upserted if is_new)
+            stats["new_items"] += new_count
+            stats["existing_items"] += len(batch) - new_count
+            stats["snapshots_created"] += snapshot_count
+            fetcher_stats["items"] += len(batch)
+            stats["total_items"] += len(batch)
+
+        if fetch_error is not None:
+            logger.error(f"fetcher_error: {fetcher.source_name} | {fetch_error}")
             stats["errors"] += 1
 
         logger.info(
             f"fetcher_completed: {fetcher.source_name} | items={fetcher_stats['items']} errors={fetcher_stats['errors']}"
         )
 
-    # Commit all changes
-    await db.commit()
-
     logger.info(f"hourly_ingest_completed: {stats}")
     return stats
@@ -22,21 +22,35 @@ have access to media URLs.
 
 import argparse
 import asyncio
-import json
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import asdict
 from datetime import date
+from typing import Any
 
+import httpx
+import orjson
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import get_config, get_settings
+from app.config import AppConfig, Settings, get_config, get_settings
 from app.core.database import AsyncSessionLocal
+from app.core.event_loop import run
+from app.core.http import create_dispatch_client
 from app.core.logging import get_logger, setup_logging
 from app.jobs.podcast_generate import generate_podcast_for_issue
 from app.models.cluster import Cluster, ClusterSummary
 from app.models.user import User
 from app.pipeline.issue_builder import build_daily_issue, get_missed_from_yesterday
+from app.schemas.issue import IssueItem
+from app.services.digest_dispatch import claim_deliveries
+from app.services.digest_payloads import DigestPayloads, build_digest_payloads
 from app.services.discord_dm_service import send_discord_digests
 from app.services.discord_service import send_discord_digest, send_discord_error
-from app.services.email_service import send_daily_digest
+from app.services.email_service import (
+    RESEND_BATCH_LIMIT,
+    render_digest_html,
+    send_daily_digest_batch,
+)
 from app.services.instagram_service import send_instagram_reels
 from app.services.slack_dm_service import send_slack_digests
 from app.services.tiktok_service import send_tiktok_videos
@@ -46,8 +60,11 @@ from app.video.orchestrator import generate_videos_for_issue
 
 logger = get_logger(__name__)
 
+# Number of users loaded and emailed per batch (one Resend batch request each)
+EMAIL_BATCH_SIZE = RESEND_BATCH_LIMIT
 
-async def _notify_dispatch_error(channel: str, error: Exception) -> None:
+
+async def _notify_dispatch_error(channel: str, error: BaseException) -> None:
     """
     Safely attempt to send a Discord error notification for dispatch failures.
 
@@ -66,73 +83,210 @@ async def _notify_dispatch_error(channel: str, error: Exception) -> None:
         )
 
 
-async def get_issue_items(issue_date: date) -> list[dict]:
+async def _dispatch_discord(
+    issue_date: date, items: list[dict], payloads: DigestPayloads, http: httpx.AsyncClient
+) -> bool:
+    """Post the digest to the Discord channel webhook."""
+    discord_sent = await send_discord_digest(
+        issue_date, items, embeds=payloads.discord_embeds, http_client=http
+    )
+    if discord_sent:
+        logger.info("discord_digest_sent")
+    return discord_sent
+
+
+async def _dispatch_discord_dm(
+    issue_date: date, items: list[dict], payloads: DigestPayloads, http: httpx.AsyncClient
+) -> bool:
+    """Send the digest to Discord bot subscribers."""
+    dm_result = await send_discord_digests(
+        issue_date, items, embeds=payloads.discord_dm_embeds, http_client=http
+    )
+    if dm_result.sent > 0:
+        logger.bind(sent=dm_result.sent, failed=dm_result.failed).info("discord_dms_sent")
+    return dm_result.success
+
+
+async def _dispatch_slack_dm(
+    issue_date: date, items: list[dict], payloads: DigestPayloads, http: httpx.AsyncClient
+) -> bool:
+    """Send the digest to Slack subscribers."""
+    slack_result = await send_slack_digests(
+        issue_date, items, blocks=payloads.slack_blocks, http_client=http
+    )
+    if slack_result.sent > 0:
+        logger.bind(sent=slack_result.sent, failed=slack_result.failed).info("slack_dms_sent")
+    return slack_result.success
+
+
+async def _dispatch_twitter(
+    issue_date: date, items: list[dict], payloads: DigestPayloads, http: httpx.AsyncClient
+) -> bool:
+    """Post the digest as a Twitter thread."""
+    twitter_sent = await send_twitter_digest(
+        issue_date, items, tweets=payloads.twitter_thread, http_client=http
+    )
+    if twitter_sent:
+        logger.info("twitter_digest_sent")
+    return twitter_sent
+
+
+DigestDispatcher = Callable[[date, list[dict], DigestPayloads, httpx.AsyncClient], Awaitable[bool]]
+
+
+def _resolve_channels(
+    config: AppConfig,
+) -> tuple[frozenset[str], dict[str, tuple[str, str, DigestDispatcher]]]:
+    """Resolve which channels are enabled and the text-digest dispatcher table."""
+    podcast = getattr(config, "podcast", None)
+    enabled = {
+        "discord": config.discord.enabled,
+        "discord_dm": config.discord_bot.enabled,
+        "slack_dm": config.slack.enabled,
+        "twitter": config.twitter.enabled,
+        "tiktok": config.tiktok.enabled,
+        "instagram": config.instagram.enabled,
+        "video": config.video.enabled,
+        "podcast": bool(podcast and podcast.enabled),
+    }
+    # name -> (label for error notifications, failure log event, dispatcher),
+    # in dispatch order
+    dispatchers: dict[str, tuple[str, str, DigestDispatcher]] = {
+        "discord": ("Discord", "discord_send_failed", _dispatch_discord),
+        "discord_dm": ("Discord DM", "discord_dm_send_failed", _dispatch_discord_dm),
+        "slack_dm": ("Slack DM", "slack_dm_send_failed", _dispatch_slack_dm),
+        "twitter": ("Twitter", "twitter_send_failed", _dispatch_twitter),
+    }
+    return (
+        frozenset(name for name, on in enabled.items() if on),
+        {name: entry for name, entry in dispatchers.items() if enabled[name]},
+    )
+
+
+# Channel config is cached for the process lifetime, so resolve it once at import
+ENABLED_CHANNELS, DISPATCHERS = _resolve_channels(get_config())
+
+
+async def get_issue_items(db: AsyncSession, issue_date: date) -> list[IssueItem]:
     """Fetch issue items for the given date."""
-    async with AsyncSessionLocal() as db:
-        clusters_result = await db.execute(
-            select(Cluster)
-            .where(Cluster.issue_date == issue_date)
-            .order_by(Cluster.cluster_score.desc())
-            .limit(10)
+    clusters_result = await db.execute(
+        select(Cluster)
+        .where(Cluster.issue_date == issue_date)
+        .order_by(Cluster.cluster_score.desc())
+        .limit(10)
+    )
+    clusters = clusters_result.scalars().all()
+
+    items = []
+    for cluster in clusters:
+        summary_result = await db.execute(
+            select(ClusterSummary).where(ClusterSummary.cluster_id == cluster.id)
         )
-        clusters = clusters_result.scalars().all()
+        summary = summary_result.scalar_one_or_none()
 
-        items = []
-        for cluster in clusters:
-            summary_result = await db.execute(
-                select(ClusterSummary).where(ClusterSummary.cluster_id == cluster.id)
-            )
-            summary = summary_result.scalar_one_or_none()
-
-            if summary:
-                items.append(
-                    {
-                        "headline": summary.headline,
-                        "teaser": summary.teaser,
-                        "takeaway": summary.takeaway,
-                        "bullets": summary.bullets_json,
-                        "citations": summary.citations_json,
-                    }
+        if summary:
+            items.append(
+                IssueItem(
+                    headline=summary.headline,
+                    teaser=summary.teaser,
+                    takeaway=summary.takeaway,
+                    bullets=summary.bullets_json,
+                    citations=summary.citations_json,
                 )
+            )
 
-        return items
-
-
-async def send_digest_emails(issue_date: date, items: list[dict]) -> int:
-    """Send daily digest emails to all subscribers."""
-    settings = get_settings()
+    return items
 
-    if not settings.resend_api_key:
-        logger.warning("resend_api_key_not_set_skipping_emails")
-        return 0
 
-    sent_count = 0
+async def _fetch_missed_items() -> list[dict]:
+    """Load yesterday's "You may have missed" items.
 
+    Uses its own session so it can run concurrently with queries on the job's
+    session.
+    """
     async with AsyncSessionLocal() as db:
-        # Fetch "You may have missed" items from yesterday
         missed_clusters = await get_missed_from_yesterday(db, limit=3)
-        missed_items = [
+        return [
             {"headline": c.summary.headline, "teaser": c.summary.teaser}
             for c in missed_clusters
             if c.summary
         ]
 
-        # Get all users
-        result = await db.execute(select(User))
-        users = result.scalars().all()
 
-        # Send to each user
-        for user in users:
-            try:
-                await send_daily_digest(
-                    email=user.email,
+async def send_digest_emails(
+    db: AsyncSession,
+    issue_date: date,
+    items: list[IssueItem],
+    missed_items: list[dict] | None = None,
+    settings: Settings | None = None,
+) -> int:
+    """Send daily digest emails to all subscribed users.
+
+    Each send is claimed in digest_deliveries first, so re-running the job for
+    the same issue date skips users who were already emailed. missed_items is
+    loaded here when the caller has not already fetched it.
+    """
+    settings = settings or get_settings()
+
+    if not settings.resend_api_key:
+        logger.warning("resend_api_key_not_set_skipping_emails")
+        return 0
+
+    sent_count = 0
+
+    if missed_items is None:
+        missed_items = await _fetch_missed_items()
+
+    # Render the digest once before opening the subscriber cursor; each send
+    # only fills in the recipient's link
+    try:
+        html = render_digest_html(
+            issue_date=str(issue_date),
+            items=items,
+            missed_items=missed_items,
+        )
+    except Exception as e:
+        logger.bind(error=str(e)).error("template_error")
+        return 0
+
+    subscribers = await db.stream(
+        select(User.id, User.email)
+        .where(User.is_subscribed.is_(True))
+        .execution_options(yield_per=EMAIL_BATCH_SIZE)
+    )
+
+    # Stream subscribers in batches so memory stays bounded by the batch size;
+    # each batch goes out as a single Resend batch request
+    skipped_count = 0
+    try:
+        # Claims are committed per batch, which would close the server-side cursor
+        # on the streaming session, so they go through their own session
+        async with AsyncSessionLocal() as claim_db:
+            async for batch in subscribers.partitions(EMAIL_BATCH_SIZE):
+                claimed = await claim_deliveries(claim_db, [row.id for row in batch], issue_date)
+                emails = [row.email for row in batch if row.id in claimed]
+                skipped_count += len(batch) - len(emails)
+                if not emails:
+                    await claim_db.rollback()
+                    continue
+
+                sent = await send_daily_digest_batch(
+                    emails=emails,
                     issue_date=str(issue_date),
-                    items=items,
-                    missed_items=missed_items,
+                    html=html,
                 )
-                sent_count += 1
-            except Exception as e:
-                logger.bind(email=user.email, error=str(e)).error("email_send_failed")
+                if sent:
+                    await claim_db.commit()
+                else:
+                    # Release the claims so a retried run sends to these users
+                    await claim_db.rollback()
+                sent_count += sent
+    finally:
+        # Release the server-side cursor even if a batch raises
+        await subscribers.close()
+
+    if skipped_count:
+        logger.bind(skipped=skipped_count).info("emails_already_delivered_skipped")
 
     return sent_count
 
@@ -144,17 +298,18 @@ def format_preview_output(ranked_with_summaries: list) -> str:
         ranked_with_summaries, start=1
     ):
         if summary:
-            output = summary.output
+            # Dump the whole output once rather than each citation separately
+            output = summary.output.model_dump(mode="json")
             items.append(
                 {
                     "rank": rank,
-                    "headline": output.headline,
-                    "teaser": output.teaser,
-                    "takeaway": output.takeaway,
-                    "why_care": output.why_care,
-                    "bullets": output.bullets,
-                    "citations": [c.model_dump() for c in output.citations],
-                    "confidence": output.confidence,
+                    "headline": output["headline"],
+                    "teaser": output["teaser"],
+                    "takeaway": output["takeaway"],
+                    "why_care": output["why_care"],
+                    "bullets": output["bullets"],
+                    "citations": output["citations"],
+                    "confidence": output["confidence"],
                     "score": score_info.get("score"),
                     "tokens": {
                         "prompt": summary.prompt_tokens,
@@ -164,11 +319,10 @@ def format_preview_output(ranked_with_summaries: list) -> str:
                 }
             )
 
-    return json.dumps(
+    return orjson.dumps(
         {"date": str(date.today()), "items": items},
-        indent=2,
-        ensure_ascii=False,
-    )
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+    ).decode()
 
 
 async def main(dry_run: bool = False, skip_email: bool = False) -> None:
@@ -183,6 +337,9 @@ async def main(dry_run: bool = False, skip_email: bool = False) -> None:
 
     issue_date = date.today()
 
+    # Resolve settings once; dispatchers share the same object
+    settings = get_settings()
+
     async with AsyncSessionLocal() as db:
         try:
             # Build the issue
@@ -197,65 +354,106 @@ async def main(dry_run: bool = False, skip_email: bool = False) -> None:
 
             logger.bind(**result.get("stats", {})).info("daily_build_completed")
 
-            # Fetch items for distribution
-            items = await get_issue_items(issue_date)
+            # Fetch items for distribution; the email's "You may have missed"
+            # items load concurrently on their own session
+            if skip_email:
+                items = await get_issue_items(db, issue_date)
+                missed_items: list[dict] = []
+            else:
+                items, missed_items = await asyncio.gather(
+                    get_issue_items(db, issue_date), _fetch_missed_items()
+                )
+            # Dict view for dispatchers that build JSON payloads from items
+            item_dicts = [asdict(item) for item in items]
+            # Render channel payloads once; DM fan-outs reuse them per recipient
+            payloads = build_digest_payloads(issue_date, item_dicts)
 
-            # Get config for channel settings
-            config = get_config()
+            # End the read transaction so no connection sits idle during media
+            # generation; the session checks out a fresh one when next used
+            await db.commit()
 
             # Track dispatch results for summary
             dispatch_results: dict[str, bool] = {}
 
             # =====================================================================
-            # GENERATE: Video - must run before dispatchers
-            # Use fresh session - video generation is long-running and can drop connections
+            # GENERATE: Video + Podcast - must run before dispatchers
+            # Both are independent, so they run concurrently. Each uses a fresh
+            # session - generation is long-running and can drop connections
             # =====================================================================
             video_results: list = []
             ranked_with_summaries = result.get("ranked_with_summaries", [])
-            if config.video.enabled:
-                try:
-                    async with AsyncSessionLocal() as video_db:
-                        video_results = await generate_videos_for_issue(
-                            issue_date=issue_date,
-                            ranked_with_summaries=ranked_with_summaries,
-                            db=video_db,
-                            dry_run=False,
-                            skip_youtube=True,  # YouTube is now a dispatcher
-                        )
+            podcast_enabled = "podcast" in ENABLED_CHANNELS
+
+            async def _generate_videos() -> list:
+                async with AsyncSessionLocal() as video_db:
+                    return await generate_videos_for_issue(
+                        issue_date=issue_date,
+                        ranked_with_summaries=ranked_with_summaries,
+                        db=video_db,
+                        dry_run=False,
+                        skip_youtube=True,  # YouTube is now a dispatcher
+                    )
+
+            async def _generate_podcast() -> dict:
+                async with AsyncSessionLocal() as podcast_db:
+                    return await generate_podcast_for_issue(
+                        db=podcast_db,
+                        issue_date=issue_date,
+                        skip_video=False,
+                    )
+
+            media_tasks: dict[str, Coroutine[Any, Any, Any]] = {}
+            if "video" in ENABLED_CHANNELS:
+                media_tasks["video"] = _generate_videos()
+            if podcast_enabled:
+                media_tasks["podcast"] = _generate_podcast()
+
+            media_results = dict(
+                zip(
+                    media_tasks,
+                    await asyncio.gather(*media_tasks.values(), return_exceptions=True),
+                    strict=True,
+                )
+            )
+
+            if "video" in media_results:
+                video_res = media_results["video"]
+                if isinstance(video_res, BaseException):
+                    logger.bind(error=str(video_res)).error("video_generation_failed")
+                    await _notify_dispatch_error("Video Generation", video_res)
+                else:
+                    video_results = video_res
                     logger.bind(videos_generated=len(video_results)).info("videos_generated")
-                except Exception as e:
-                    logger.bind(error=str(e)).error("video_generation_failed")
-                    await _notify_dispatch_error("Video Generation", e)
 
-            # =====================================================================
-            # GENERATE: Podcast - must run before dispatchers
-            # Use fresh session - podcast generation is long-running and can drop connections
-            # =====================================================================
-            if hasattr(config, "podcast") and config.podcast and config.podcast.enabled:
-                try:
-                    async with AsyncSessionLocal() as podcast_db:
-                        podcast_result = await generate_podcast_for_issue(
-                            db=podcast_db,
-                            issue_date=issue_date,
-                            skip_video=False,
-                        )
-                    if podcast_result.get("success"):
+            if "podcast" in media_results:
+                podcast_res = media_results["podcast"]
+                if isinstance(podcast_res, BaseException):
+                    logger.bind(error=str(podcast_res)).error("podcast_generation_failed")
+                    dispatch_results["podcast"] = False
+                    await _notify_dispatch_error("Podcast", podcast_res)
+                else:
+                    if podcast_res.get("success"):
                         logger.bind(
-                            audio_url=podcast_result.get("audio_url"),
-                            duration=podcast_result.get("duration_seconds"),
+                            audio_url=podcast_res.get("audio_url"),
+                            duration=podcast_res.get("duration_seconds"),
                         ).info("podcast_generated")
-                    dispatch_results["podcast"] = podcast_result.get("success", False)
-                except Exception as e:
-                    logger.bind(error=str(e)).error("podcast_generation_failed")
-                    dispatch_results["podcast"] = False
-                    await _notify_dispatch_error("Podcast", e)
+                    dispatch_results["podcast"] = podcast_res.get("success", False)
+
+            # Uploaded videos in the shape TikTok and Instagram dispatchers expect
+            videos_for_social = [
+                {"s3_url": v.s3_url, "youtube_url": v.youtube_url}
+                for v in video_results
+                if v.s3_url
+            ]
 
             # =====================================================================
             # DISPATCH: Email
             # =====================================================================
             if not skip_email:
                 try:
-                    sent_count = await send_digest_emails(issue_date, items)
+                    sent_count = await send_digest_emails(
+                        db, issue_date, items, missed_items, settings=settings
+                    )
                     logger.bind(count=sent_count).info("emails_sent")
                     dispatch_results["email"] = True
                 except Exception as e:
@@ -266,75 +464,34 @@ async def main(dry_run: bool = False, skip_email: bool = False) -> None:
                 logger.info("email_dispatch_skipped")
 
             # =====================================================================
-            # DISPATCH: Discord (channel webhook)
+            # DISPATCH: Text digests (Discord webhook, Discord/Slack DMs, Twitter)
             # =====================================================================
+            # One keep-alive client shared by every dispatcher and DM fan-out
+            http = create_dispatch_client()
             try:
-                discord_sent = await send_discord_digest(issue_date, items)
-                if discord_sent:
-                    logger.info("discord_digest_sent")
-                dispatch_results["discord"] = discord_sent
-            except Exception as e:
-                logger.bind(error=str(e)).error("discord_send_failed")
-                dispatch_results["discord"] = False
-                await _notify_dispatch_error("Discord", e)
-
-            # =====================================================================
-            # DISPATCH: Discord DMs (bot subscriptions)
-            # =====================================================================
-            if config.discord_bot.enabled:
-                try:
-                    dm_result = await send_discord_digests(issue_date, items)
-                    if dm_result.sent > 0:
-                        logger.bind(sent=dm_result.sent, failed=dm_result.failed).info(
-                            "discord_dms_sent"
-                        )
-                    dispatch_results["discord_dm"] = dm_result.success
-                except Exception as e:
-                    logger.bind(error=str(e)).error("discord_dm_send_failed")
-                    dispatch_results["discord_dm"] = False
-                    await _notify_dispatch_error("Discord DM", e)
-
-            # =====================================================================
-            # DISPATCH: Slack DMs
-            # =====================================================================
-            if config.slack.enabled:
-                try:
-                    slack_result = await send_slack_digests(issue_date, items)
-                    if slack_result.sent > 0:
-                        logger.bind(sent=slack_result.sent, failed=slack_result.failed).info(
-                            "slack_dms_sent"
+                for name, (label, failure_event, dispatch) in DISPATCHERS.items():
+                    try:
+                        dispatch_results[name] = await dispatch(
+                            issue_date, item_dicts, payloads, http
                         )
-                    dispatch_results["slack_dm"] = slack_result.success
-                except Exception as e:
-                    logger.bind(error=str(e)).error("slack_dm_send_failed")
-                    dispatch_results["slack_dm"] = False
-                    await _notify_dispatch_error("Slack DM", e)
-
-            # =====================================================================
-            # DISPATCH: Twitter
-            # =====================================================================
-            if config.twitter.enabled:
-                try:
-                    twitter_sent = await send_twitter_digest(issue_date, items)
-                    if twitter_sent:
-                        logger.info("twitter_digest_sent")
-                    dispatch_results["twitter"] = twitter_sent
-                except Exception as e:
-                    logger.bind(error=str(e)).error("twitter_send_failed")
-                    dispatch_results["twitter"] = False
-                    await _notify_dispatch_error("Twitter", e)
+                    except Exception as e:
+                        logger.bind(error=str(e)).error(failure_event)
+                        dispatch_results[name] = False
+                        await _notify_dispatch_error(label, e)
+            finally:
+                await http.aclose()
 
             # =====================================================================
             # DISPATCH: TikTok
             # =====================================================================
-            if config.tiktok.enabled and video_results:
+            if "tiktok" in ENABLED_CHANNELS and video_results:
                 try:
-                    videos_for_social = [
-                        {"s3_url": v.s3_url, "youtube_url": v.youtube_url}
-                        for v in video_results
-                        if v.s3_url
-                    ]
-                    tiktok_result = await send_tiktok_videos(issue_date, videos_for_social, items)
+                    tiktok_result = await send_tiktok_videos(
+                        issue_date,
+                        videos_for_social,
+                        item_dicts,
+                        concurrency=get_config().tiktok.max_parallel,
+                    )
                     if tiktok_result.success:
                         logger.bind(message=tiktok_result.message).info("tiktok_videos_posted")
                     dispatch_results["tiktok"] = tiktok_result.success
@@ -346,15 +503,13 @@ async def main(dry_run: bool = False, skip_email: bool = False) -> None:
             # =====================================================================
             # DISPATCH: Instagram Reels
             # =====================================================================
-            if config.instagram.enabled and video_results:
+            if "instagram" in ENABLED_CHANNELS and video_results:
                 try:
-                    videos_for_social = [
-                        {"s3_url": v.s3_url, "youtube_url": v.youtube_url}
-                        for v in video_results
-                        if v.s3_url
-                    ]
                     instagram_result = await send_instagram_reels(
-                        issue_date, videos_for_social, items
+                        issue_date,
+                        videos_for_social,
+                        item_dicts,
+                        concurrency=get_config().instagram.max_parallel,
                     )
                     if instagram_result.success:
                         logger.bind(message=instagram_result.message).info("instagram_reels_posted")
@@ -367,7 +522,7 @@ async def main(dry_run: bool = False, skip_email: bool = False) -> None:
             # =====================================================================
             # DISPATCH: YouTube Shorts
             # =====================================================================
-            if config.video.enabled and video_results:
+            if "video" in ENABLED_CHANNELS and video_results:
                 try:
                     # Get summaries and topics for metadata
                     summaries = [
@@ -399,7 +554,7 @@ async def main(dry_run: bool = False, skip_email: bool = False) -> None:
             # DISPATCH: YouTube Podcast
             # Use fresh session to avoid poisoned session from earlier failures
             # =====================================================================
-            if hasattr(config, "podcast") and config.podcast and config.podcast.enabled:
+            if podcast_enabled:
                 try:
                     from sqlalchemy import select
 
@@ -454,4 +609,4 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    asyncio.run(main(dry_run=args.dry_run))
+    run(main(dry_run=args.dry_run))
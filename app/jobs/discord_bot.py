@@ -9,11 +9,10 @@ This starts the Discord bot that handles:
 - /status - Check subscription status
 """
 
-import asyncio
-
+from app.core.event_loop import run
 from app.core.logging import setup_logging
 from app.services.discord_bot import run_bot
 
 if __name__ == "__main__":
     setup_logging()
-    asyncio.run(run_bot())
+    run(run_bot())
@@ -12,10 +12,10 @@ Examples:
 """
 
 import argparse
-import asyncio
-from datetime import date, datetime
+from datetime import date
 
 from app.core.database import AsyncSessionLocal
+from app.core.event_loop import run
 from app.core.logging import get_logger, setup_logging
 from app.services.dispatch import (
     dispatch_issue,
@@ -76,7 +76,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Dispatch stored digest to destinations")
     parser.add_argument(
         "--date",
-        type=lambda s: datetime.strptime(s, "%Y-%m-%d").date(),
+        type=date.fromisoformat,
         default=None,
         help="Issue date (YYYY-MM-DD). Default: latest",
     )
@@ -92,4 +92,4 @@ if __name__ == "__main__":
     if args.destinations:
         dest_list = [d.strip() for d in args.destinations.split(",") if d.strip()]
 
-    asyncio.run(main(issue_date=args.date, destinations=dest_list))
+    run(main(issue_date=args.date, destinations=dest_list))
@@ -9,9 +9,9 @@ This job:
 3. Creates metrics snapshots for engagement tracking
 """
 
-import asyncio
-
+from app.config import get_settings
 from app.core.database import AsyncSessionLocal
+from app.core.event_loop import run
 from app.core.logging import get_logger, setup_logging
 from app.ingest.orchestrator import run_hourly_ingest
 
@@ -25,7 +25,7 @@ async def main() -> None:
 
     async with AsyncSessionLocal() as db:
         try:
-            stats = await run_hourly_ingest(db)
+            stats = await run_hourly_ingest(db, max_concurrency=get_settings().ingest_concurrency)
             logger.bind(**stats).info("hourly_job_completed")
         except Exception as e:
             logger.bind(error=str(e)).error("hourly_job_failed")
@@ -33,4 +33,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
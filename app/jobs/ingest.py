@@ -11,19 +11,40 @@ Examples:
 import argparse
 import asyncio
 from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, aclosing, nullcontext
+from dataclasses import dataclass
 
-from app.config import AppConfig, get_config
-from app.core.database import AsyncSessionLocal
+import aiohttp
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import AppConfig, get_config, get_settings
+from app.core.database import AsyncSessionLocal, engine
+from app.core.event_loop import run
 from app.core.logging import get_logger, setup_logging
-from app.ingest.base import BaseFetcher
+from app.core.streams import batched
+from app.ingest.base import BaseFetcher, RawContent
 from app.ingest.devto import create_devto_fetcher
-from app.ingest.orchestrator import create_metrics_snapshot, upsert_content_item
+from app.ingest.orchestrator import create_metrics_snapshots, upsert_content_items
 from app.ingest.reddit import create_reddit_fetcher
 from app.ingest.rss import create_rss_fetchers
 from app.ingest.youtube import create_youtube_fetcher
 
 logger = get_logger(__name__)
 
+# Items buffered per multi-row INSERT when persisting
+BATCH_SIZE = 100
+
+# Maximum seconds a fetched item waits in the buffer before being written
+FLUSH_INTERVAL = 1.0
+
+# Fetcher errors reported without a traceback: fetchers use aiohttp, and
+# timeouts and connection failures are expected on flaky sources
+TRANSIENT_FETCH_ERRORS = (aiohttp.ClientError, TimeoutError)
+
+# Non-verbose runs print a progress line every this many items
+PROGRESS_EVERY = 100
+
 # Map source names to their factory functions
 FETCHER_FACTORIES: dict[str, Callable[[AppConfig], BaseFetcher | list[BaseFetcher] | None]] = {
     "rss": create_rss_fetchers,
@@ -33,33 +54,228 @@ FETCHER_FACTORIES: dict[str, Callable[[AppConfig], BaseFetcher | list[BaseFetche
 }
 
 
+async def flush_buffer(
+    db: AsyncSession,
+    buffer: dict[str, RawContent],
+    stats: dict,
+    fast_commit: bool = False,
+) -> None:
+    """
+    Persist and commit buffered items with one multi-row INSERT per table.
+
+    Upserts the content items, snapshots their metrics, commits the batch and
+    updates the new/existing/error counts in stats. A failed batch is rolled
+    back without affecting batches already committed. Clears the buffer.
+
+    Args:
+        db: Database session
+        buffer: Fetched items to persist, keyed by URL
+        stats: Stats dict to update
+        fast_commit: If True, don't wait for the WAL flush when the current
+            transaction commits. Ingested data is re-fetchable and upserts are
+            idempotent, so losing the last batches on a crash is acceptable.
+    """
+    batch = list(buffer.values())
+    try:
+        if fast_commit:
+            # LOCAL reverts at COMMIT, so pooled connections are unaffected
+            await db.execute(text("SET LOCAL synchronous_commit = OFF"))
+        upserted = await upsert_content_items(db, batch)
+        await create_metrics_snapshots(
+            db,
+            [(item_id, raw.metrics) for (item_id, _), raw in zip(upserted, batch, strict=True)],
+        )
+        # Commit per batch so progress is durable and the transaction stays short
+        await db.commit()
+        new_count = sum(1 for _, is_new in upserted if is_new)
+        stats["new_items"] += new_count
+        stats["existing_items"] += len(batch) - new_count
+    except Exception as e:
+        await db.rollback()
+        print(f"    ERROR persisting {len(batch)} items: {e}")
+        stats["errors"] += len(batch)
+    buffer.clear()
+
+
+def format_item(index: int, item: RawContent, full_metrics: bool = False) -> str:
+    """
+    Format a fetched item for --verbose output as a single block of text.
+
+    Metrics are summarized as a key count unless full_metrics is set (-vv),
+    since repr() of a large metrics dict dominates the cost of verbose output.
+    """
+    title = item.title if len(item.title) <= 80 else item.title[:80]
+    lines = [
+        f"\n[{index}] {title}",
+        f"    URL: {item.url}",
+        f"    Author: {item.author}",
+        f"    Published: {item.published_at}",
+    ]
+    if item.metrics:
+        if full_metrics:
+            lines.append(f"    Metrics: {item.metrics}")
+        else:
+            lines.append(f"    Metrics: {len(item.metrics)} keys")
+    return "\n".join(lines)
+
+
+def _as_list_factory(
+    factory: Callable[[AppConfig], BaseFetcher | list[BaseFetcher] | None],
+) -> Callable[[AppConfig], list[BaseFetcher]]:
+    """Wrap a fetcher factory so it always returns a list of fetchers."""
+
+    def create(config: AppConfig) -> list[BaseFetcher]:
+        result = factory(config)
+        if result is None:
+            return []
+        if isinstance(result, list):
+            return result
+        return [result]
+
+    return create
+
+
+# FETCHER_FACTORIES normalized once at import to a uniform list-returning signature
+_LIST_FACTORIES = {source: _as_list_factory(f) for source, f in FETCHER_FACTORIES.items()}
+
+# Source names accepted by the fetch command
+SOURCE_NAMES = tuple(FETCHER_FACTORIES)
+
+
 def get_fetchers(source: str, config: AppConfig) -> list[BaseFetcher]:
     """Get fetcher(s) for the specified source."""
-    factory = FETCHER_FACTORIES.get(source)
-    if not factory:
-        raise ValueError(f"Unknown source: {source}")
+    try:
+        create = _LIST_FACTORIES[source]
+    except KeyError:
+        raise ValueError(f"Unknown source: {source}") from None
+    return create(config)
+
+
+@dataclass
+class ItemLimit:
+    """Item budget shared by concurrently running fetchers (0 = unlimited)."""
+
+    limit: int
+    count: int = 0
+    reached: bool = False
 
-    result = factory(config)
-    if result is None:
-        return []
-    if isinstance(result, list):
-        return result
-    return [result]
+    def take(self) -> bool:
+        """Count one fetched item; returns False once the limit has been reached."""
+        if self.reached:
+            return False
+        self.count += 1
+        if self.limit > 0 and self.count >= self.limit:
+            self.reached = True
+        return True
+
+
+async def run_single_fetcher(
+    fetcher: BaseFetcher,
+    item_limit: ItemLimit,
+    dry_run: bool = False,
+    verbose: int = 0,
+) -> dict:
+    """
+    Run one fetcher, persisting its items through its own session.
+
+    Args:
+        fetcher: Fetcher to drain
+        item_limit: Item budget shared with the other fetchers of the run
+        dry_run: If True, don't write to database
+        verbose: 1 to print each item fetched, 2 to also print full metrics
+
+    Returns:
+        Stats dict with counts for this fetcher
+    """
+    stats = {
+        "items": 0,
+        "new_items": 0,
+        "existing_items": 0,
+        "duplicates": 0,
+        "errors": 0,
+    }
+
+    print(f"\nFetcher: {fetcher.source_name}")
+
+    # Each fetcher gets its own session: an AsyncSession must not be shared
+    # between concurrently running tasks
+    session_scope: AbstractAsyncContextManager[AsyncSession | None] = (
+        nullcontext() if dry_run else AsyncSessionLocal()
+    )
+
+    # Keyed by URL (the upsert's conflict key), so an item fetched twice in one
+    # batch is written once, last one wins
+    buffer: dict[str, RawContent] = {}
+    fast_commit = get_settings().ingest_fast_commit
+
+    # Per-item counters live in locals and are written to stats once at the end
+    fetched = 0
+    duplicates = 0
+
+    # The session is closed (and its connection returned to the pool) by
+    # async with even when the task is cancelled
+    async with session_scope as db_session:
+        try:
+            # Prefetch in the background so fetching overlaps DB writes, and
+            # write whenever a batch fills up or its oldest item gets too old
+            batches = batched(fetcher.fetch(), max_items=BATCH_SIZE, max_latency=FLUSH_INTERVAL)
+            async with aclosing(batches):
+                async for batch in batches:
+                    for item in batch:
+                        if not item_limit.take():
+                            break
+                        fetched += 1
+
+                        if verbose:
+                            print(format_item(item_limit.count, item, verbose > 1))
+                        elif fetched % PROGRESS_EVERY == 0:
+                            print(f"  {fetcher.source_name}: {fetched} items...")
+
+                        if db_session:
+                            if item.url in buffer:
+                                duplicates += 1
+                            buffer[item.url] = item
+
+                        if item_limit.reached:
+                            print(f"\nReached limit of {item_limit.limit} items")
+                            break
+
+                    if db_session and buffer:
+                        await flush_buffer(db_session, buffer, stats, fast_commit)
+
+                    if item_limit.reached:
+                        break
+
+        except TRANSIENT_FETCH_ERRORS as e:
+            # Network hiccups are routine for some sources; no traceback needed
+            print(f"WARNING transient error in fetcher {fetcher.source_name}: {e!r}")
+            stats["errors"] += 1
+        except Exception:
+            print(f"ERROR in fetcher {fetcher.source_name}")
+            logger.bind(fetcher=fetcher.source_name).exception("ingest_fetcher_failed")
+            stats["errors"] += 1
+
+        if db_session and buffer:
+            await flush_buffer(db_session, buffer, stats, fast_commit)
+
+    stats["items"] = fetched
+    stats["duplicates"] = duplicates
+    return stats
 
 
 async def run_fetcher(
     source: str,
     dry_run: bool = False,
-    verbose: bool = False,
+    verbose: int = 0,
     limit: int = 0,
 ) -> dict:
     """
-    Run a specific fetcher and optionally persist results.
+    Run a specific source's fetchers concurrently and optionally persist results.
 
     Args:
         source: Name of the source to fetch (nitter, rss, reddit, devto, youtube)
         dry_run: If True, don't write to database
-        verbose: If True, print each item fetched
+        verbose: 1 to print each item fetched, 2 to also print full metrics
         limit: Maximum number of items to fetch (0 = unlimited)
 
     Returns:
@@ -76,81 +292,55 @@ async def run_fetcher(
         "items": 0,
         "new_items": 0,
         "existing_items": 0,
+        "duplicates": 0,
         "errors": 0,
     }
 
     print(f"Running {source} fetcher(s)... (dry_run={dry_run})")
     print("-" * 60)
 
-    db_session = None
-    if not dry_run:
-        db_session = AsyncSessionLocal()
-
-    try:
-        for fetcher in fetchers:
-            print(f"\nFetcher: {fetcher.source_name}")
-
-            try:
-                async for item in fetcher.fetch():
-                    stats["items"] += 1
-
-                    if verbose:
-                        print(f"\n[{stats['items']}] {item.title[:80]}")
-                        print(f"    URL: {item.url}")
-                        print(f"    Author: {item.author}")
-                        print(f"    Published: {item.published_at}")
-                        if item.metrics:
-                            print(f"    Metrics: {item.metrics}")
-
-                    if not dry_run and db_session:
-                        try:
-                            content_item = await upsert_content_item(db_session, item)
-                            await create_metrics_snapshot(
-                                db_session, str(content_item.id), item.metrics
-                            )
-                            # Check if new (created in last minute)
-                            from app.core.datetime_utils import utc_now
-
-                            if (
-                                content_item.fetched_at
-                                and (utc_now() - content_item.fetched_at).seconds < 60
-                            ):
-                                stats["new_items"] += 1
-                            else:
-                                stats["existing_items"] += 1
-                        except Exception as e:
-                            print(f"    ERROR persisting: {e}")
-                            stats["errors"] += 1
-
-                    if limit > 0 and stats["items"] >= limit:
-                        print(f"\nReached limit of {limit} items")
-                        break
-
-            except Exception as e:
-                print(f"ERROR in fetcher {fetcher.source_name}: {e}")
-                import traceback
-
-                traceback.print_exc()
-                stats["errors"] += 1
-
-            if limit > 0 and stats["items"] >= limit:
-                break
-
-        if not dry_run and db_session:
-            await db_session.commit()
-
-    finally:
-        if db_session:
-            await db_session.close()
+    # Overlap the fetchers' network waits; an RSS source alone has one per feed.
+    # The semaphore also bounds how many sessions hold a pooled connection
+    item_limit = ItemLimit(limit=limit)
+    semaphore = asyncio.Semaphore(get_settings().ingest_concurrency)
+
+    async def run_bounded(fetcher: BaseFetcher) -> dict:
+        # Failures are contained here so one fetcher never cancels its siblings
+        try:
+            async with semaphore:
+                return await run_single_fetcher(fetcher, item_limit, dry_run, verbose)
+        except Exception as e:
+            print(f"ERROR in fetcher {fetcher.source_name}: {e}")
+            return {"errors": 1}
+
+    # The task group cancels and awaits every fetcher (closing its session)
+    # if the run itself is cancelled, e.g. on Ctrl-C
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(run_bounded(fetcher)) for fetcher in fetchers]
+
+    for task in tasks:
+        for key, value in task.result().items():
+            stats[key] += value
 
     print("\n" + "-" * 60)
     print(f"Results: {stats['items']} items fetched, {stats['errors']} errors")
     if not dry_run:
-        print(f"  New: {stats['new_items']}, Existing: {stats['existing_items']}")
+        print(
+            f"  New: {stats['new_items']}, Existing: {stats['existing_items']}, "
+            f"Duplicates: {stats['duplicates']}"
+        )
 
     return stats
 
 
+async def run_fetch_command(source: str, dry_run: bool, verbose: int, limit: int) -> dict:
+    """Run the fetch command, then close the engine's pooled connections before exit."""
+    try:
+        return await run_fetcher(source, dry_run, verbose, limit)
+    finally:
+        await engine.dispose()
+
+
 def main() -> None:
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -173,7 +363,7 @@ Examples:
     )
     fetch_parser.add_argument(
         "source",
-        choices=list(FETCHER_FACTORIES.keys()),
+        choices=SOURCE_NAMES,
         help="Source to fetch from",
     )
     fetch_parser.add_argument(
@@ -184,8 +374,9 @@ Examples:
     fetch_parser.add_argument(
         "--verbose",
         "-v",
-        action="store_true",
-        help="Print details for each fetched item",
+        action="count",
+        default=0,
+        help="Print details for each fetched item (-vv to include full metrics)",
     )
     fetch_parser.add_argument(
         "--limit",
@@ -200,7 +391,7 @@ Examples:
     setup_logging()
 
     if args.command == "fetch":
-        asyncio.run(run_fetcher(args.source, args.dry_run, args.verbose, args.limit))
+        run(run_fetch_command(args.source, args.dry_run, args.verbose, args.limit))
     else:
         parser.print_help()
 
@@ -19,29 +19,56 @@ Examples:
 
 import argparse
 import asyncio
+import hashlib
 import shutil
 import tempfile
-from datetime import date, datetime
+from collections.abc import Awaitable
+from datetime import date
+from functools import lru_cache
+from importlib import import_module
 from pathlib import Path
 
-from sqlalchemy import func, select
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_config
 from app.core.database import AsyncSessionLocal
+from app.core.event_loop import run
 from app.core.logging import get_logger, setup_logging
-from app.jobs.utils import determine_topic, get_clusters_for_date, summary_to_distill_output
+from app.jobs.utils import get_clusters_for_date, get_stories_for_date, temp_output_dir
 from app.models.issue import Issue
-from app.podcast.audio_generator import PodcastAudioGenerator
 from app.podcast.rss_feed import generate_podcast_rss, get_default_feed_config
 from app.podcast.script_generator import generate_podcast_script
-from app.podcast.video_generator import generate_podcast_video
 from app.schemas.video import YouTubeMetadata
-from app.services.storage_service import get_storage_service
-from app.video.uploader import YouTubeUploader
 
 logger = get_logger(__name__)
 
+# S3 key of the public podcast RSS feed
+RSS_FEED_KEY = "podcast/feed.xml"
+
+
+@lru_cache(maxsize=1)
+def _find_bg_image() -> Path | None:
+    """Find the custom podcast video background (PNG first, then JPG), once per process."""
+    for ext in ("png", "jpg"):
+        candidate = Path(f"ui/public/podcast-video-bg.{ext}")
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _warm_media_stack(include_video: bool) -> None:
+    """
+    Import the media generators and probe the background image ahead of use.
+
+    Meant to run in a worker thread while the script LLM call is in flight, so
+    the moviepy import and filesystem probe are off the critical path.
+    """
+    import_module("app.podcast.audio_generator")
+    if include_video:
+        import_module("app.podcast.video_generator")
+        _find_bg_image()
+
 
 def create_podcast_youtube_metadata(
     issue_date: date,
@@ -102,12 +129,29 @@ def create_podcast_youtube_metadata(
     )
 
 
-async def get_issue_for_date(db: AsyncSession, issue_date: date) -> Issue | None:
-    """Get Issue record for the given date."""
-    stmt = select(Issue).where(Issue.issue_date == issue_date)
-    result = await db.execute(stmt)
-    issue: Issue | None = result.scalar_one_or_none()
-    return issue
+async def get_issue_for_date(db: AsyncSession, issue_date: date) -> tuple[Issue | None, int]:
+    """
+    Get the Issue record for the given date and its podcast episode number.
+
+    The episode number is derived from a scalar subquery counting earlier issues
+    that have a podcast, so both values come back in one round-trip.
+
+    Returns:
+        (issue or None, episode number for this date)
+    """
+    stmt = lambda_stmt(
+        lambda: select(
+            Issue,
+            select(func.count())
+            .where(Issue.podcast_audio_url.isnot(None), Issue.issue_date < issue_date)
+            .scalar_subquery(),
+        ).where(Issue.issue_date == issue_date)
+    )
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        return None, 1
+    issue, episode_count = row
+    return issue, (episode_count or 0) + 1
 
 
 async def upload_podcast_to_s3(
@@ -115,6 +159,8 @@ async def upload_podcast_to_s3(
     issue_date: date,
 ) -> str | None:
     """Upload podcast audio to S3."""
+    from app.services.storage_service import get_storage_service
+
     storage = get_storage_service()
     if not storage.is_configured():
         logger.warning("s3_not_configured_skipping_podcast_upload")
@@ -139,31 +185,127 @@ async def upload_podcast_to_s3(
     return url
 
 
+async def upload_podcast_video_to_s3(
+    video_path: Path,
+    issue_date: date,
+) -> str | None:
+    """Upload podcast video to S3."""
+    from app.services.storage_service import get_storage_service
+
+    storage = get_storage_service()
+    if not storage.is_configured():
+        return None
+
+    return await storage.upload_file(
+        file_path=video_path,
+        key=f"podcasts/{issue_date.isoformat()}/noyau_daily.mp4",
+        content_type="video/mp4",
+        public=True,
+        metadata={
+            "issue_date": issue_date.isoformat(),
+            "type": "podcast_video",
+        },
+    )
+
+
+async def _upload_or_none(upload: Awaitable[str | None], kind: str) -> str | None:
+    """Await an upload, logging a failure as None so sibling uploads are unaffected."""
+    try:
+        return await upload
+    except Exception as e:
+        logger.bind(kind=kind, error=str(e)).error("podcast_upload_failed")
+        return None
+
+
+async def render_podcast_video(
+    audio_path: Path,
+    video_path: Path,
+    episode_number: int,
+    issue_date: date,
+) -> Path | None:
+    """
+    Render the waveform video for a podcast episode.
+
+    The encode is blocking moviepy/ffmpeg work, so it runs in a worker thread
+    and the event loop stays free for uploads and DB queries meanwhile.
+
+    Returns:
+        Path to the rendered video, or None if rendering failed
+    """
+    from app.podcast.video_generator import generate_podcast_video
+
+    video_result = await asyncio.to_thread(
+        generate_podcast_video,
+        audio_path=audio_path,
+        output_path=video_path,
+        episode_number=episode_number,
+        issue_date=issue_date,
+        background_image_path=_find_bg_image(),
+    )
+    return video_path if video_result else None
+
+
+async def upload_podcast_files(
+    audio_path: Path,
+    issue_date: date,
+    render_video: Awaitable[Path | None] | None = None,
+) -> tuple[str | None, Path | None, str | None]:
+    """
+    Upload podcast audio to S3 while the video renders, then upload the video.
+
+    Args:
+        audio_path: Path to the finished podcast audio
+        issue_date: Date of the episode
+        render_video: Pending video render (see render_podcast_video), or None
+            to upload audio only
+
+    Returns:
+        (audio_url, video_path, video_url), with None for skipped or failed steps
+    """
+    audio_upload = _upload_or_none(upload_podcast_to_s3(audio_path, issue_date), "audio")
+    if render_video is None:
+        return await audio_upload, None, None
+
+    async def render_then_upload() -> tuple[Path | None, str | None]:
+        video_path = await render_video
+        if video_path is None:
+            return None, None
+        video_upload = upload_podcast_video_to_s3(video_path, issue_date)
+        return video_path, await _upload_or_none(video_upload, "video")
+
+    audio_url, (video_path, video_url) = await asyncio.gather(audio_upload, render_then_upload())
+    return audio_url, video_path, video_url
+
+
 async def get_episodes_for_rss(db: AsyncSession, limit: int = 50) -> list[dict]:
     """Get podcast episodes for RSS feed generation."""
-    stmt = (
-        select(Issue)
-        .where(Issue.podcast_audio_url.isnot(None))
-        .order_by(Issue.issue_date.desc())
-        .limit(limit)
-    )
-    result = await db.execute(stmt)
-    issues = list(result.scalars().all())
-
-    episodes = []
-    for i, issue in enumerate(issues):
-        episode_number = len(issues) - i  # Count backwards from total
-        episodes.append(
-            {
-                "issue_date": issue.issue_date,
-                "episode_number": episode_number,
-                "audio_url": issue.podcast_audio_url,
-                "duration_seconds": issue.podcast_duration_seconds or 480,  # Default 8 min
-                "published_at": issue.created_at,
-            }
+    # Select only the columns the feed needs, so no Issue ORM objects are built.
+    # lambda_stmt caches the compiled SQL across runs; limit is tracked as a bound parameter
+    stmt = lambda_stmt(
+        lambda: (
+            select(
+                Issue.issue_date,
+                Issue.podcast_audio_url,
+                Issue.podcast_duration_seconds,
+                Issue.created_at,
+            )
+            .where(Issue.podcast_audio_url.isnot(None))
+            .order_by(Issue.issue_date.desc())
         )
-
-    return episodes
+    )
+    stmt += lambda s: s.limit(limit)
+    rows = (await db.execute(stmt)).all()
+
+    return [
+        {
+            "issue_date": issue_date,
+            "episode_number": len(rows) - i,  # Count backwards from total
+            "audio_url": audio_url,
+            "duration_seconds": duration_seconds or 480,  # Default 8 min
+            "published_at": created_at,
+        }
+        for i, (issue_date, audio_url, duration_seconds, created_at) in enumerate(rows)
+    ]
 
 
 async def generate_podcast_for_issue(
@@ -194,8 +336,6 @@ async def generate_podcast_for_issue(
             return {"success": False, "reason": "disabled"}
         story_count = podcast_cfg.story_count
 
-    output_dir = Path(tempfile.mkdtemp(prefix=f"noyau_podcast_{issue_date}_"))
-
     logger.bind(
         issue_date=str(issue_date),
         story_count=story_count,
@@ -203,7 +343,7 @@ async def generate_podcast_for_issue(
     ).info("podcast_generate_started")
 
     # Check if podcast already exists
-    issue = await get_issue_for_date(db, issue_date)
+    issue, episode_number = await get_issue_for_date(db, issue_date)
     if not issue:
         logger.warning("no_issue_found_for_date")
         return {"success": False, "reason": "no_issue"}
@@ -212,27 +352,21 @@ async def generate_podcast_for_issue(
         logger.info("podcast_already_exists")
         return {"success": True, "audio_url": issue.podcast_audio_url, "already_exists": True}
 
-    # Fetch clusters with summaries
-    clusters = await get_clusters_for_date(db, issue_date)
-    clusters_with_summaries = [c for c in clusters if c.summary]
+    # Fetch top N stories as distill outputs
+    stories = await get_stories_for_date(db, issue_date, limit=story_count)
 
-    if not clusters_with_summaries:
+    if not stories:
         logger.warning("no_summaries_found")
         return {"success": False, "reason": "no_summaries"}
 
-    # Take top N for podcast
-    top_clusters = clusters_with_summaries[:story_count]
-
-    # Convert to distill outputs
-    summaries = []
-    topics = []
-    for cluster in top_clusters:
-        assert cluster.summary is not None  # Filtered above
-        summaries.append(summary_to_distill_output(cluster.summary))
-        topics.append(determine_topic(cluster))
+    summaries = [story.summary for story in stories]
+    topics = [story.topic for story in stories]
 
-    # Step 1: Generate script
-    script_result = await generate_podcast_script(summaries, topics, issue_date)
+    # Step 1: Generate script, loading the media stack while the LLM responds
+    script_result, _ = await asyncio.gather(
+        generate_podcast_script(summaries, topics, issue_date),
+        asyncio.to_thread(_warm_media_stack, not skip_video),
+    )
 
     if not script_result:
         logger.error("podcast_script_generation_failed")
@@ -244,68 +378,39 @@ async def generate_podcast_for_issue(
         tokens=script_result.total_tokens,
     ).info("podcast_script_generated")
 
-    # Step 2: Generate audio
-    generator = PodcastAudioGenerator(
-        voice="nova",
-        model="tts-1-hd",
-        background_volume=0.03,
-    )
-
-    audio_path = output_dir / "noyau_daily.mp3"
-    audio_result = await generator.generate(
-        script=script,
-        output_path=audio_path,
-        include_background_music=True,
-    )
+    # Step 2: Generate audio (module already loaded by _warm_media_stack)
+    from app.podcast.audio_generator import PodcastAudioGenerator
 
-    if not audio_result:
-        logger.error("podcast_audio_generation_failed")
-        return {"success": False, "reason": "audio_failed"}
+    # Intermediate files live in a temp dir that is removed however this step ends
+    async with temp_output_dir(f"noyau_podcast_{issue_date}_") as output_dir:
+        generator = PodcastAudioGenerator(
+            voice="nova",
+            model="tts-1-hd",
+            background_volume=0.03,
+        )
 
-    duration_min = audio_result.duration_seconds / 60
-    logger.bind(duration_min=duration_min).info("podcast_audio_generated")
+        audio_path = output_dir / "noyau_daily.mp3"
+        audio_result = await generator.generate(
+            script=script,
+            output_path=audio_path,
+            include_background_music=True,
+        )
 
-    # Step 3: Upload to S3
-    s3_url = await upload_podcast_to_s3(audio_path, issue_date)
+        if not audio_result:
+            logger.error("podcast_audio_generation_failed")
+            return {"success": False, "reason": "audio_failed"}
 
-    # Step 4: Generate video with waveform (if not skipped)
-    video_s3_url = None
-    if not skip_video:
-        video_path = output_dir / "noyau_daily.mp4"
-
-        bg_path: Path | None = None
-        for ext in ("png", "jpg"):
-            candidate = Path(f"ui/public/podcast-video-bg.{ext}")
-            if candidate.exists():
-                bg_path = candidate
-                break
-
-        count_stmt = select(func.count()).where(Issue.podcast_audio_url.isnot(None))
-        count_result = await db.execute(count_stmt)
-        episode_number = (count_result.scalar() or 0) + 1
-
-        video_result = generate_podcast_video(
-            audio_path=audio_path,
-            output_path=video_path,
-            episode_number=episode_number,
-            issue_date=issue_date,
-            background_image_path=bg_path,
-        )
+        duration_min = audio_result.duration_seconds / 60
+        logger.bind(duration_min=duration_min).info("podcast_audio_generated")
 
-        if video_result:
-            storage = get_storage_service()
-            if storage.is_configured():
-                video_key = f"podcasts/{issue_date.isoformat()}/noyau_daily.mp4"
-                video_s3_url = await storage.upload_file(
-                    file_path=video_path,
-                    key=video_key,
-                    content_type="video/mp4",
-                    public=True,
-                    metadata={
-                        "issue_date": issue_date.isoformat(),
-                        "type": "podcast_video",
-                    },
-                )
+        # Steps 3-4: Render the waveform video (if not skipped) while the audio uploads,
+        # then upload the video
+        render_video = None
+        if not skip_video:
+            render_video = render_podcast_video(
+                audio_path, output_dir / "noyau_daily.mp4", episode_number, issue_date
+            )
+        s3_url, _, video_s3_url = await upload_podcast_files(audio_path, issue_date, render_video)
 
     # Step 5: Update Issue record
     if s3_url:
@@ -314,11 +419,7 @@ async def generate_podcast_for_issue(
         await db.commit()
 
     # Step 6: Regenerate RSS feed
-    await regenerate_rss_feed(db, output_dir)
-
-    # Cleanup
-    if s3_url:
-        shutil.rmtree(output_dir, ignore_errors=True)
+    await regenerate_rss_feed(db)
 
     logger.bind(
         issue_date=str(issue_date),
@@ -334,8 +435,14 @@ async def generate_podcast_for_issue(
     }
 
 
-async def regenerate_rss_feed(db: AsyncSession, output_dir: Path) -> None:
-    """Regenerate the podcast RSS feed."""
+async def regenerate_rss_feed(db: AsyncSession, output_dir: Path | None = None) -> None:
+    """Regenerate the podcast RSS feed.
+
+    The feed is uploaded straight from memory; a local copy is only written
+    when output_dir is given.
+    """
+    from app.services.storage_service import get_storage_service
+
     episodes = await get_episodes_for_rss(db)
 
     if not episodes:
@@ -360,15 +467,21 @@ async def regenerate_rss_feed(db: AsyncSession, output_dir: Path) -> None:
             )
 
     # Generate RSS feed
-    rss_path = output_dir / "feed.xml"
-    generate_podcast_rss(episodes, config, rss_path)
+    rss_path = output_dir / "feed.xml" if output_dir else None
+    xml_output = generate_podcast_rss(episodes, config, rss_path)
 
-    # Upload RSS feed to S3
+    # Upload RSS feed to S3, skipping the PUT when the stored feed is identical
     storage = get_storage_service()
     if storage.is_configured():
-        await storage.upload_file(
-            file_path=rss_path,
-            key="podcast/feed.xml",
+        rss_bytes = xml_output.encode("utf-8")
+        etag = hashlib.md5(rss_bytes, usedforsecurity=False).hexdigest()
+        if await storage.get_etag(RSS_FEED_KEY) == etag:
+            logger.info("rss_feed_unchanged")
+            return
+
+        await storage.upload_bytes(
+            rss_bytes,
+            key=RSS_FEED_KEY,
             content_type="application/rss+xml",
             public=True,
         )
@@ -383,64 +496,54 @@ async def upload_podcast_to_youtube(issue_date: date) -> str | None:
     """
     import httpx
 
+    from app.video.uploader import YouTubeUploader
+
     # Get issue data
     async with AsyncSessionLocal() as db:
-        issue = await get_issue_for_date(db, issue_date)
+        issue, episode_number = await get_issue_for_date(db, issue_date)
         if not issue:
             print(f"No issue found for {issue_date}")
             return None
 
         # Get clusters for headlines
-        clusters = await get_clusters_for_date(db, issue_date)
-
-        # Get episode number
-        count_stmt = select(func.count()).where(
-            Issue.podcast_audio_url.isnot(None),
-            Issue.issue_date < issue_date,
-        )
-        count_result = await db.execute(count_stmt)
-        episode_number = (count_result.scalar() or 0) + 1
+        clusters = await get_clusters_for_date(db, issue_date, limit=5)
 
     # Check if video exists on S3
     video_s3_url = f"https://pub-eff486c4dc394d639d49246799fb48ae.r2.dev/podcasts/{issue_date.isoformat()}/noyau_daily.mp4"
 
     # Download video to temp file
     print("Downloading podcast video from S3...")
-    temp_dir = Path(tempfile.mkdtemp(prefix=f"noyau_podcast_yt_{issue_date}_"))
-    video_path = temp_dir / "noyau_daily.mp4"
-
-    try:
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            response = await client.get(video_s3_url)
-            response.raise_for_status()
-            video_path.write_bytes(response.content)
-            print(f"  Downloaded: {len(response.content) / 1024 / 1024:.1f} MB")
-    except Exception as e:
-        print(f"Failed to download video: {e}")
-        shutil.rmtree(temp_dir, ignore_errors=True)
-        return None
-
-    # Get story headlines (filter for clusters with summaries)
-    story_headlines = [c.summary.headline for c in clusters[:5] if c.summary is not None]
+    async with temp_output_dir(f"noyau_podcast_yt_{issue_date}_") as temp_dir:
+        video_path = temp_dir / "noyau_daily.mp4"
+
+        try:
+            async with httpx.AsyncClient(timeout=300.0) as client:
+                response = await client.get(video_s3_url)
+                response.raise_for_status()
+                video_path.write_bytes(response.content)
+                print(f"  Downloaded: {len(response.content) / 1024 / 1024:.1f} MB")
+        except Exception as e:
+            print(f"Failed to download video: {e}")
+            return None
 
-    # Estimate duration from audio URL if we have it
-    duration_seconds = issue.podcast_duration_seconds or 480
+        # Get story headlines
+        story_headlines = [c.summary.headline for c in clusters if c.summary is not None]
 
-    # Create metadata
-    metadata = create_podcast_youtube_metadata(
-        issue_date=issue_date,
-        episode_number=episode_number,
-        duration_seconds=duration_seconds,
-        story_headlines=story_headlines,
-    )
+        # Estimate duration from audio URL if we have it
+        duration_seconds = issue.podcast_duration_seconds or 480
 
-    # Upload to YouTube
-    print("\nUploading to YouTube...")
-    uploader = YouTubeUploader()
-    result = await uploader.upload_video(video_path, metadata)
+        # Create metadata
+        metadata = create_podcast_youtube_metadata(
+            issue_date=issue_date,
+            episode_number=episode_number,
+            duration_seconds=duration_seconds,
+            story_headlines=story_headlines,
+        )
 
-    # Cleanup
-    shutil.rmtree(temp_dir, ignore_errors=True)
+        # Upload to YouTube
+        print("\nUploading to YouTube...")
+        uploader = YouTubeUploader()
+        result = await uploader.upload_video(video_path, metadata)
 
     if result:
         video_id, _ = result
@@ -496,13 +599,6 @@ async def main(
             return
         story_count = podcast_cfg.story_count
 
-    # Use provided output_dir or create temp directory
-    if output_dir:
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-    else:
-        output_path = Path(tempfile.mkdtemp(prefix=f"noyau_podcast_{issue_date}_"))
-
     logger.bind(
         issue_date=str(issue_date),
         story_count=story_count,
@@ -513,7 +609,7 @@ async def main(
     # Fetch data in a separate session to avoid connection timeout during generation
     # Audio/video generation can take several minutes, causing Neon to close the connection
     async with AsyncSessionLocal() as db:
-        issue = await get_issue_for_date(db, issue_date)
+        issue, episode_number = await get_issue_for_date(db, issue_date)
         if issue and issue.podcast_audio_url and not dry_run:
             print(f"Podcast already exists for {issue_date}: {issue.podcast_audio_url}")
             logger.warning("podcast_already_exists_for_date")
@@ -524,41 +620,32 @@ async def main(
             logger.warning("no_issue_found_for_date")
             return
 
-        # Fetch clusters with summaries
-        clusters = await get_clusters_for_date(db, issue_date)
-
-        # Get episode count now (before closing session)
-        count_stmt = select(func.count()).where(Issue.podcast_audio_url.isnot(None))
-        count_result = await db.execute(count_stmt)
-        episode_number = (count_result.scalar() or 0) + 1
+        # Fetch top N stories as distill outputs
+        stories = await get_stories_for_date(db, issue_date, limit=story_count)
 
-    # Filter clusters with summaries (after closing DB)
-    clusters_with_summaries = [c for c in clusters if c.summary]
-
-    if not clusters_with_summaries:
+    if not stories:
         print(f"No cluster summaries found for {issue_date}")
         logger.warning("no_summaries_found")
         return
 
-    print(f"Found {len(clusters_with_summaries)} clusters with summaries")
-
-    # Take top N for podcast
-    top_clusters = clusters_with_summaries[:story_count]
-    print(f"Generating podcast for top {len(top_clusters)} stories")
+    print(f"Generating podcast for top {len(stories)} stories")
     print("-" * 40)
 
-    # Convert to distill outputs
-    summaries = []
-    topics = []
-    for cluster in top_clusters:
-        assert cluster.summary is not None  # Guaranteed by filter above
-        summaries.append(summary_to_distill_output(cluster.summary))
-        topics.append(determine_topic(cluster))
-        print(f"  - {cluster.summary.headline[:60]}...")
+    summaries = [story.summary for story in stories]
+    topics = [story.topic for story in stories]
+    for summary in summaries:
+        print(f"  - {summary.headline[:60]}...")
 
     # Step 1: Generate script
     print("\nGenerating podcast script...")
-    script_result = await generate_podcast_script(summaries, topics, issue_date)
+    script_job = generate_podcast_script(summaries, topics, issue_date)
+    if dry_run:
+        script_result = await script_job
+    else:
+        # Load the media stack while the LLM responds
+        script_result, _ = await asyncio.gather(
+            script_job, asyncio.to_thread(_warm_media_stack, not skip_video)
+        )
 
     if not script_result:
         print("Script generation failed")
@@ -582,6 +669,18 @@ async def main(
         print(f"\nOutro: {script.outro[:100]}...")
         return
 
+    # Use provided output_dir or create temp directory (not needed for a dry run)
+    if output_dir:
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+    else:
+        output_path = Path(tempfile.mkdtemp(prefix=f"noyau_podcast_{issue_date}_"))
+
+    # Media and upload modules load moviepy, boto3 and the Google client, so
+    # they are only imported once the dry-run path has returned
+    from app.podcast.audio_generator import PodcastAudioGenerator
+    from app.video.uploader import YouTubeUploader
+
     # Step 2: Generate audio
     print("\nGenerating audio...")
     generator = PodcastAudioGenerator(
@@ -607,63 +706,34 @@ async def main(
     print(f"  Path: {audio_result.audio_path}")
     print(f"  Chapters: {len(audio_result.chapters)}")
 
-    # Step 3: Upload to S3
-    print("\nUploading to S3...")
-    s3_url = await upload_podcast_to_s3(audio_path, issue_date)
-
-    if s3_url:
-        print(f"  S3 URL: {s3_url}")
-    else:
-        print("  S3 upload skipped (not configured)")
-
-    # Step 4: Generate video with waveform (if not skipped)
-    video_path = None
-    video_s3_url = None
+    # Steps 3-4: Render the waveform video (if not skipped) while the audio uploads,
+    # then upload the video
+    render_video = None
     if not skip_video:
-        print("\nGenerating video with waveform...")
-        video_path = output_path / "noyau_daily.mp4"
-
-        # Check for custom background image (try PNG first, then JPG)
-        bg_path: Path | None = None
-        for ext in ("png", "jpg"):
-            candidate = Path(f"ui/public/podcast-video-bg.{ext}")
-            if candidate.exists():
-                bg_path = candidate
-                break
-
+        print("\nGenerating video with waveform while uploading audio to S3...")
         # episode_number was fetched earlier before closing DB
-        video_result = generate_podcast_video(
-            audio_path=audio_path,
-            output_path=video_path,
-            episode_number=episode_number,
-            issue_date=issue_date,
-            background_image_path=bg_path,
+        render_video = render_podcast_video(
+            audio_path, output_path / "noyau_daily.mp4", episode_number, issue_date
         )
+    else:
+        print("\nSkipping video generation")
+        print("\nUploading to S3...")
 
-        if video_result:
-            print(f"  Video generated: {video_result.video_path}")
-
-            # Upload video to S3
-            print("  Uploading video to S3...")
-            storage = get_storage_service()
-            if storage.is_configured():
-                video_key = f"podcasts/{issue_date.isoformat()}/noyau_daily.mp4"
-                video_s3_url = await storage.upload_file(
-                    file_path=video_path,
-                    key=video_key,
-                    content_type="video/mp4",
-                    public=True,
-                    metadata={
-                        "issue_date": issue_date.isoformat(),
-                        "type": "podcast_video",
-                    },
-                )
-                if video_s3_url:
-                    print(f"  Video S3 URL: {video_s3_url}")
+    s3_url, video_path, video_s3_url = await upload_podcast_files(
+        audio_path, issue_date, render_video
+    )
+
+    if not skip_video:
+        if video_path:
+            print(f"  Video generated: {video_path}")
         else:
             print("  Video generation failed")
+    if s3_url:
+        print(f"  S3 URL: {s3_url}")
     else:
-        print("\nSkipping video generation")
+        print("  S3 upload skipped (not configured)")
+    if video_s3_url:
+        print(f"  Video S3 URL: {video_s3_url}")
 
     # Step 5: Upload to YouTube (if not skipped)
     youtube_url = None
@@ -715,7 +785,7 @@ async def main(
     # Cleanup
     if s3_url:
         print("\nCleaning up local files...")
-        shutil.rmtree(output_path)
+        await asyncio.to_thread(shutil.rmtree, output_path)
 
     # Summary
     print("\n" + "=" * 40)
@@ -737,7 +807,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate podcast from existing issue data")
     parser.add_argument(
         "--date",
-        type=lambda s: datetime.strptime(s, "%Y-%m-%d").date(),
+        type=date.fromisoformat,
         default=None,
         help="Issue date (YYYY-MM-DD). Default: today",
     )
@@ -769,7 +839,7 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    asyncio.run(
+    run(
         main(
             issue_date=args.date,
             output_dir=args.output_dir,
@@ -4,63 +4,185 @@ Shared utilities for job modules.
 Common functions used by video_generate.py and podcast_generate.py.
 """
 
+import asyncio
+import shutil
+import tempfile
+import uuid
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import date
+from pathlib import Path
+from typing import Any
 
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager
 
-from app.models.cluster import Cluster, ClusterSummary
+from app.models.cluster import Cluster, ClusterSummary, DominantTopic
 from app.schemas.common import Citation
 from app.schemas.llm import ClusterDistillOutput
 
+# Fallback citation for summaries stored without any, as (url, label) pairs
+_DEFAULT_CITATIONS = (("https://noyau.news", "Noyau News"),)
+
+# Validates a whole citation list in one call instead of one model per citation
+_CITATION_LIST_ADAPTER = TypeAdapter(list[Citation])
+
+# Filler used to bring a summary up to the two bullets media generation expects
+_PAD_BULLET = "See full story for details."
+
+# Media topic for each cluster topic; anything else (including None) is "general"
+_TOPIC_MAP: dict[DominantTopic | None, str] = {
+    DominantTopic.SECURITY: "security",
+    DominantTopic.OSS: "oss",
+    DominantTopic.MACRO: "ai",
+    DominantTopic.DEEPDIVE: "ai",
+}
+
+
+@dataclass
+class MediaStory:
+    """A top cluster's summary, ready for podcast or video generation."""
+
+    cluster_id: uuid.UUID
+    topic: str
+    summary: ClusterDistillOutput
 
-def summary_to_distill_output(summary: ClusterSummary) -> ClusterDistillOutput:
-    """Convert a ClusterSummary to ClusterDistillOutput for media generation."""
-    citations = [
-        Citation(url=c.get("url", ""), label=c.get("label", "Source"))
-        for c in (summary.citations_json or [])
-    ]
-    if not citations:
-        citations = [Citation(url="https://noyau.news", label="Noyau News")]
 
-    bullets = summary.bullets_json or []
-    if len(bullets) < 2:
-        bullets = bullets + ["See full story for details."] * (2 - len(bullets))
-    elif len(bullets) > 2:
-        bullets = bullets[:2]
+@asynccontextmanager
+async def temp_output_dir(prefix: str) -> AsyncIterator[Path]:
+    """Create a temporary directory that is always removed, off the event loop, on exit."""
+    path = Path(await asyncio.to_thread(tempfile.mkdtemp, prefix=prefix))
+    try:
+        yield path
+    finally:
+        await asyncio.to_thread(shutil.rmtree, path, ignore_errors=True)
+
+
+def summary_to_distill_output(summary: ClusterSummary | Row[Any]) -> ClusterDistillOutput:
+    """
+    Convert a ClusterSummary to ClusterDistillOutput for media generation.
+
+    Also accepts a result row selecting the same ClusterSummary columns by name.
+    """
+    pairs = [
+        (c.get("url", ""), c.get("label", "Source")) for c in summary.citations_json or []
+    ] or _DEFAULT_CITATIONS
+    citations = _CITATION_LIST_ADAPTER.validate_python(
+        [{"url": url, "label": label} for url, label in pairs]
+    )
 
     return ClusterDistillOutput(
         headline=summary.headline,
         teaser=summary.teaser,
         takeaway=summary.takeaway,
         why_care=summary.why_care,
-        bullets=bullets,
+        bullets=[*(summary.bullets_json or [])[:2], _PAD_BULLET, _PAD_BULLET][:2],
         citations=citations,
         confidence=summary.confidence.value,
     )
 
 
-async def get_clusters_for_date(db: AsyncSession, issue_date: date) -> list[Cluster]:
-    """Query clusters with summaries for the given date."""
+async def get_clusters_for_date(
+    db: AsyncSession,
+    issue_date: date,
+    limit: int | None = None,
+) -> Sequence[Cluster]:
+    """
+    Query the top clusters that have a summary for the given date.
+
+    Clusters without a summary are dropped by the INNER JOIN, and the summary is
+    loaded from the same row, so this is a single round-trip. Only the summary
+    columns media and captions read are loaded; any other summary attribute
+    raises rather than lazy loading on the async session.
+
+    Args:
+        db: Database session
+        issue_date: Issue date to query
+        limit: Maximum number of clusters to return (highest score first)
+
+    Returns:
+        Clusters ordered by score, each with its summary loaded
+    """
     stmt = (
         select(Cluster)
-        .options(selectinload(Cluster.summary))
+        .join(Cluster.summary)
+        .options(
+            contains_eager(Cluster.summary).load_only(
+                ClusterSummary.headline,
+                ClusterSummary.teaser,
+                ClusterSummary.takeaway,
+                ClusterSummary.why_care,
+                ClusterSummary.bullets_json,
+                ClusterSummary.citations_json,
+                ClusterSummary.confidence,
+                raiseload=True,
+            )
+        )
         .where(Cluster.issue_date == issue_date)
         .order_by(Cluster.cluster_score.desc())
     )
+    if limit is not None:
+        stmt = stmt.limit(limit)
     result = await db.execute(stmt)
-    return list(result.scalars().all())
+    return result.scalars().all()
+
+
+async def get_stories_for_date(
+    db: AsyncSession,
+    issue_date: date,
+    limit: int | None = None,
+) -> list[MediaStory]:
+    """
+    Query the top summarized stories for the given date as media inputs.
+
+    Selects only the columns media generation reads, so no Cluster or
+    ClusterSummary objects are built.
+
+    Args:
+        db: Database session
+        issue_date: Issue date to query
+        limit: Maximum number of stories to return (highest score first)
+
+    Returns:
+        Stories ordered by cluster score
+    """
+    stmt = (
+        select(
+            Cluster.id,
+            Cluster.dominant_topic,
+            ClusterSummary.headline,
+            ClusterSummary.teaser,
+            ClusterSummary.takeaway,
+            ClusterSummary.why_care,
+            ClusterSummary.bullets_json,
+            ClusterSummary.citations_json,
+            ClusterSummary.confidence,
+        )
+        .join(ClusterSummary, ClusterSummary.cluster_id == Cluster.id)
+        .where(Cluster.issue_date == issue_date)
+        .order_by(Cluster.cluster_score.desc())
+    )
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    result = await db.execute(stmt)
+    return [
+        MediaStory(
+            cluster_id=row.id,
+            topic=_topic_for(row.dominant_topic),
+            summary=summary_to_distill_output(row),
+        )
+        for row in result
+    ]
+
+
+def _topic_for(dominant_topic: DominantTopic | None) -> str:
+    """Map a cluster's dominant topic to a media topic."""
+    return _TOPIC_MAP.get(dominant_topic, "general")
 
 
 def determine_topic(cluster: Cluster) -> str:
     """Determine media topic from cluster."""
-    if cluster.dominant_topic:
-        topic = cluster.dominant_topic.value
-        if topic in ("security",):
-            return "security"
-        elif topic in ("oss",):
-            return "oss"
-        elif topic in ("macro", "deepdive"):
-            return "ai"
-    return "general"
+    return _topic_for(cluster.dominant_topic)
@@ -15,19 +15,24 @@ Examples:
 
 import argparse
 import asyncio
-import shutil
-import tempfile
-from datetime import date, datetime
+from collections.abc import Awaitable, Sequence
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 import httpx
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.config import get_config
 from app.core.database import AsyncSessionLocal
+from app.core.event_loop import run
+from app.core.http import client_or_new
 from app.core.logging import get_logger, setup_logging
-from app.models.cluster import Cluster, ClusterSummary
+from app.jobs.utils import get_clusters_for_date, temp_output_dir
 from app.models.video import Video, VideoStatus
 from app.services.instagram_service import send_instagram_reels
 from app.services.tiktok_service import send_tiktok_videos
@@ -37,30 +42,97 @@ logger = get_logger(__name__)
 
 AVAILABLE_DESTINATIONS = ["youtube", "tiktok", "instagram"]
 
+# Videos are large: fail fast on connect, allow slow reads
+S3_DOWNLOAD_TIMEOUT = httpx.Timeout(300.0, connect=10.0)
 
-async def download_from_s3(s3_url: str, output_path: Path) -> bool:
-    """Download a file from S3 public URL to local path."""
+# Bytes read from the response and written to disk at a time
+S3_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Simultaneous S3 downloads while dispatching to YouTube
+S3_DOWNLOAD_CONCURRENCY = 4
+
+# Objects larger than this are not videos we generated; skip them before the body
+S3_MAX_VIDEO_BYTES = 512 * 1024 * 1024
+
+
+async def _path_exists(path: Path) -> bool:
+    """Check for a file without blocking the event loop on a slow filesystem."""
+    return await asyncio.to_thread(path.exists)
+
+
+@lru_cache(maxsize=1)
+def _get_uploader() -> YouTubeUploader:
+    """Get the process-wide uploader, so its API client and OAuth token are reused."""
+    return YouTubeUploader()
+
+
+async def download_from_s3(
+    s3_url: str,
+    output_path: Path,
+    client: httpx.AsyncClient | None = None,
+) -> bool:
+    """Download a file from S3 public URL to local path.
+
+    The body is streamed to disk in chunks, so memory stays at one chunk rather
+    than the whole video. Status and size are checked from the response headers
+    before any of the body is read.
+
+    Args:
+        s3_url: Public URL of the object
+        output_path: File to write
+        client: Shared client to reuse across downloads (opens one if omitted)
+    """
     try:
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            response = await client.get(s3_url)
-            response.raise_for_status()
-            output_path.write_bytes(response.content)
+        async with client_or_new(client, timeout=S3_DOWNLOAD_TIMEOUT) as http:
+            async with http.stream("GET", s3_url) as response:
+                response.raise_for_status()
+                size = int(response.headers.get("Content-Length", 0))
+                if size > S3_MAX_VIDEO_BYTES:
+                    logger.bind(s3_url=s3_url, size=size).error("s3_download_too_large")
+                    return False
+                f = await asyncio.to_thread(output_path.open, "wb")
+                try:
+                    async for chunk in response.aiter_bytes(S3_DOWNLOAD_CHUNK_SIZE):
+                        await asyncio.to_thread(f.write, chunk)
+                finally:
+                    await asyncio.to_thread(f.close)
             return True
     except Exception as e:
         logger.bind(s3_url=s3_url, error=str(e)).error("s3_download_failed")
         return False
 
 
-async def get_videos_for_date(db: AsyncSession, issue_date: date) -> list[Video]:
-    """Query videos for the given date."""
-    stmt = select(Video).where(Video.issue_date == issue_date).order_by(Video.rank)
+async def get_videos_for_date(db: AsyncSession, issue_date: date) -> Sequence[Video]:
+    """Query videos for the given date.
+
+    Only the columns dispatch reads are loaded; touching any other attribute
+    raises instead of issuing a lazy load. On a day without videos this is a
+    single indexed lookup returning no rows, so it doubles as the existence check.
+    """
+    stmt = (
+        select(Video)
+        .options(
+            load_only(
+                Video.rank,
+                Video.status,
+                Video.script_json,
+                Video.video_path,
+                Video.s3_url,
+                Video.youtube_video_id,
+                Video.youtube_url,
+                raiseload=True,
+            )
+        )
+        .where(Video.issue_date == issue_date)
+        .order_by(Video.rank)
+    )
     result = await db.execute(stmt)
-    return list(result.scalars().all())
+    return result.scalars().all()
 
 
 async def dispatch_youtube(
     db: AsyncSession,
-    videos: list[Video],
+    videos: Sequence[Video],
     items: list[dict],
 ) -> tuple[bool, str]:
     """Upload videos to YouTube that don't have youtube_video_id yet."""
@@ -74,42 +146,43 @@ async def dispatch_youtube(
             return True, f"All {already_uploaded} videos already uploaded to YouTube"
         return False, "No videos with local files or S3 URLs available for upload"
 
-    uploader = YouTubeUploader()
-
-    uploaded = 0
-    errors = []
-    temp_files: list[Path] = []  # Track temp files for cleanup
+    uploader = _get_uploader()
+    config = get_config()
 
-    for video in videos_to_upload:
-        # Try local file first, then download from S3
-        video_path = Path(video.video_path) if video.video_path else None
-        temp_file = None
+    # Uploads are network-bound and run concurrently; results are collected and
+    # written with one bulk UPDATE once every upload has finished
+    published: list[dict] = []
+    semaphore = asyncio.Semaphore(max(1, config.video.youtube.upload_concurrency))
+    download_semaphore = asyncio.Semaphore(S3_DOWNLOAD_CONCURRENCY)
+
+    # One keep-alive pool for every download, so the TLS handshake is paid once
+    s3_client = httpx.AsyncClient(
+        timeout=S3_DOWNLOAD_TIMEOUT,
+        http2=True,
+        limits=httpx.Limits(max_connections=S3_DOWNLOAD_CONCURRENCY),
+    )
 
-        if video_path and video_path.exists():
-            # Use local file
-            pass
-        elif video.s3_url:
-            # Download from S3 to temp file
-            temp_dir = Path(tempfile.mkdtemp(prefix="noyau_yt_"))
-            temp_file = temp_dir / "video.mp4"
-            logger.bind(s3_url=video.s3_url, rank=video.rank).info("downloading_from_s3")
+    async def _download(rank: int, s3_url: str, temp_file: Path) -> bool:
+        async with download_semaphore:
+            logger.bind(s3_url=s3_url, rank=rank).info("downloading_from_s3")
+            return await download_from_s3(s3_url, temp_file, client=s3_client)
 
-            if not await download_from_s3(video.s3_url, temp_file):
-                errors.append(f"Rank {video.rank}: Failed to download from S3")
-                continue
+    # Filled in once the temp dir exists: each video's file and pending download
+    video_paths: dict[int, Path] = {}
+    download_tasks: dict[int, asyncio.Task[bool]] = {}
 
-            video_path = temp_file
-            temp_files.append(temp_dir)
-        else:
-            errors.append(f"Rank {video.rank}: No local file or S3 URL available")
-            continue
+    async def _upload_one(video: Video) -> str | None:
+        """Upload one video and record its YouTube ID. Returns an error, if any."""
+        if video.rank not in video_paths:
+            return f"Rank {video.rank}: No local file or S3 URL available"
+        if video.rank in download_tasks and not await download_tasks[video.rank]:
+            return f"Rank {video.rank}: Failed to download from S3"
 
         # Get corresponding item for metadata
         if video.rank <= len(items):
             item = items[video.rank - 1]
         else:
-            errors.append(f"Rank {video.rank}: No matching item for metadata")
-            continue
+            return f"Rank {video.rank}: No matching item for metadata"
 
         # Get topic from script_json if available
         topic = "general"
@@ -126,27 +199,62 @@ async def dispatch_youtube(
         )
 
         # Upload
-        result = await uploader.upload_video(video_path, metadata)
-        if result:
-            video_id, video_url = result
-            video.youtube_video_id = video_id
-            video.youtube_url = video_url
-            video.status = VideoStatus.PUBLISHED
-            await db.commit()
-            uploaded += 1
-            logger.bind(
-                rank=video.rank,
-                video_id=video_id,
-            ).info("youtube_video_uploaded")
-        else:
-            errors.append(f"Rank {video.rank}: Upload failed")
+        async with semaphore:
+            result = await uploader.upload_video(video_paths[video.rank], metadata)
+        if not result:
+            return f"Rank {video.rank}: Upload failed"
+
+        video_id, video_url = result
+        published.append(
+            {
+                "id": video.id,
+                "youtube_video_id": video_id,
+                "youtube_url": video_url,
+                "status": VideoStatus.PUBLISHED,
+            }
+        )
+        # Mirror the row on the loaded object without marking it dirty, so the
+        # bulk UPDATE is the only write
+        for key, value in published[-1].items():
+            set_committed_value(video, key, value)
+        logger.bind(
+            rank=video.rank,
+            video_id=video_id,
+        ).info("youtube_video_uploaded")
+        return None
 
-    # Cleanup temp files
-    for temp_dir in temp_files:
-        try:
-            shutil.rmtree(temp_dir)
-        except Exception:
-            pass
+    try:
+        # Downloads share one temp dir, removed as a whole when dispatch ends
+        async with temp_output_dir("noyau_yt_") as temp_root, s3_client:
+            try:
+                # Resolve a file for every video, starting all S3 downloads up front so
+                # they overlap with the uploads of videos that are already on disk
+                for video in videos_to_upload:
+                    # Try local file first, then download from S3
+                    local_path = Path(video.video_path) if video.video_path else None
+                    if local_path is not None and await _path_exists(local_path):
+                        video_paths[video.rank] = local_path
+                    elif video.s3_url:
+                        video_paths[video.rank] = temp_root / f"rank_{video.rank}.mp4"
+                        download_tasks[video.rank] = asyncio.create_task(
+                            _download(video.rank, video.s3_url, video_paths[video.rank])
+                        )
+
+                # Each upload starts as soon as its file is ready
+                outcomes = await asyncio.gather(*[_upload_one(v) for v in videos_to_upload])
+            finally:
+                # If the batch was interrupted, stop downloads that are still writing
+                # before the S3 client closes and the temp dir is removed
+                for task in download_tasks.values():
+                    task.cancel()
+                await asyncio.gather(*download_tasks.values(), return_exceptions=True)
+    finally:
+        # Persist whatever was uploaded, even if the batch was interrupted
+        if published:
+            await db.execute(update(Video), published)
+            await db.commit()
+    errors = [error for error in outcomes if error]
+    uploaded = len(outcomes) - len(errors)
 
     if errors:
         error_msg = "; ".join(errors)
@@ -158,34 +266,23 @@ async def dispatch_youtube(
 
 
 async def get_issue_items(db: AsyncSession, issue_date: date) -> list[dict]:
-    """Query cluster summaries for captions."""
-    clusters_result = await db.execute(
-        select(Cluster)
-        .where(Cluster.issue_date == issue_date)
-        .order_by(Cluster.cluster_score.desc())
-        .limit(10)
-    )
-    clusters = clusters_result.scalars().all()
-
-    items = []
-    for cluster in clusters:
-        summary_result = await db.execute(
-            select(ClusterSummary).where(ClusterSummary.cluster_id == cluster.id)
-        )
-        summary = summary_result.scalar_one_or_none()
-
-        if summary:
-            items.append(
-                {
-                    "headline": summary.headline,
-                    "teaser": summary.teaser,
-                    "takeaway": summary.takeaway,
-                    "bullets": summary.bullets_json,
-                    "citations": summary.citations_json,
-                }
-            )
-
-    return items
+    """Query cluster summaries for captions.
+
+    Summaries come from the same JOIN as their clusters, so this is a single
+    round-trip; items line up with the video ranks from video_generate.
+    """
+    clusters = await get_clusters_for_date(db, issue_date, limit=10)
+    return [
+        {
+            "headline": cluster.summary.headline,
+            "teaser": cluster.summary.teaser,
+            "takeaway": cluster.summary.takeaway,
+            "bullets": cluster.summary.bullets_json,
+            "citations": cluster.summary.citations_json,
+        }
+        for cluster in clusters
+        if cluster.summary
+    ]
 
 
 async def main(
@@ -238,23 +335,20 @@ async def main(
         print("-" * 40)
 
         results: dict[str, tuple[bool, str]] = {}
+        # Destinations hit unrelated APIs, so the enabled ones run concurrently
+        pending: dict[str, Awaitable[Any]] = {}
+
+        # Get video dicts for TikTok/Instagram (need s3_url)
+        videos_for_social = [
+            {"s3_url": v.s3_url, "youtube_url": v.youtube_url} for v in videos if v.s3_url
+        ]
 
         # Dispatch to YouTube
         if "youtube" in destinations:
             if not config.video.enabled:
                 results["youtube"] = (False, "Video is disabled in config")
             else:
-                try:
-                    youtube_result = await dispatch_youtube(db, videos, items)
-                    results["youtube"] = youtube_result
-                except Exception as e:
-                    logger.bind(error=str(e)).error("youtube_dispatch_error")
-                    results["youtube"] = (False, f"Error: {str(e)}")
-
-        # Get video dicts for TikTok/Instagram (need s3_url)
-        videos_for_social = [
-            {"s3_url": v.s3_url, "youtube_url": v.youtube_url} for v in videos if v.s3_url
-        ]
+                pending["youtube"] = dispatch_youtube(db, videos, items)
 
         # Dispatch to TikTok
         if "tiktok" in destinations:
@@ -263,33 +357,43 @@ async def main(
             elif not videos_for_social:
                 results["tiktok"] = (False, "No videos with s3_url available")
             else:
-                try:
-                    tiktok_result = await send_tiktok_videos(issue_date, videos_for_social, items)
-                    results["tiktok"] = (tiktok_result.success, tiktok_result.message)
-                except Exception as e:
-                    logger.bind(error=str(e)).error("tiktok_dispatch_error")
-                    results["tiktok"] = (False, f"Error: {str(e)}")
+                pending["tiktok"] = send_tiktok_videos(
+                    issue_date, videos_for_social, items, concurrency=config.tiktok.max_parallel
+                )
 
         # Dispatch to Instagram
-        instagram_permalinks: list[str] = []
         if "instagram" in destinations:
             if not config.instagram.enabled:
                 results["instagram"] = (False, "Instagram is disabled in config")
             elif not videos_for_social:
                 results["instagram"] = (False, "No videos with s3_url available")
             else:
-                try:
-                    instagram_result = await send_instagram_reels(
-                        issue_date, videos_for_social, items
-                    )
-                    results["instagram"] = (instagram_result.success, instagram_result.message)
+                pending["instagram"] = send_instagram_reels(
+                    issue_date,
+                    videos_for_social,
+                    items,
+                    concurrency=config.instagram.max_parallel,
+                )
+
+        outcomes = await asyncio.gather(*pending.values(), return_exceptions=True)
+
+        instagram_permalinks: list[str] = []
+        for dest, outcome in zip(pending, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.bind(error=str(outcome)).error(f"{dest}_dispatch_error")
+                results[dest] = (False, f"Error: {str(outcome)}")
+            elif dest == "youtube":
+                results[dest] = outcome
+            else:
+                results[dest] = (outcome.success, outcome.message)
+                if dest == "instagram":
                     # Collect permalinks from successful posts
-                    for r in instagram_result.results:
+                    for r in outcome.results:
                         if r.success and r.permalink:
                             instagram_permalinks.append(r.permalink)
-                except Exception as e:
-                    logger.bind(error=str(e)).error("instagram_dispatch_error")
-                    results["instagram"] = (False, f"Error: {str(e)}")
+
+        # Report in the usual destination order
+        results = {d: results[d] for d in AVAILABLE_DESTINATIONS if d in results}
 
         # Print results
         print(f"\nVideo Dispatch Results for {issue_date}")
@@ -318,7 +422,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Dispatch videos to social platforms")
     parser.add_argument(
         "--date",
-        type=lambda s: datetime.strptime(s, "%Y-%m-%d").date(),
+        type=date.fromisoformat,
         default=None,
         help="Issue date (YYYY-MM-DD). Default: today",
     )
@@ -334,4 +438,4 @@ if __name__ == "__main__":
     if args.destinations:
         dest_list = [d.strip() for d in args.destinations.split(",") if d.strip()]
 
-    asyncio.run(main(issue_date=args.date, destinations=dest_list))
+    run(main(issue_date=args.date, destinations=dest_list))
@@ -19,13 +19,16 @@ Examples:
 import argparse
 import asyncio
 import tempfile
-from datetime import date, datetime
+from datetime import date
 from pathlib import Path
 
 from app.core.database import AsyncSessionLocal
+from app.core.event_loop import run
 from app.core.logging import get_logger, setup_logging
 from app.jobs.utils import determine_topic, get_clusters_for_date, summary_to_distill_output
+from app.models.cluster import Cluster
 from app.models.video import Video, VideoStatus
+from app.schemas.video import VideoGenerationResult
 from app.video.orchestrator import (
     generate_combined_video,
     generate_single_video,
@@ -103,28 +106,17 @@ async def main(
     # Fetch clusters in a separate session to avoid connection timeout during encoding
     # Video encoding can take several minutes, causing Neon serverless to close the connection
     async with AsyncSessionLocal() as db:
-        clusters = await get_clusters_for_date(db, issue_date)
+        top_clusters = await get_clusters_for_date(db, issue_date, limit=count)
 
-    if not clusters:
-        print(f"No clusters found for {issue_date}")
-        logger.bind(issue_date=str(issue_date)).warning("no_clusters_found")
-        return
-
-    # Filter to clusters with summaries
-    clusters_with_summaries = [c for c in clusters if c.summary]
-
-    if not clusters_with_summaries:
+    if not top_clusters:
         print(f"No cluster summaries found for {issue_date}")
         logger.bind(issue_date=str(issue_date)).warning("no_summaries_found")
         return
 
-    print(f"Found {len(clusters_with_summaries)} clusters with summaries")
+    print(f"Found {len(top_clusters)} clusters with summaries")
     print(f"Output directory: {output_path}")
     print(f"Mode: {'Combined' if use_combined else 'Individual'}")
 
-    # Take top N for video generation
-    top_clusters = clusters_with_summaries[:count]
-
     # Combined mode: single video with all stories
     if use_combined:
         print(f"Generating combined video for top {len(top_clusters)} stories")
@@ -136,7 +128,7 @@ async def main(
 
         for cluster in top_clusters:
             summary = cluster.summary
-            assert summary is not None  # Filtered above
+            assert summary is not None  # Guaranteed by the join
             print(f"  - {summary.headline[:60]}...")
             summaries.append(summary_to_distill_output(summary))
             topics.append(determine_topic(cluster))
@@ -203,16 +195,9 @@ async def main(
     print(f"Generating videos for top {len(top_clusters)} stories")
     print("-" * 40)
 
-    results = []
-
-    for rank, cluster in enumerate(top_clusters, start=1):
+    async def _generate(rank: int, cluster: Cluster) -> VideoGenerationResult | None:
         summary = cluster.summary
-        assert summary is not None  # Filtered above
-        print(f"\n[{rank}] {summary.headline[:60]}...")
-
-        if dry_run:
-            print("    (dry run - skipping generation)")
-            continue
+        assert summary is not None  # Guaranteed by the join
 
         # Convert to ClusterDistillOutput
         distill_output = summary_to_distill_output(summary)
@@ -221,39 +206,65 @@ async def main(
         topic = determine_topic(cluster)
 
         # Generate video without DB session to avoid connection timeout
-        video_result = await generate_single_video(
-            summary=distill_output,
-            topic=topic,
-            rank=rank,
-            issue_date=issue_date,
+        async with semaphore:
+            video_result = await generate_single_video(
+                summary=distill_output,
+                topic=topic,
+                rank=rank,
+                issue_date=issue_date,
+                cluster_id=str(cluster.id),
+                output_dir=output_path,
+                config=video_config,
+                db=None,  # Don't hold DB connection during encoding
+                dry_run=False,
+            )
+
+        if not video_result:
+            print(f"\n[{rank}] ✗ Generation failed")
+            return None
+
+        lines = [f"\n[{rank}] ✓ Generated: {video_result.video_path}"]
+        if video_result.youtube_url:
+            lines.append(f"    ✓ YouTube: {video_result.youtube_url}")
+        if video_result.s3_url:
+            lines.append(f"    ✓ S3: {video_result.s3_url}")
+
+        # Save Video record with fresh DB session
+        await save_video_record(
             cluster_id=str(cluster.id),
-            output_dir=output_path,
-            config=video_config,
-            db=None,  # Don't hold DB connection during encoding
-            dry_run=False,
+            issue_date=issue_date,
+            rank=rank,
+            script_json=video_result.script.model_dump(),
+            duration_seconds=video_result.duration_seconds,
+            video_path=video_result.video_path,
+            s3_url=video_result.s3_url,
         )
+        lines.append("    ✓ Video record saved to database")
+        print("\n".join(lines))
+        return video_result
 
-        if video_result:
-            results.append(video_result)
-            print(f"    ✓ Generated: {video_result.video_path}")
-            if video_result.youtube_url:
-                print(f"    ✓ YouTube: {video_result.youtube_url}")
-            if video_result.s3_url:
-                print(f"    ✓ S3: {video_result.s3_url}")
+    for rank, cluster in enumerate(top_clusters, start=1):
+        assert cluster.summary is not None  # Guaranteed by the join
+        print(f"[{rank}] {cluster.summary.headline[:60]}...")
 
-            # Save Video record with fresh DB session
-            await save_video_record(
-                cluster_id=str(cluster.id),
-                issue_date=issue_date,
-                rank=rank,
-                script_json=video_result.script.model_dump(),
-                duration_seconds=video_result.duration_seconds,
-                video_path=video_result.video_path,
-                s3_url=video_result.s3_url,
-            )
-            print("    ✓ Video record saved to database")
-        else:
-            print("    ✗ Generation failed")
+    results: list[VideoGenerationResult] = []
+    if dry_run:
+        print("    (dry run - skipping generation)")
+    else:
+        # Encodes are capped at generate_concurrency by the compose process pool.
+        # Admitting twice that many stories pipelines them: while one batch
+        # encodes, the next fetches its script, TTS, footage and music.
+        semaphore = asyncio.Semaphore(2 * max(1, video_config.generate_concurrency))
+        outcomes = await asyncio.gather(
+            *[_generate(rank, cluster) for rank, cluster in enumerate(top_clusters, start=1)],
+            return_exceptions=True,
+        )
+        for rank, outcome in enumerate(outcomes, start=1):
+            if isinstance(outcome, BaseException):
+                logger.bind(rank=rank, error=str(outcome)).error("video_generate_error")
+                print(f"\n[{rank}] ✗ Error: {outcome}")
+            elif outcome:
+                results.append(outcome)
 
     # Summary
     print("\n" + "=" * 40)
@@ -280,7 +291,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate videos from existing issue data")
     parser.add_argument(
         "--date",
-        type=lambda s: datetime.strptime(s, "%Y-%m-%d").date(),
+        type=date.fromisoformat,
         default=None,
         help="Issue date (YYYY-MM-DD). Default: today",
     )
@@ -308,7 +319,7 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    asyncio.run(
+    run(
         main(
             issue_date=args.date,
             count=args.count,
@@ -3,7 +3,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, Response
 from slowapi.errors import RateLimitExceeded
 
 from app.api.router import api_router
@@ -14,6 +14,12 @@ from app.core.scheduler import start_scheduler, stop_scheduler
 
 settings = get_settings()
 
+# Static probe/verification bodies never change, so build the responses once
+_HEALTH_RESPONSE = Response(content=b'{"status":"healthy"}', media_type="application/json")
+_TIKTOK_VERIFICATION_RESPONSE = PlainTextResponse(
+    "tiktok-developers-site-verification=5jv3QAzhtw6g0bwbctXEnI0OoLYipkiu"
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -53,12 +59,12 @@ app.include_router(api_router)
 
 
 @app.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> Response:
     """Health check endpoint for load balancers."""
-    return {"status": "healthy"}
+    return _HEALTH_RESPONSE
 
 
 @app.get("/tiktok5jv3QAzhtw6g0bwbctXEnI0OoLYipkiu.txt")
 async def tiktok_verification() -> PlainTextResponse:
     """TikTok domain verification file."""
-    return PlainTextResponse("tiktok-developers-site-verification=5jv3QAzhtw6g0bwbctXEnI0OoLYipkiu")
+    return _TIKTOK_VERIFICATION_RESPONSE
@@ -4,22 +4,38 @@ This module provides a single source of truth for calculating engagement
 scores from metrics across different content sources.
 """
 
+import operator
+from functools import reduce
 from typing import TYPE_CHECKING, Any
 
+from sqlalchemy import ColumnElement, Float, case, func, literal
+
 if TYPE_CHECKING:
     from app.models.content import ContentItem, MetricsSnapshot
 
 
+# Engagement formula per source as (metric, weight) terms; unlisted sources score 0
+ENGAGEMENT_WEIGHTS: dict[str, tuple[tuple[str, float], ...]] = {
+    "x": (("likes", 1.0), ("retweets", 2.0), ("replies", 1.0)),
+    "reddit": (("upvotes", 1.0), ("comments", 2.0)),
+    "youtube": (("views", 1 / 1000), ("comments", 2.0)),
+    "github": (("stars", 1.0), ("forks", 1.0)),
+    "devto": (("reactions", 1.0), ("comments", 2.0)),
+    "bluesky": (("likes", 1.0), ("reposts", 2.0), ("replies", 1.0)),
+}
+
+
 def calculate_engagement(metrics: dict[str, Any], source: str) -> float:
     """
     Calculate weighted engagement score from metrics.
 
-    Formulas by source:
+    Formulas by source (see ENGAGEMENT_WEIGHTS):
     - X: likes + 2*retweets + replies
     - Reddit: upvotes + 2*comments
     - YouTube: views/1000 + 2*comments
     - GitHub: stars + forks
     - dev.to: reactions + 2*comments
+    - Bluesky: likes + 2*reposts + replies
     - RSS/other: 0.0
 
     Args:
@@ -29,23 +45,35 @@ def calculate_engagement(metrics: dict[str, Any], source: str) -> float:
     Returns:
         Weighted engagement score as float
     """
-    if source == "x":
-        return float(
-            metrics.get("likes", 0) + 2 * metrics.get("retweets", 0) + metrics.get("replies", 0)
-        )
-    elif source == "reddit":
-        return float(metrics.get("upvotes", 0) + 2 * metrics.get("comments", 0))
-    elif source == "youtube":
-        return float(metrics.get("views", 0)) / 1000 + 2 * float(metrics.get("comments", 0))
-    elif source == "github":
-        return float(metrics.get("stars", 0) + metrics.get("forks", 0))
-    elif source == "devto":
-        return float(metrics.get("reactions", 0) + 2 * metrics.get("comments", 0))
-    elif source == "bluesky":
-        return float(
-            metrics.get("likes", 0) + 2 * metrics.get("reposts", 0) + metrics.get("replies", 0)
+    terms = ENGAGEMENT_WEIGHTS.get(source, ())
+    return float(sum(metrics.get(key, 0) * weight for key, weight in terms))
+
+
+def engagement_expr(
+    source_col: ColumnElement[Any],
+    metrics_col: ColumnElement[Any],
+) -> ColumnElement[float]:
+    """
+    Build a SQL expression computing calculate_engagement server-side.
+
+    One CASE branch per source in ENGAGEMENT_WEIGHTS, each summing the weighted
+    JSON metrics (missing metrics count as 0); other sources score 0.
+
+    Args:
+        source_col: Column holding the content source
+        metrics_col: JSON column holding the metrics dict
+
+    Returns:
+        Float SQL expression usable in SELECT or ORDER BY
+    """
+    whens = []
+    for source, terms in ENGAGEMENT_WEIGHTS.items():
+        score = reduce(
+            operator.add,
+            (func.coalesce(metrics_col[key].as_float(), 0.0) * weight for key, weight in terms),
         )
-    return 0.0
+        whens.append((source_col == source, score))
+    return case(*whens, else_=literal(0.0)).cast(Float)
 
 
 def get_item_engagement(item: "ContentItem") -> float:
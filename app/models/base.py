@@ -1,9 +1,13 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func
+from sqlalchemy import JSON, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+# JSONB on Postgres (matching the migrated columns), plain JSON elsewhere (SQLite tests)
+JSONBType = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
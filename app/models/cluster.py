@@ -2,10 +2,10 @@ import enum
 import uuid
 from datetime import date, datetime
 
-from sqlalchemy import JSON, Date, Enum, Float, ForeignKey, Integer, String, Text, Uuid, func
+from sqlalchemy import Date, Enum, Float, ForeignKey, Integer, String, Text, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin
+from app.models.base import Base, JSONBType, TimestampMixin
 
 
 class DominantTopic(str, enum.Enum):
@@ -93,8 +93,8 @@ class ClusterSummary(Base):
     teaser: Mapped[str] = mapped_column(String(500))
     takeaway: Mapped[str] = mapped_column(Text)
     why_care: Mapped[str | None] = mapped_column(Text)
-    bullets_json: Mapped[list] = mapped_column(JSON, default=list)
-    citations_json: Mapped[list] = mapped_column(JSON, default=list)
+    bullets_json: Mapped[list] = mapped_column(JSONBType, default=list)
+    citations_json: Mapped[list] = mapped_column(JSONBType, default=list)
     confidence: Mapped[ConfidenceLevel] = mapped_column(
         Enum(
             ConfidenceLevel,
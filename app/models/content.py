@@ -2,10 +2,10 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, Enum, ForeignKey, String, Text, Uuid, func
+from sqlalchemy import Enum, ForeignKey, String, Text, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import Base, JSONBType
 
 
 class ContentSource(str, enum.Enum):
@@ -65,7 +65,7 @@ class MetricsSnapshot(Base):
         Uuid, ForeignKey("content_items.id", ondelete="CASCADE"), index=True
     )
     captured_at: Mapped[datetime] = mapped_column(default=func.now(), index=True)
-    metrics_json: Mapped[dict] = mapped_column(JSON, default=dict)
+    metrics_json: Mapped[dict] = mapped_column(JSONBType, default=dict)
 
     # Relationships
     item: Mapped["ContentItem"] = relationship(back_populates="metrics_snapshots")
@@ -1,10 +1,10 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, ForeignKey, String, Uuid, func
+from sqlalchemy import ForeignKey, String, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.models.base import Base
+from app.models.base import Base, JSONBType
 
 
 class Event(Base):
@@ -18,7 +18,7 @@ class Event(Base):
     )
     event_name: Mapped[str] = mapped_column(String(100), index=True)
     ts: Mapped[datetime] = mapped_column(default=func.now(), index=True)
-    properties_json: Mapped[dict | None] = mapped_column(JSON, default=dict)
+    properties_json: Mapped[dict | None] = mapped_column(JSONBType, default=dict)
 
     def __repr__(self) -> str:
         return f"<Event {self.event_name} @ {self.ts}>"
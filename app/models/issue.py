@@ -1,6 +1,6 @@
 from datetime import date, datetime
 
-from sqlalchemy import Date, Float, String, func
+from sqlalchemy import Date, Float, Index, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -10,6 +10,15 @@ class Issue(Base):
     """A daily digest issue containing top 10 clusters."""
 
     __tablename__ = "issues"
+    __table_args__ = (
+        # Partial covering index for the podcast RSS feed and episode numbering
+        Index(
+            "ix_issues_podcast_issue_date",
+            "issue_date",
+            postgresql_where=text("podcast_audio_url IS NOT NULL"),
+            postgresql_include=["podcast_audio_url", "podcast_duration_seconds", "created_at"],
+        ),
+    )
 
     issue_date: Mapped[date] = mapped_column(Date, primary_key=True)
     public_url: Mapped[str] = mapped_column(String(255))
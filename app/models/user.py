@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, ForeignKey, String, Uuid, func
+from sqlalchemy import Boolean, ForeignKey, Index, String, Uuid, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin
@@ -17,6 +17,15 @@ class User(Base, TimestampMixin):
     """User account for email subscribers."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Partial covering index for the daily email fan-out over subscribed users
+        Index(
+            "ix_users_subscribed_email",
+            "email",
+            postgresql_where=text("is_subscribed"),
+            postgresql_include=["id"],
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
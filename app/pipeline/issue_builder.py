@@ -4,15 +4,16 @@ from pathlib import Path
 from typing import Any
 
 from openai import AsyncOpenAI
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, selectinload
 
 from app.config import get_config, get_settings
 from app.core.datetime_utils import get_cutoff
 from app.core.logging import get_logger
+from app.metrics.engagement import engagement_expr
 from app.models.cluster import Cluster, ClusterItem, ClusterSummary, ConfidenceLevel
-from app.models.content import ContentItem, ContentSource
+from app.models.content import ContentItem, ContentSource, MetricsSnapshot
 from app.models.issue import Issue
 from app.pipeline.clustering import build_clusters_for_date
 from app.pipeline.distiller import distill_top_clusters
@@ -88,7 +89,8 @@ async def get_missed_from_yesterday(
 
     result = await db.execute(
         select(Cluster)
-        .options(selectinload(Cluster.summary))
+        .join(Cluster.summary)
+        .options(contains_eager(Cluster.summary))
         .where(Cluster.issue_date == yesterday)
         .order_by(Cluster.cluster_score.desc())
         .limit(limit)
@@ -101,55 +103,46 @@ async def build_historical_metrics(
     db: AsyncSession,
     days: int = 7,
 ) -> HistoricalMetrics:
-    """Build historical metrics for percentile calculations."""
+    """
+    Build historical metrics for percentile calculations.
+
+    Engagement is scored in SQL from each item's latest snapshot (capped at
+    1000 items per source), so one query returns plain floats instead of
+    loading every item and snapshot into the session.
+    """
     historical = HistoricalMetrics()
     cutoff = get_cutoff(days=days)
 
-    # Get items with snapshots for each source
-    for source in ContentSource:
-        result = await db.execute(
-            select(ContentItem)
-            .options(selectinload(ContentItem.metrics_snapshots))
-            .where(ContentItem.source == source)
-            .where(ContentItem.fetched_at >= cutoff)
-            .limit(1000)
+    snapshots = (
+        select(
+            ContentItem.source,
+            MetricsSnapshot.metrics_json,
+            func.row_number()
+            .over(partition_by=MetricsSnapshot.item_id, order_by=MetricsSnapshot.captured_at.desc())
+            .label("snapshot_rank"),
+        )
+        .join(MetricsSnapshot, MetricsSnapshot.item_id == ContentItem.id)
+        .where(ContentItem.fetched_at >= cutoff)
+        .subquery()
+    )
+    latest = (
+        select(
+            snapshots.c.source,
+            engagement_expr(snapshots.c.source, snapshots.c.metrics_json).label("engagement"),
+            func.row_number().over(partition_by=snapshots.c.source).label("source_rank"),
         )
-        items = result.scalars().all()
-
-        # Calculate engagement values
-        engagements = []
-        for item in items:
-            if item.metrics_snapshots:
-                latest = item.metrics_snapshots[-1]
-                metrics = latest.metrics_json
-
-                if source == ContentSource.X:
-                    eng = (
-                        metrics.get("likes", 0)
-                        + 2 * metrics.get("retweets", 0)
-                        + metrics.get("replies", 0)
-                    )
-                elif source == ContentSource.REDDIT:
-                    eng = metrics.get("upvotes", 0) + 2 * metrics.get("comments", 0)
-                elif source == ContentSource.YOUTUBE:
-                    eng = metrics.get("views", 0) / 1000 + 2 * metrics.get("comments", 0)
-                elif source == ContentSource.GITHUB:
-                    eng = metrics.get("stars", 0) + metrics.get("forks", 0)
-                elif source == ContentSource.DEVTO:
-                    eng = metrics.get("reactions", 0) + 2 * metrics.get("comments", 0)
-                elif source == ContentSource.BLUESKY:
-                    eng = (
-                        metrics.get("likes", 0)
-                        + 2 * metrics.get("reposts", 0)
-                        + metrics.get("replies", 0)
-                    )
-                else:
-                    eng = 0.0
-
-                engagements.append(eng)
-
-        if engagements:
-            historical.add_distribution(source.value, engagements)
+        .where(snapshots.c.snapshot_rank == 1)
+        .subquery()
+    )
+    result = await db.execute(
+        select(latest.c.source, latest.c.engagement).where(latest.c.source_rank <= 1000)
+    )
+
+    distributions: dict[str, list[float]] = {}
+    for source, engagement in result:
+        distributions.setdefault(source.value, []).append(engagement)
+    for source_value, values in distributions.items():
+        historical.add_distribution(source_value, values)
 
     return historical
 
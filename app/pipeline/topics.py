@@ -10,6 +10,16 @@ from app.models.cluster import DominantTopic
 SECURITY_KEYWORDS = frozenset({"security", "cve", "exploit", "vulnerability"})
 AI_KEYWORDS = frozenset({"openai", "anthropic", "llm", "gpt", "claude"})
 
+# Detected topic string -> stored DominantTopic
+_DOMINANT_TOPIC_MAP = {
+    "sauce": DominantTopic.SAUCE,
+    "security": DominantTopic.SECURITY,
+    "oss": DominantTopic.OSS,
+    "ai": DominantTopic.DEV,  # AI maps to dev for now
+    "dev": DominantTopic.DEV,
+    "general": DominantTopic.DEV,  # Video module uses "general"
+}
+
 
 def detect_topic_from_identity(identity: str, is_viral: bool = False) -> str:
     """
@@ -52,12 +62,4 @@ def topic_to_dominant_topic(topic_str: str) -> DominantTopic:
     Returns:
         Corresponding DominantTopic enum value
     """
-    topic_map = {
-        "sauce": DominantTopic.SAUCE,
-        "security": DominantTopic.SECURITY,
-        "oss": DominantTopic.OSS,
-        "ai": DominantTopic.DEV,  # AI maps to dev for now
-        "dev": DominantTopic.DEV,
-        "general": DominantTopic.DEV,  # Video module uses "general"
-    }
-    return topic_map.get(topic_str, DominantTopic.DEV)
+    return _DOMINANT_TOPIC_MAP.get(topic_str, DominantTopic.DEV)
@@ -1,9 +1,25 @@
-"""Podcast generation package for daily tech digest audio."""
+"""Podcast generation package for daily tech digest audio.
 
-from app.podcast.audio_generator import PodcastAudioGenerator
-from app.podcast.rss_feed import generate_podcast_rss
-from app.podcast.script_generator import generate_podcast_script
-from app.podcast.video_generator import generate_podcast_video
+Exports are resolved on first access: the audio and video generators pull in
+moviepy and the video stack, which script-only callers should not pay for.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.podcast.audio_generator import PodcastAudioGenerator
+    from app.podcast.rss_feed import generate_podcast_rss
+    from app.podcast.script_generator import generate_podcast_script
+    from app.podcast.video_generator import generate_podcast_video
+
+# Public name -> defining module
+_EXPORTS = {
+    "generate_podcast_script": "app.podcast.script_generator",
+    "PodcastAudioGenerator": "app.podcast.audio_generator",
+    "generate_podcast_rss": "app.podcast.rss_feed",
+    "generate_podcast_video": "app.podcast.video_generator",
+}
 
 __all__ = [
     "generate_podcast_script",
@@ -11,3 +27,9 @@ __all__ = [
     "generate_podcast_rss",
     "generate_podcast_video",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name]), name)
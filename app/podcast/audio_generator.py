@@ -1,5 +1,6 @@
 """Audio generation for podcasts using TTS and background music."""
 
+import asyncio
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -7,6 +8,7 @@ from moviepy import AudioFileClip, CompositeAudioClip, concatenate_audioclips
 
 from app.config import get_settings
 from app.core.logging import get_logger
+from app.podcast.tts_cache import cache_key, get_or_synthesize
 from app.schemas.podcast import ChapterMarker, PodcastAudioResult, PodcastScript
 from app.video.background_music import fetch_background_music
 from app.video.tts.openai_tts import OpenAITTS
@@ -21,13 +23,16 @@ PODCAST_OUTRO = (
     "See you tomorrow."
 )
 
+# Constant lines worth caching; everything else is LLM-written and new each run
+_BRANDED_TEXTS = frozenset({PODCAST_INTRO, PODCAST_OUTRO})
+
 
 class PodcastAudioGenerator:
     """
     Generate podcast audio from scripts using OpenAI TTS.
 
     Handles:
-    - Per-section TTS generation for chapter markers
+    - Per-section TTS generation for chapter markers, run concurrently
     - Audio concatenation with pauses
     - Background music mixing
     - MP3 export with metadata
@@ -38,6 +43,7 @@ class PodcastAudioGenerator:
         voice: str = "nova",
         model: str = "tts-1-hd",
         background_volume: float = 0.03,
+        max_parallel: int = 5,
     ):
         """
         Initialize the audio generator.
@@ -46,10 +52,12 @@ class PodcastAudioGenerator:
             voice: OpenAI TTS voice (nova, alloy, echo, fable, onyx, shimmer)
             model: OpenAI TTS model (tts-1 or tts-1-hd)
             background_volume: Volume level for background music (0.0-1.0)
+            max_parallel: Maximum number of TTS requests in flight at once
         """
         settings = get_settings()
         self.tts = OpenAITTS(voice=voice, model=model, api_key=settings.openai_api_key)
         self.background_volume = background_volume
+        self.max_parallel = max_parallel
 
     async def generate(
         self,
@@ -72,64 +80,47 @@ class PodcastAudioGenerator:
 
         with TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
+            # Sections as (chapter title, texts), in playback order; each text is
+            # synthesized as its own clip so the branded lines can come from cache
+            sections: list[tuple[str, list[str]]] = [
+                ("Introduction", [PODCAST_INTRO, script.intro]),
+            ]
+            for story in script.stories:
+                # Combine transition, body, and attribution into one segment;
+                # use the headline for the chapter title, truncated if needed
+                story_text = f"{story.transition} ... {story.body} ... {story.source_attribution}"
+                sections.append((story.headline[:50], [story_text]))
+            sections.append(("Outro", [script.outro, PODCAST_OUTRO]))
+
+            # Synthesize every clip concurrently; wall-clock time is bounded by
+            # the slowest request rather than the sum of all of them
+            texts = [text for _, section_texts in sections for text in section_texts]
+            try:
+                clips = await self._generate_sections(texts, temp_path)
+            finally:
+                # Synthesis is done; release the TTS client's HTTP/2 connections
+                await self.tts.aclose()
+
             audio_segments: list[AudioFileClip] = []
             chapters: list[ChapterMarker] = []
             current_time = 0.0
-
-            # Generate branded intro
-            intro_result = await self._generate_section(
-                f"{PODCAST_INTRO} ... {script.intro}",
-                temp_path / "intro.mp3",
-            )
-            if intro_result:
-                audio_segments.append(intro_result)
-                chapters.append(
-                    ChapterMarker(
-                        title="Introduction",
-                        start_time=current_time,
-                        end_time=current_time + intro_result.duration,
-                    )
-                )
-                current_time += intro_result.duration
-
-            # Generate each story segment
-            for i, story in enumerate(script.stories, start=1):
-                # Combine transition, body, and attribution into one segment
-                story_text = f"{story.transition} ... {story.body} ... {story.source_attribution}"
-                story_result = await self._generate_section(
-                    story_text,
-                    temp_path / f"story_{i}.mp3",
-                )
-                if story_result:
-                    audio_segments.append(story_result)
-                    # Use headline for chapter title, truncate if needed
-                    chapter_title = (
-                        story.headline[:50] if len(story.headline) > 50 else story.headline
-                    )
-                    chapters.append(
-                        ChapterMarker(
-                            title=chapter_title,
-                            start_time=current_time,
-                            end_time=current_time + story_result.duration,
-                        )
-                    )
-                    current_time += story_result.duration
-
-            # Generate branded outro
-            outro_result = await self._generate_section(
-                f"{script.outro} ... {PODCAST_OUTRO}",
-                temp_path / "outro.mp3",
-            )
-            if outro_result:
-                audio_segments.append(outro_result)
+            position = 0
+            for chapter_title, section_texts in sections:
+                end = position + len(section_texts)
+                section_clips = [clip for clip in clips[position:end] if clip is not None]
+                position = end
+                if not section_clips:
+                    continue
+                audio_segments.extend(section_clips)
+                duration = sum(clip.duration for clip in section_clips)
                 chapters.append(
                     ChapterMarker(
-                        title="Outro",
+                        title=chapter_title,
                         start_time=current_time,
-                        end_time=current_time + outro_result.duration,
+                        end_time=current_time + duration,
                     )
                 )
-                current_time += outro_result.duration
+                current_time += duration
 
             if not audio_segments:
                 logger.error("podcast_audio_no_segments_generated")
@@ -179,12 +170,45 @@ class PodcastAudioGenerator:
         text: str,
         output_path: Path,
     ) -> AudioFileClip | None:
-        """Generate TTS for a single section."""
-        result = await self.tts.synthesize(text, output_path)
-        if result:
-            return AudioFileClip(str(result.audio_path))
+        """Generate TTS for a single clip, reusing cached audio for the branded lines."""
+
+        async def synthesize(path: Path) -> Path | None:
+            result = await self.tts.synthesize(text, path)
+            return result.audio_path if result else None
+
+        if text in _BRANDED_TEXTS:
+            audio_path = await get_or_synthesize(
+                cache_key(self.tts.voice, self.tts.model, text),
+                output_path,
+                synthesize,
+            )
+        else:
+            audio_path = await synthesize(output_path)
+        if audio_path:
+            return AudioFileClip(str(audio_path))
         return None
 
+    async def _generate_sections(
+        self,
+        texts: list[str],
+        temp_dir: Path,
+    ) -> list[AudioFileClip | None]:
+        """
+        Generate TTS for several clips concurrently.
+
+        At most max_parallel requests run at once. Results keep the order of
+        texts, with None for clips whose synthesis failed.
+        """
+        semaphore = asyncio.Semaphore(self.max_parallel)
+
+        async def generate_one(index: int, text: str) -> AudioFileClip | None:
+            async with semaphore:
+                return await self._generate_section(text, temp_dir / f"section_{index}.mp3")
+
+        return await asyncio.gather(
+            *[generate_one(index, text) for index, text in enumerate(texts)]
+        )
+
     async def _mix_background_music(
         self,
         narration: AudioFileClip,
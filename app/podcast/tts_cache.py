@@ -0,0 +1,58 @@
+"""Local cache for constant podcast TTS clips.
+
+Only text that never changes between episodes (the branded intro/outro) goes
+through this cache; LLM-written sections differ on every run and would never
+hit. Clips are keyed by a hash of (voice, model, text), so the cache holds at
+most one file per branded line per voice/model pair and stays small.
+"""
+
+import hashlib
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from app.core.files import copy_into_cache
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Local cache directory for synthesized clips
+CACHE_DIR = Path.home() / ".cache" / "noyau" / "tts"
+
+
+def cache_key(voice: str, model: str, text: str) -> str:
+    """Build the cache key for a TTS request."""
+    return hashlib.sha256(f"{voice}|{model}|{text}".encode()).hexdigest()
+
+
+async def get_or_synthesize(
+    key: str,
+    output_path: Path,
+    synthesize: Callable[[Path], Awaitable[Path | None]],
+) -> Path | None:
+    """
+    Return cached audio for key, or synthesize and cache it.
+
+    Args:
+        key: Cache key from cache_key()
+        output_path: Where synthesize should write the audio on a cache miss
+        synthesize: Coroutine function that writes audio to the given path and
+            returns it, or None on failure
+
+    Returns:
+        Path to the audio file (in the cache on a hit), or None if synthesis failed
+    """
+    cached_path = CACHE_DIR / f"{key}.mp3"
+    if cached_path.exists():
+        logger.bind(key=key).debug("tts_cache_hit")
+        return cached_path
+
+    audio_path = await synthesize(output_path)
+    if audio_path is None:
+        return None
+
+    try:
+        copy_into_cache(audio_path, cached_path)
+    except OSError as e:
+        logger.bind(key=key, error=str(e)).warning("tts_cache_store_failed")
+
+    return audio_path
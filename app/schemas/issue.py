@@ -1,3 +1,4 @@
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Literal
 
@@ -6,6 +7,17 @@ from pydantic import BaseModel, Field
 from app.schemas.common import Citation
 
 
+@dataclass(slots=True, frozen=True)
+class IssueItem:
+    """Issue item handed from the daily job to dispatchers."""
+
+    headline: str
+    teaser: str
+    takeaway: str
+    bullets: list[str] = field(default_factory=list)
+    citations: list[dict] = field(default_factory=list)
+
+
 class IssueItemPublic(BaseModel):
     """Public view of an issue item (soft-gated)."""
 
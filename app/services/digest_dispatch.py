@@ -3,9 +3,11 @@
 Handles sending digests to users based on their local delivery time preferences.
 """
 
+import uuid
 from datetime import date
 
 from sqlalchemy import and_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.datetime_utils import (
@@ -68,14 +70,17 @@ async def get_users_ready_for_delivery(
 
         if in_window or window_passed:
             ready_users.append(user)
-            logger.bind(
-                user_id=str(user.id),
-                email=user.email,
-                timezone=user.timezone,
-                delivery_time=user.delivery_time_local,
-                in_window=in_window,
-                window_passed=window_passed,
-            ).debug("user_ready_for_delivery")
+            # Lazy: runs per user, and DEBUG is filtered out in production
+            logger.opt(lazy=True).debug(
+                "user_ready_for_delivery | user_id={} email={} timezone={} delivery_time={} "
+                "in_window={} window_passed={}",
+                lambda: str(user.id),
+                lambda: user.email,
+                lambda: user.timezone,
+                lambda: user.delivery_time_local,
+                lambda: in_window,
+                lambda: window_passed,
+            )
 
     return ready_users
 
@@ -105,6 +110,48 @@ async def record_delivery(
     return delivery
 
 
+async def claim_deliveries(
+    db: AsyncSession,
+    user_ids: list[uuid.UUID],
+    issue_date: date,
+) -> set[uuid.UUID]:
+    """Atomically claim digest deliveries for many users.
+
+    Inserts DigestDelivery rows with ON CONFLICT DO NOTHING, so users who already
+    received this issue (e.g. from an earlier, interrupted run) are not claimed again.
+    The caller commits once the send succeeds, or rolls back to release the claims.
+
+    Args:
+        db: Database session
+        user_ids: Users to claim
+        issue_date: The issue date being delivered
+
+    Returns:
+        IDs of the users newly claimed by this call
+    """
+    if not user_ids:
+        return set()
+
+    delivered_at = utc_now()
+    result = await db.execute(
+        pg_insert(DigestDelivery)
+        .values(
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "user_id": user_id,
+                    "issue_date": issue_date,
+                    "delivered_at": delivered_at,
+                }
+                for user_id in user_ids
+            ]
+        )
+        .on_conflict_do_nothing(constraint="uq_user_issue_date")
+        .returning(DigestDelivery.user_id)
+    )
+    return set(result.scalars().all())
+
+
 async def get_issue_for_date(db: AsyncSession, issue_date: date) -> Issue | None:
     """Fetch the Issue record for a given date.
 
@@ -0,0 +1,46 @@
+"""
+Pre-rendered channel payloads for the daily digest.
+
+The daily job renders each channel's message once and hands the result to the
+dispatchers, so DM fan-outs reuse the same payload for every recipient.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from app.config import get_settings
+from app.services.discord_dm_service import build_dm_embeds
+from app.services.discord_service import build_digest_embeds
+from app.services.slack_service import build_digest_blocks
+from app.services.twitter_service import build_thread_tweets
+
+
+@dataclass
+class DigestPayloads:
+    """Channel payloads rendered once per issue."""
+
+    discord_embeds: list[dict]
+    discord_dm_embeds: list[dict]
+    slack_blocks: list[dict]
+    twitter_thread: list[str]
+
+
+def build_digest_payloads(issue_date: date, items: list[dict[str, Any]]) -> DigestPayloads:
+    """
+    Render every channel payload for the daily digest.
+
+    Args:
+        issue_date: Date of the issue
+        items: List of issue items with summaries
+
+    Returns:
+        DigestPayloads shared by the Discord, Discord DM, Slack and Twitter dispatchers
+    """
+    settings = get_settings()
+    return DigestPayloads(
+        discord_embeds=build_digest_embeds(issue_date, items),
+        discord_dm_embeds=build_dm_embeds(issue_date, items, settings.base_url),
+        slack_blocks=build_digest_blocks(issue_date, items),
+        twitter_thread=build_thread_tweets(issue_date, items),
+    )
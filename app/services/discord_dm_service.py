@@ -14,6 +14,7 @@ from sqlalchemy import select
 from app.config import get_config
 from app.core.database import AsyncSessionLocal
 from app.core.datetime_utils import utc_now
+from app.core.http import client_or_new
 from app.core.logging import get_logger
 from app.models.messaging import MessagingConnection
 
@@ -146,13 +147,20 @@ async def send_dm_message(
         return False
 
 
-async def send_discord_digests(issue_date: date, items: list[dict]) -> DiscordDMResult:
+async def send_discord_digests(
+    issue_date: date,
+    items: list[dict],
+    embeds: list[dict] | None = None,
+    http_client: httpx.AsyncClient | None = None,
+) -> DiscordDMResult:
     """
     Send daily digest DMs to all active Discord subscribers.
 
     Args:
         issue_date: Date of the issue
         items: List of issue items with summaries
+        embeds: Optional pre-rendered embeds from build_dm_embeds
+        http_client: Optional shared HTTP client to reuse
 
     Returns:
         DiscordDMResult with sent/failed counts
@@ -168,13 +176,13 @@ async def send_discord_digests(issue_date: date, items: list[dict]) -> DiscordDM
         logger.warning("discord_bot_token_not_set")
         return DiscordDMResult(sent=0, failed=0, success=False, message="Bot token not set")
 
-    base_url = config.settings.base_url
-    embeds = build_dm_embeds(issue_date, items, base_url)
+    if embeds is None:
+        embeds = build_dm_embeds(issue_date, items, config.settings.base_url)
 
     sent_count = 0
     failed_count = 0
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with client_or_new(http_client) as client:
         async with AsyncSessionLocal() as db:
             # Get all active Discord connections
             result = await db.execute(
@@ -9,6 +9,7 @@ from datetime import date
 import httpx
 
 from app.config import get_config, get_settings
+from app.core.http import client_or_new
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -124,13 +125,20 @@ def build_digest_embeds(issue_date: date, items: list[dict]) -> list[dict]:
     return embeds
 
 
-async def send_discord_digest(issue_date: date, items: list[dict]) -> bool:
+async def send_discord_digest(
+    issue_date: date,
+    items: list[dict],
+    embeds: list[dict] | None = None,
+    http_client: httpx.AsyncClient | None = None,
+) -> bool:
     """
     Send daily digest to Discord via webhook.
 
     Args:
         issue_date: Date of the issue
         items: List of issue items with summaries
+        embeds: Optional pre-rendered embeds from build_digest_embeds
+        http_client: Optional shared HTTP client to reuse
 
     Returns:
         True if successful, False otherwise
@@ -147,11 +155,12 @@ async def send_discord_digest(issue_date: date, items: list[dict]) -> bool:
         logger.warning("discord_webhook_url_not_set")
         return False
 
-    embeds = build_digest_embeds(issue_date, items)
+    if embeds is None:
+        embeds = build_digest_embeds(issue_date, items)
 
     # Discord webhooks allow max 10 embeds per message
     # Send header + first 9 items in first batch, then remaining item(s)
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with client_or_new(http_client) as client:
         try:
             # First batch (header + items 1-9)
             first_batch = embeds[:10]
@@ -2,10 +2,12 @@ from pathlib import Path
 
 import resend
 from jinja2 import Environment, FileSystemLoader
+from markupsafe import escape
 
 from app.config import get_config, get_settings
 from app.core.logging import get_logger
 from app.core.security import build_magic_link_url, generate_unsubscribe_token
+from app.schemas.issue import IssueItem
 
 logger = get_logger(__name__)
 
@@ -13,6 +15,12 @@ logger = get_logger(__name__)
 template_dir = Path(__file__).parent.parent / "emails" / "templates"
 jinja_env = Environment(loader=FileSystemLoader(template_dir), autoescape=True)
 
+# Stand-in for the per-recipient unsubscribe link in pre-rendered digests
+UNSUBSCRIBE_URL_PLACEHOLDER = "__NOYAU_UNSUBSCRIBE_URL__"
+
+# Maximum number of messages Resend accepts in one batch request
+RESEND_BATCH_LIMIT = 100
+
 
 def _init_resend() -> None:
     """Initialize Resend API with API key."""
@@ -181,38 +189,42 @@ async def send_welcome_email(
     logger.bind(email=email).info("welcome_email_sent")
 
 
-async def send_daily_digest(
-    email: str,
+def _build_unsubscribe_url(email: str) -> str:
+    """Build the HMAC-signed unsubscribe URL for a recipient."""
+    settings = get_settings()
+    unsubscribe_token = generate_unsubscribe_token(email)
+    return f"{settings.base_url}/auth/unsubscribe?email={email}&token={unsubscribe_token}"
+
+
+def render_digest_html(
     issue_date: str,
-    items: list[dict],
+    items: list[dict] | list[IssueItem],
     missed_items: list[dict] | None = None,
     podcast_audio_url: str | None = None,
     podcast_duration_seconds: float | None = None,
-) -> None:
+) -> str:
     """
-    Send the daily digest email.
+    Render the daily digest body once for all recipients.
+
+    The per-recipient unsubscribe link is left as a placeholder that
+    send_daily_digest_prerendered fills in before sending.
 
     Args:
-        email: Recipient email address
         issue_date: Date of the issue (YYYY-MM-DD)
         items: List of issue items with summaries
         missed_items: Optional list of items from yesterday for "You may have missed"
         podcast_audio_url: Optional URL to podcast audio file
         podcast_duration_seconds: Optional podcast duration in seconds
+
+    Returns:
+        Rendered HTML with an unsubscribe URL placeholder
     """
-    _init_resend()
     settings = get_settings()
     config = get_config()
 
     issue_url = f"{settings.base_url}/daily/{issue_date}"
     discord_invite_url = config.discord_bot.invite_url if config.discord_bot.enabled else ""
 
-    # Generate unsubscribe URL with HMAC token
-    unsubscribe_token = generate_unsubscribe_token(email)
-    unsubscribe_url = (
-        f"{settings.base_url}/auth/unsubscribe?email={email}&token={unsubscribe_token}"
-    )
-
     # Format podcast duration for display (e.g., "8 min")
     podcast_duration_display = None
     if podcast_duration_seconds:
@@ -222,29 +234,27 @@ async def send_daily_digest(
     # Build podcast page URL
     podcast_page_url = f"{settings.base_url}/podcast" if podcast_audio_url else None
 
-    try:
-        template = jinja_env.get_template("daily_digest.html")
-        html = template.render(
-            issue_date=issue_date,
-            full_items=items[:5],
-            teaser_items=items[5:10],
-            missed_items=missed_items or [],
-            issue_url=issue_url,
-            discord_invite_url=discord_invite_url,
-            unsubscribe_url=unsubscribe_url,
-            podcast_audio_url=podcast_audio_url,
-            podcast_duration_display=podcast_duration_display,
-            podcast_page_url=podcast_page_url,
-        )
-    except Exception as e:
-        logger.bind(error=str(e)).error("template_error")
-        return
+    template = jinja_env.get_template("daily_digest.html")
+    return template.render(
+        issue_date=issue_date,
+        full_items=items[:5],
+        teaser_items=items[5:10],
+        missed_items=missed_items or [],
+        issue_url=issue_url,
+        discord_invite_url=discord_invite_url,
+        unsubscribe_url=UNSUBSCRIBE_URL_PLACEHOLDER,
+        podcast_audio_url=podcast_audio_url,
+        podcast_duration_display=podcast_duration_display,
+        podcast_page_url=podcast_page_url,
+    )
 
-    logger.bind(email=email, issue_date=issue_date).info("sending_daily_digest")
 
-    if not settings.resend_api_key:
-        logger.bind(email=email).warning("resend_api_key_not_set")
-        return
+def _build_digest_params(email: str, issue_date: str, html: str) -> resend.Emails.SendParams:
+    """Build the Resend payload for one recipient of a pre-rendered digest."""
+    settings = get_settings()
+
+    # Match the autoescaping Jinja would have applied to the URL
+    html = html.replace(UNSUBSCRIBE_URL_PLACEHOLDER, str(escape(_build_unsubscribe_url(email))))
 
     # A/B subject lines (simple alternation based on email hash)
     if hash(email) % 2 == 0:
@@ -252,18 +262,108 @@ async def send_daily_digest(
     else:
         subject = "10 things worth knowing today - Noyau"
 
-    resend.Emails.send(
-        {
-            "from": f"NoyauNews <digest@{settings.email_domain}>",
-            "to": [email],
-            "subject": subject,
-            "html": html,
-        }
-    )
+    return {
+        "from": f"NoyauNews <digest@{settings.email_domain}>",
+        "to": [email],
+        "subject": subject,
+        "html": html,
+    }
+
+
+async def send_daily_digest_prerendered(email: str, issue_date: str, html: str) -> None:
+    """
+    Send a daily digest whose body was rendered by render_digest_html.
+
+    Args:
+        email: Recipient email address
+        issue_date: Date of the issue (YYYY-MM-DD)
+        html: Pre-rendered digest HTML containing the unsubscribe placeholder
+    """
+    _init_resend()
+    settings = get_settings()
+
+    logger.bind(email=email, issue_date=issue_date).info("sending_daily_digest")
+
+    if not settings.resend_api_key:
+        logger.bind(email=email).warning("resend_api_key_not_set")
+        return
+
+    resend.Emails.send(_build_digest_params(email, issue_date, html))
 
     logger.bind(email=email, issue_date=issue_date).info("daily_digest_sent")
 
 
+async def send_daily_digest_batch(emails: list[str], issue_date: str, html: str) -> int:
+    """
+    Send a pre-rendered daily digest to many recipients via Resend's batch API.
+
+    Recipients are submitted in chunks of RESEND_BATCH_LIMIT, one HTTP request
+    per chunk. Each message still gets its own unsubscribe link and subject.
+
+    Args:
+        emails: Recipient email addresses
+        issue_date: Date of the issue (YYYY-MM-DD)
+        html: Pre-rendered digest HTML containing the unsubscribe placeholder
+
+    Returns:
+        Number of emails accepted by Resend
+    """
+    _init_resend()
+    settings = get_settings()
+
+    if not settings.resend_api_key:
+        logger.bind(count=len(emails)).warning("resend_api_key_not_set")
+        return 0
+
+    sent_count = 0
+    for start in range(0, len(emails), RESEND_BATCH_LIMIT):
+        chunk = emails[start : start + RESEND_BATCH_LIMIT]
+        try:
+            resend.Batch.send([_build_digest_params(email, issue_date, html) for email in chunk])
+            sent_count += len(chunk)
+        except Exception as e:
+            logger.bind(count=len(chunk), issue_date=issue_date, error=str(e)).error(
+                "daily_digest_batch_failed"
+            )
+
+    logger.bind(count=sent_count, issue_date=issue_date).info("daily_digest_batch_sent")
+    return sent_count
+
+
+async def send_daily_digest(
+    email: str,
+    issue_date: str,
+    items: list[dict],
+    missed_items: list[dict] | None = None,
+    podcast_audio_url: str | None = None,
+    podcast_duration_seconds: float | None = None,
+) -> None:
+    """
+    Send the daily digest email.
+
+    Args:
+        email: Recipient email address
+        issue_date: Date of the issue (YYYY-MM-DD)
+        items: List of issue items with summaries
+        missed_items: Optional list of items from yesterday for "You may have missed"
+        podcast_audio_url: Optional URL to podcast audio file
+        podcast_duration_seconds: Optional podcast duration in seconds
+    """
+    try:
+        html = render_digest_html(
+            issue_date=issue_date,
+            items=items,
+            missed_items=missed_items,
+            podcast_audio_url=podcast_audio_url,
+            podcast_duration_seconds=podcast_duration_seconds,
+        )
+    except Exception as e:
+        logger.bind(error=str(e)).error("template_error")
+        return
+
+    await send_daily_digest_prerendered(email=email, issue_date=issue_date, html=html)
+
+
 async def send_test_emails() -> dict[str, bool | str]:
     """
     Send test emails (magic link + daily digest) to the configured DEV_EMAIL.
@@ -345,6 +345,7 @@ async def send_instagram_reels(
     issue_date: date,
     videos: list[dict[str, Any]],
     items: list[dict[str, Any]],
+    concurrency: int = 1,
 ) -> InstagramUploadResult:
     """
     Post daily digest videos as Instagram Reels.
@@ -353,6 +354,7 @@ async def send_instagram_reels(
         issue_date: Date of the issue
         videos: List of video results with s3_url
         items: List of issue items for captions
+        concurrency: Maximum number of Reels posted at once
 
     Returns:
         InstagramUploadResult with success status
@@ -377,30 +379,26 @@ async def send_instagram_reels(
             message="Instagram credentials not configured",
         )
 
-    results: list[InstagramPostResult] = []
-
     # Post top video(s)
     videos_to_post = videos[: config.instagram.reels_per_day]
+    semaphore = asyncio.Semaphore(max(1, concurrency))
 
-    for i, video in enumerate(videos_to_post):
+    async def _post(i: int, video: dict[str, Any]) -> InstagramPostResult:
         video_url = video.get("s3_url")
 
         if not video_url:
             logger.bind(rank=i + 1).warning("instagram_no_video_url")
-            results.append(
-                InstagramPostResult(
-                    media_id=None,
-                    success=False,
-                    error="No S3 URL for video",
-                )
+            return InstagramPostResult(
+                media_id=None,
+                success=False,
+                error="No S3 URL for video",
             )
-            continue
 
         # Match video to corresponding item for caption
         item = items[i] if i < len(items) else {}
 
-        result = await post_instagram_reel(video_url, item, rank=i + 1)
-        results.append(result)
+        async with semaphore:
+            result = await post_instagram_reel(video_url, item, rank=i + 1)
 
         if result.success:
             logger.bind(
@@ -413,6 +411,10 @@ async def send_instagram_reels(
                 rank=i + 1,
                 error=result.error,
             ).warning("instagram_reel_post_failed")
+        return result
+
+    # Each Reel is an independent container/publish flow, so they can overlap
+    results = await asyncio.gather(*[_post(i, v) for i, v in enumerate(videos_to_post)])
 
     # Count successes
     successful = sum(1 for r in results if r.success)
@@ -7,6 +7,7 @@ Called by the daily job to send digest DMs to all Slack subscribers.
 from dataclasses import dataclass
 from datetime import date
 
+import httpx
 from sqlalchemy import select
 
 from app.config import get_config
@@ -29,13 +30,20 @@ class SlackDispatchResult:
     message: str
 
 
-async def send_slack_digests(issue_date: date, items: list[dict]) -> SlackDispatchResult:
+async def send_slack_digests(
+    issue_date: date,
+    items: list[dict],
+    blocks: list[dict] | None = None,
+    http_client: httpx.AsyncClient | None = None,
+) -> SlackDispatchResult:
     """
     Send daily digest to all Slack subscribers.
 
     Args:
         issue_date: Date of the issue
         items: List of issue items
+        blocks: Optional pre-rendered blocks from build_digest_blocks
+        http_client: Optional shared HTTP client to reuse across all DMs
 
     Returns:
         SlackDispatchResult with counts
@@ -51,7 +59,8 @@ async def send_slack_digests(issue_date: date, items: list[dict]) -> SlackDispat
             message="Slack disabled",
         )
 
-    blocks = build_digest_blocks(issue_date, items)
+    if blocks is None:
+        blocks = build_digest_blocks(issue_date, items)
 
     sent_count = 0
     failed_count = 0
@@ -89,6 +98,7 @@ async def send_slack_digests(issue_date: date, items: list[dict]) -> SlackDispat
                     user_id=connection.platform_user_id,
                     blocks=blocks,
                     text=f"Noyau Daily - {issue_date}",
+                    http_client=http_client,
                 )
 
                 if result.success:
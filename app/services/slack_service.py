@@ -11,6 +11,7 @@ from urllib.parse import urlencode
 import httpx
 
 from app.config import get_config, get_settings
+from app.core.http import client_or_new
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -152,18 +153,23 @@ async def get_user_email(access_token: str, user_id: str) -> str | None:
             return None
 
 
-async def open_dm_channel(access_token: str, user_id: str) -> str | None:
+async def open_dm_channel(
+    access_token: str,
+    user_id: str,
+    http_client: httpx.AsyncClient | None = None,
+) -> str | None:
     """
     Open a DM channel with a user.
 
     Args:
         access_token: Bot access token
         user_id: Slack user ID
+        http_client: Optional shared HTTP client to reuse
 
     Returns:
         Channel ID if successful
     """
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with client_or_new(http_client, timeout=10.0) as client:
         try:
             resp = await client.post(
                 SLACK_CONVERSATIONS_OPEN_URL,
@@ -193,6 +199,7 @@ async def send_dm(
     user_id: str,
     blocks: list[dict],
     text: str = "Daily Digest from Noyau",
+    http_client: httpx.AsyncClient | None = None,
 ) -> SlackSendResult:
     """
     Send a DM to a user using Block Kit.
@@ -202,12 +209,13 @@ async def send_dm(
         user_id: Slack user ID
         blocks: Block Kit blocks
         text: Fallback text for notifications
+        http_client: Optional shared HTTP client to reuse
 
     Returns:
         SlackSendResult
     """
     # First open DM channel
-    channel_id = await open_dm_channel(access_token, user_id)
+    channel_id = await open_dm_channel(access_token, user_id, http_client=http_client)
 
     if not channel_id:
         return SlackSendResult(
@@ -215,7 +223,7 @@ async def send_dm(
             error="Could not open DM channel",
         )
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with client_or_new(http_client) as client:
         try:
             resp = await client.post(
                 SLACK_POST_MESSAGE_URL,
@@ -1,5 +1,6 @@
 """AWS S3 storage service for videos and logs."""
 
+import asyncio
 import gzip
 import mimetypes
 from datetime import datetime
@@ -7,6 +8,7 @@ from pathlib import Path
 from typing import BinaryIO
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 from app.config import get_settings
@@ -14,6 +16,16 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Files above the threshold (e.g. podcast and video MP4s) go up as multipart
+# uploads with parts sent in parallel; small files like MP3s and feed.xml
+# stay a single PUT
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
 
 class S3StorageService:
     """
@@ -133,11 +145,14 @@ class S3StorageService:
         extra_args = self._build_upload_args(content_type, public, metadata)
 
         try:
-            self._client.upload_file(
+            # boto3 is blocking; run it in a thread so concurrent uploads overlap
+            await asyncio.to_thread(
+                self._client.upload_file,
                 str(file_path),
                 self.bucket_name,
                 key,
                 ExtraArgs=extra_args,
+                Config=UPLOAD_TRANSFER_CONFIG,
             )
 
             url = self._build_public_url(key)
@@ -189,6 +204,53 @@ class S3StorageService:
             logger.bind(key=key, error=str(e)).error("s3_upload_fileobj_failed")
             return None
 
+    async def upload_bytes(
+        self,
+        data: bytes,
+        key: str,
+        content_type: str = "application/octet-stream",
+        public: bool = False,
+        metadata: dict[str, str] | None = None,
+    ) -> str | None:
+        """
+        Upload in-memory content to S3 with a single PUT.
+
+        Use this for content that is generated in memory, so it never has to be
+        written to local disk just to be read back for the upload.
+
+        Args:
+            data: Object content
+            key: S3 object key
+            content_type: MIME type
+            public: Whether to make publicly accessible
+            metadata: Optional metadata to attach to the object
+
+        Returns:
+            Public URL if successful, None otherwise
+        """
+        if not self._configured:
+            logger.warning("s3_not_configured_skipping_upload")
+            return None
+
+        extra_args = self._build_upload_args(content_type, public, metadata)
+
+        try:
+            await asyncio.to_thread(
+                self._client.put_object,
+                Bucket=self.bucket_name,
+                Key=key,
+                Body=data,
+                **extra_args,
+            )
+
+            url = self._build_public_url(key)
+            logger.bind(key=key, size=len(data)).info("bytes_uploaded_to_s3")
+            return url
+
+        except ClientError as e:
+            logger.bind(key=key, error=str(e)).error("s3_upload_bytes_failed")
+            return None
+
     async def upload_video(
         self,
         video_path: Path,
@@ -339,7 +401,8 @@ class S3StorageService:
             # Ensure parent directory exists
             destination.parent.mkdir(parents=True, exist_ok=True)
 
-            self._client.download_file(
+            await asyncio.to_thread(
+                self._client.download_file,
                 self.bucket_name,
                 key,
                 str(destination),
@@ -352,6 +415,33 @@ class S3StorageService:
             logger.bind(key=key, error=str(e)).error("s3_download_failed")
             return False
 
+    async def get_etag(self, key: str) -> str | None:
+        """
+        Get the ETag of an S3 object without downloading it.
+
+        For objects uploaded with a single PUT this is the MD5 of the content.
+
+        Args:
+            key: S3 object key
+
+        Returns:
+            ETag without surrounding quotes, or None if missing or on error
+        """
+        if not self._configured:
+            return None
+
+        try:
+            head = await asyncio.to_thread(
+                self._client.head_object, Bucket=self.bucket_name, Key=key
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchKey"):
+                logger.bind(key=key, error=str(e)).warning("s3_head_failed")
+            return None
+
+        etag: str = head["ETag"].strip('"')
+        return etag
+
     async def delete_file(self, key: str) -> bool:
         """
         Delete a file from S3.
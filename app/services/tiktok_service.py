@@ -865,6 +865,7 @@ async def send_tiktok_videos(
     issue_date: date,
     videos: list[dict[str, Any]],
     items: list[dict[str, Any]],
+    concurrency: int = 1,
 ) -> TikTokUploadResult:
     """
     Post daily digest videos to TikTok.
@@ -873,6 +874,7 @@ async def send_tiktok_videos(
         issue_date: Date of the issue
         videos: List of video results with s3_url
         items: List of issue items for captions
+        concurrency: Maximum number of browser uploads running at once
 
     Returns:
         TikTokUploadResult with success status
@@ -905,43 +907,42 @@ async def send_tiktok_videos(
             message=f"TikTok cookies file not found: {config.tiktok.cookies_path}",
         )
 
-    results: list[TikTokPostResult] = []
-
     # Post top videos
     videos_to_post = videos[: config.tiktok.videos_per_day]
+    cookies_path = config.tiktok.cookies_path
+    semaphore = asyncio.Semaphore(max(1, concurrency))
 
-    for i, video in enumerate(videos_to_post):
+    async def _post(i: int, video: dict[str, Any]) -> TikTokPostResult:
         video_url = video.get("s3_url")
 
         if not video_url:
             logger.bind(rank=i + 1).warning("tiktok_no_video_url")
-            results.append(
-                TikTokPostResult(
-                    publish_id=None,
-                    success=False,
-                    error="No S3 URL for video",
-                )
+            return TikTokPostResult(
+                publish_id=None,
+                success=False,
+                error="No S3 URL for video",
             )
-            continue
 
         # Match video to corresponding item for caption
         item = items[i] if i < len(items) else {}
         caption = build_video_caption(item, i + 1, issue_date)
 
         # Upload via browser (Selenium + cookies)
-        result = await _try_browser_upload(
-            video_url=video_url,
-            caption=caption,
-            cookies_path=config.tiktok.cookies_path,
-            headless=config.tiktok.browser_headless,
-        )
+        async with semaphore:
+            result = await _try_browser_upload(
+                video_url=video_url,
+                caption=caption,
+                cookies_path=cookies_path,
+                headless=config.tiktok.browser_headless,
+            )
 
         if result.success:
             logger.bind(rank=i + 1).info("tiktok_video_posted")
         else:
             logger.bind(rank=i + 1, error=result.error).warning("tiktok_upload_failed")
+        return result
 
-        results.append(result)
+    results = await asyncio.gather(*[_post(i, v) for i, v in enumerate(videos_to_post)])
 
     # Count successes
     successful = sum(1 for r in results if r.success)
@@ -18,6 +18,7 @@ from typing import Any
 import httpx
 
 from app.config import get_config
+from app.core.http import client_or_new
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -338,9 +339,29 @@ def build_story_tweet(rank: int, item: dict[str, Any]) -> str:
     return f"{prefix}{content}{url_section}"
 
 
+def build_thread_tweets(issue_date: date, items: list[dict[str, Any]]) -> list[str]:
+    """
+    Build the full thread text: intro, one tweet per story (max 10), outro.
+
+    Args:
+        issue_date: Date of the issue
+        items: List of issue items with summaries
+
+    Returns:
+        Tweet texts in posting order
+    """
+    return [
+        build_intro_tweet(issue_date),
+        *(build_story_tweet(rank, item) for rank, item in enumerate(items[:10], start=1)),
+        build_outro_tweet(),
+    ]
+
+
 async def post_twitter_thread(
     issue_date: date,
     items: list[dict[str, Any]],
+    tweets: list[str] | None = None,
+    http_client: httpx.AsyncClient | None = None,
 ) -> ThreadResult:
     """
     Post a daily digest thread to Twitter.
@@ -351,16 +372,21 @@ async def post_twitter_thread(
     Args:
         issue_date: Date of the issue
         items: List of issue items with summaries
+        tweets: Optional pre-rendered thread from build_thread_tweets
+        http_client: Optional shared HTTP client to reuse
 
     Returns:
         ThreadResult with success status and tweet IDs
     """
+    if tweets is None:
+        tweets = build_thread_tweets(issue_date, items)
+    intro_text, *story_texts, outro_text = tweets
+
     tweet_results: list[TweetResult] = []
     intro_tweet_id: str | None = None
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with client_or_new(http_client) as client:
         # Post intro tweet
-        intro_text = build_intro_tweet(issue_date)
         intro_result = await _post_tweet_with_retry(client, intro_text)
         tweet_results.append(intro_result)
 
@@ -376,8 +402,7 @@ async def post_twitter_thread(
         previous_tweet_id = intro_tweet_id
 
         # Post story tweets as replies
-        for rank, item in enumerate(items[:10], start=1):
-            story_text = build_story_tweet(rank, item)
+        for rank, story_text in enumerate(story_texts, start=1):
             story_result = await _post_tweet_with_retry(
                 client, story_text, reply_to_id=previous_tweet_id
             )
@@ -393,7 +418,6 @@ async def post_twitter_thread(
                 # Continue with next story, using previous successful tweet as parent
 
         # Post outro tweet with CTA
-        outro_text = build_outro_tweet()
         outro_result = await _post_tweet_with_retry(
             client, outro_text, reply_to_id=previous_tweet_id
         )
@@ -429,7 +453,12 @@ async def post_twitter_thread(
         )
 
 
-async def send_twitter_digest(issue_date: date, items: list[dict[str, Any]]) -> bool:
+async def send_twitter_digest(
+    issue_date: date,
+    items: list[dict[str, Any]],
+    tweets: list[str] | None = None,
+    http_client: httpx.AsyncClient | None = None,
+) -> bool:
     """
     Send daily digest to Twitter via thread.
 
@@ -438,6 +467,8 @@ async def send_twitter_digest(issue_date: date, items: list[dict[str, Any]]) ->
     Args:
         issue_date: Date of the issue
         items: List of issue items with summaries
+        tweets: Optional pre-rendered thread from build_thread_tweets
+        http_client: Optional shared HTTP client to reuse
 
     Returns:
         True if successful, False otherwise
@@ -455,7 +486,9 @@ async def send_twitter_digest(issue_date: date, items: list[dict[str, Any]]) ->
         return False
 
     try:
-        result = await post_twitter_thread(issue_date, items)
+        result = await post_twitter_thread(
+            issue_date, items, tweets=tweets, http_client=http_client
+        )
 
         if result.success:
             logger.bind(
@@ -6,12 +6,17 @@ from pathlib import Path
 import httpx
 
 from app.config import get_settings
+from app.core.files import copy_into_cache
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 FREESOUND_API_BASE = "https://freesound.org/apiv2"
 
+# Local cache for downloaded tracks; Freesound track ids are stable, so a track
+# picked again on a later run is reused instead of downloaded
+CACHE_DIR = Path.home() / ".cache" / "noyau" / "music"
+
 
 @dataclass
 class MusicTrack:
@@ -197,10 +202,21 @@ async def fetch_background_music(
         if tracks:
             # Pick the first suitable track
             track = tracks[0]
+            cached_path = CACHE_DIR / f"background_{track.id}.mp3"
+            if cached_path.exists():
+                logger.bind(topic=topic, track_id=track.id).info("background_music_cache_hit")
+                return cached_path
+
             output_path = output_dir / f"background_{track.id}.mp3"
             downloaded = await client.download_track(track, output_path)
 
             if downloaded:
+                try:
+                    copy_into_cache(downloaded, cached_path)
+                except OSError as e:
+                    logger.bind(track_id=track.id, error=str(e)).warning(
+                        "background_music_cache_store_failed"
+                    )
                 logger.bind(
                     topic=topic,
                     query=query,
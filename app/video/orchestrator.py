@@ -1,9 +1,15 @@
 """Video generation orchestrator - coordinates the full pipeline."""
 
+import asyncio
+import multiprocessing
 import shutil
 import tempfile
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -40,7 +46,7 @@ from app.video.uploader import YouTubeUploader, create_video_metadata
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class VideoFormatConfig:
     """Video format settings for composition."""
 
@@ -51,7 +57,7 @@ class VideoFormatConfig:
     max_duration: int = 60
 
 
-@dataclass
+@dataclass(frozen=True)
 class VideoStyleConfig:
     """Visual style settings."""
 
@@ -65,10 +71,10 @@ class VideoStyleConfig:
         if not self.font:
             from app.video.config import get_default_font
 
-            self.font = get_default_font()
+            object.__setattr__(self, "font", get_default_font())
 
 
-@dataclass
+@dataclass(frozen=True)
 class YouTubeConfigLocal:
     """YouTube upload settings."""
 
@@ -79,12 +85,13 @@ class YouTubeConfigLocal:
     default_tags: list[str] = field(default_factory=lambda: ["tech news", "programming", "noyau"])
 
 
-@dataclass
+@dataclass(frozen=True)
 class VideoConfigLocal:
     """Local video configuration for composition."""
 
     enabled: bool = False
     count: int = 3
+    generate_concurrency: int = 2
     combined_mode: bool = False
     combined_duration_target: int = 60
     format: VideoFormatConfig = field(default_factory=VideoFormatConfig)
@@ -92,14 +99,16 @@ class VideoConfigLocal:
     youtube: YouTubeConfigLocal = field(default_factory=YouTubeConfigLocal)
 
 
+@lru_cache
 def get_video_config() -> VideoConfigLocal:
-    """Get video configuration from config.yml."""
+    """Get cached video configuration from config.yml (frozen, safe to share)."""
     config = get_config()
     video_cfg = config.video
 
     return VideoConfigLocal(
         enabled=video_cfg.enabled,
         count=video_cfg.count,
+        generate_concurrency=video_cfg.generate_concurrency,
         combined_mode=video_cfg.combined_mode,
         combined_duration_target=video_cfg.combined_duration_target,
         format=VideoFormatConfig(
@@ -286,7 +295,31 @@ async def _step_fetch_music(
     return background_music_path
 
 
-def _step_compose(
+@lru_cache(maxsize=1)
+def _get_compose_pool() -> ProcessPoolExecutor:
+    """Get the worker processes that run CPU-bound video composition.
+
+    moviepy composites frames in Python, so encodes in threads contend for the
+    GIL; separate processes let concurrent videos use separate cores. Workers are
+    spawned rather than forked, since the parent is already running threads.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max(1, get_video_config().generate_concurrency),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+async def _run_in_compose_pool[T](compose: Callable[[], T]) -> T:
+    """Run a composition callable in the compose pool without blocking the event loop."""
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_get_compose_pool(), compose)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM during encoding); start a fresh pool next time
+        _get_compose_pool.cache_clear()
+        raise
+
+
+async def _step_compose(
     script: VideoScript,
     audio_path: Path,
     clips: list[VideoClip],
@@ -313,7 +346,8 @@ def _step_compose(
         VideoGenerationResult if successful, None otherwise
     """
     log.info("composing_video")
-    result = compose_video(
+    compose = partial(
+        compose_video,
         script=script,
         audio_path=audio_path,
         clips=clips,
@@ -322,6 +356,7 @@ def _step_compose(
         subtitles=subtitles,
         background_music_path=background_music_path,
     )
+    result = await _run_in_compose_pool(compose)
 
     if not result:
         log.warning("video_composition_failed")
@@ -641,7 +676,7 @@ async def generate_single_video(
 
         # Step 4: Compose video
         video_path = video_dir / f"noyau_{rank}.mp4"
-        result = _step_compose(
+        result = await _step_compose(
             script=script,
             audio_path=tts_result.audio_path,
             clips=clips,
@@ -694,7 +729,7 @@ async def generate_single_video(
             # Cleanup entire video directory after successful YouTube upload
             if youtube_result:
                 log.info("cleaning_up_video_files")
-                shutil.rmtree(video_dir)
+                await asyncio.to_thread(shutil.rmtree, video_dir)
         else:
             # Mark as ready for dispatch (S3 upload complete)
             await _update_video_status(db, video_record, VideoStatus.PUBLISHED)
@@ -702,7 +737,7 @@ async def generate_single_video(
         # Cleanup temporary clips
         clips_dir = video_dir / "clips"
         if clips_dir.exists():
-            shutil.rmtree(clips_dir)
+            await asyncio.to_thread(shutil.rmtree, clips_dir)
 
         return result
 
@@ -923,7 +958,8 @@ async def generate_combined_video(
         # Step 5: Compose combined video
         log.info("composing_combined_video")
         video_path = video_dir / "noyau_digest.mp4"
-        result = compose_combined_video(
+        compose = partial(
+            compose_combined_video,
             script=script,
             audio_path=audio_path,
             clips=clips,
@@ -932,6 +968,7 @@ async def generate_combined_video(
             subtitles=tts_result.subtitles,
             background_music_path=background_music_path,
         )
+        result = await _run_in_compose_pool(compose)
 
         if not result:
             log.warning("combined_video_composition_failed")
@@ -953,11 +990,11 @@ async def generate_combined_video(
             # Cleanup entire video directory after successful YouTube upload
             if youtube_result:
                 log.info("cleaning_up_combined_video_files")
-                shutil.rmtree(video_dir)
+                await asyncio.to_thread(shutil.rmtree, video_dir)
 
         # Cleanup temporary clips
         if clips_dir.exists():
-            shutil.rmtree(clips_dir)
+            await asyncio.to_thread(shutil.rmtree, clips_dir)
 
         return result
 
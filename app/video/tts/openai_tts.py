@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from app.config import get_settings
 from app.core.logging import get_logger
@@ -38,6 +38,27 @@ class OpenAITTS(TTSProvider):
         self.api_key = api_key or settings.openai_api_key
         self.voice = voice
         self.model = model
+        self._client: AsyncOpenAI | None = None
+
+    def _get_client(self) -> AsyncOpenAI:
+        """
+        Get the OpenAI client, creating it on first use.
+
+        The client is reused for every synthesis request, so concurrent sections
+        share one HTTP/2 keep-alive pool instead of each paying a TLS handshake.
+        """
+        if self._client is None:
+            self._client = AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=DefaultAsyncHttpxClient(http2=True),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared OpenAI client and its connections, if one was created."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
 
     async def synthesize(self, text: str, output_path: Path) -> TTSResult | None:
         """Synthesize speech using OpenAI TTS."""
@@ -48,8 +69,7 @@ class OpenAITTS(TTSProvider):
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            client = AsyncOpenAI(api_key=self.api_key)
-            response = await client.audio.speech.create(
+            response = await self._get_client().audio.speech.create(
                 model=self.model,
                 voice=self.voice,
                 input=text,
@@ -1,10 +1,14 @@
 """YouTube upload functionality using YouTube Data API v3."""
 
+import asyncio
+import threading
 import traceback
 from pathlib import Path
 from typing import Protocol
 
+import httplib2
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
@@ -22,13 +26,18 @@ SCOPES = ["https://www.googleapis.com/auth/youtube.upload"]
 
 
 class YouTubeConfigProtocol(Protocol):
-    """Protocol for YouTube configuration."""
+    """Protocol for YouTube configuration (read-only, so frozen configs satisfy it)."""
 
-    category_id: str
-    privacy_status: str
-    made_for_kids: bool
-    default_language: str
-    default_tags: list[str]
+    @property
+    def category_id(self) -> str: ...
+    @property
+    def privacy_status(self) -> str: ...
+    @property
+    def made_for_kids(self) -> bool: ...
+    @property
+    def default_language(self) -> str: ...
+    @property
+    def default_tags(self) -> list[str]: ...
 
 
 class YouTubeUploader:
@@ -57,6 +66,8 @@ class YouTubeUploader:
             config = YouTubeConfig()
         self.config = config
         self._service = None
+        self._credentials: Credentials | None = None
+        self._thread_local = threading.local()
 
     def _is_configured(self) -> bool:
         """Check if YouTube credentials are configured."""
@@ -85,6 +96,7 @@ class YouTubeUploader:
                 YOUTUBE_API_VERSION,
                 credentials=credentials,
             )
+            self._credentials = credentials
 
             return self._service
 
@@ -114,7 +126,7 @@ class YouTubeUploader:
         if not service:
             return None
 
-        if not video_path.exists():
+        if not await asyncio.to_thread(video_path.exists):
             logger.bind(path=str(video_path)).error("video_file_not_found")
             return None
 
@@ -135,28 +147,9 @@ class YouTubeUploader:
                 },
             }
 
-            # Prepare media upload
-            media = MediaFileUpload(
-                str(video_path),
-                mimetype="video/mp4",
-                resumable=True,
-                chunksize=1024 * 1024,  # 1MB chunks
-            )
-
-            # Insert video
-            request = service.videos().insert(
-                part="snippet,status",
-                body=body,
-                media_body=media,
-            )
-
-            # Execute upload with progress logging
-            response = None
-            while response is None:
-                status, response = request.next_chunk()
-                if status:
-                    progress = int(status.progress() * 100)
-                    logger.bind(progress=progress).debug("youtube_upload_progress")
+            # Chunked uploads block on the network for minutes, so run them in a
+            # thread to let several uploads proceed at once
+            response = await asyncio.to_thread(self._upload_blocking, service, body, video_path)
 
             video_id = response["id"]
             video_url = f"https://youtube.com/shorts/{video_id}"
@@ -178,6 +171,43 @@ class YouTubeUploader:
             logger.error(f"youtube_upload_error: {type(e).__name__}: {e}\n{traceback.format_exc()}")
             return None
 
+    def _get_thread_http(self) -> AuthorizedHttp:
+        """Get this worker thread's authorized connection.
+
+        httplib2 connections are not thread-safe, so each thread gets its own; it
+        is kept alive and reused by later uploads that run on the same thread.
+        """
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+
+    def _upload_blocking(self, service, body: dict, video_path: Path) -> dict:
+        """Run a resumable upload to completion and return the inserted video resource."""
+        media = MediaFileUpload(
+            str(video_path),
+            mimetype="video/mp4",
+            resumable=True,
+            chunksize=1024 * 1024,  # 1MB chunks
+        )
+        request = service.videos().insert(
+            part="snippet,status",
+            body=body,
+            media_body=media,
+        )
+
+        http = self._get_thread_http()
+
+        # Execute upload with progress logging
+        response: dict | None = None
+        while response is None:
+            status, response = request.next_chunk(http=http)
+            if status:
+                progress = int(status.progress() * 100)
+                logger.bind(progress=progress).debug("youtube_upload_progress")
+        return response
+
     async def set_thumbnail(
         self,
         video_id: str,
@@ -16,3 +16,12 @@ class TestHealthCheck:
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
+
+    async def test_health_check_repeated(self, client: AsyncClient):
+        """The shared response should be identical across requests."""
+        first = await client.get("/health")
+        second = await client.get("/health")
+
+        assert second.status_code == 200
+        assert second.headers["content-type"] == "application/json"
+        assert second.content == first.content == b'{"status":"healthy"}'
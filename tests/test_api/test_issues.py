@@ -36,6 +36,21 @@ class TestGetIssue:
             assert "takeaway" in item
             assert "bullets" in item
 
+    async def test_get_issue_skips_unsummarized_clusters(
+        self, client: AsyncClient, issue_factory, cluster_factory, db_session
+    ):
+        """Unsummarized clusters should not use up slots in the item limit."""
+        issue_date = date(2026, 1, 14)
+        await issue_factory(issue_date=issue_date, num_clusters=10)
+        await cluster_factory(issue_date=issue_date, score=100.0, with_summary=False)
+
+        response = await client.get(f"/api/issues/{issue_date}")
+
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert len(items) == 10
+        assert [item["rank"] for item in items] == list(range(1, 11))
+
     async def test_get_issue_full_view_unauthenticated(
         self, client: AsyncClient, issue_factory, db_session
     ):
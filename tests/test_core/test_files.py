@@ -0,0 +1,30 @@
+"""Tests for filesystem helpers."""
+
+from app.core.files import copy_into_cache
+
+
+class TestCopyIntoCache:
+    """Tests for copy_into_cache."""
+
+    def test_copies_into_new_cache_dir(self, tmp_path):
+        """Should create the cache dir and leave no temp file behind."""
+        source = tmp_path / "clip.mp3"
+        source.write_bytes(b"audio")
+        cached = tmp_path / "cache" / "nested" / "abc.mp3"
+
+        copy_into_cache(source, cached)
+
+        assert cached.read_bytes() == b"audio"
+        assert source.exists()
+        assert [p.name for p in cached.parent.iterdir()] == ["abc.mp3"]
+
+    def test_replaces_existing_entry(self, tmp_path):
+        """Should overwrite a stale cached file."""
+        source = tmp_path / "clip.mp3"
+        source.write_bytes(b"new")
+        cached = tmp_path / "abc.mp3"
+        cached.write_bytes(b"old")
+
+        copy_into_cache(source, cached)
+
+        assert cached.read_bytes() == b"new"
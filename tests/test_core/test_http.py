@@ -0,0 +1,17 @@
+"""Tests for shared HTTP client helpers."""
+
+import httpx
+import pytest
+
+from app.core.http import create_dispatch_client
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestCreateDispatchClient:
+    """Tests for create_dispatch_client."""
+
+    async def test_builds_http2_client(self):
+        """Should build with HTTP/2 enabled, which needs the h2 extra installed."""
+        async with create_dispatch_client() as client:
+            assert isinstance(client, httpx.AsyncClient)
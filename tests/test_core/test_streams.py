@@ -0,0 +1,55 @@
+"""Tests for async iterator utilities in streams."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
+import pytest
+
+from app.core.streams import batched
+
+
+async def _count(n: int, fail_at: int | None = None) -> AsyncIterator[int]:
+    for i in range(n):
+        if i == fail_at:
+            raise RuntimeError("source failed")
+        await asyncio.sleep(0)
+        yield i
+
+
+class TestBatched:
+    """Tests for batched."""
+
+    async def test_splits_by_count(self):
+        """Should yield full batches of max_items and a final partial batch."""
+        batches = [b async for b in batched(_count(25), max_items=10, max_latency=60)]
+        assert batches == [list(range(10)), list(range(10, 20)), list(range(20, 25))]
+
+    async def test_flushes_slow_source_by_latency(self):
+        """Should yield a partial batch once max_latency has elapsed."""
+
+        async def slow() -> AsyncIterator[int]:
+            yield 1
+            await asyncio.sleep(0.2)
+            yield 2
+
+        batches = [b async for b in batched(slow(), max_items=10, max_latency=0.05)]
+        assert batches == [[1], [2]]
+
+    async def test_yields_pending_items_before_error(self):
+        """Should yield items received before a failure, then raise it."""
+        seen = []
+        with pytest.raises(RuntimeError, match="source failed"):
+            async for batch in batched(_count(10, fail_at=3), max_items=10, max_latency=60):
+                seen.append(batch)
+        assert seen == [[0, 1, 2]]
+
+    async def test_early_exit_cancels_producer(self):
+        """Should cancel the producer task when the consumer stops early."""
+        tasks_before = len(asyncio.all_tasks())
+        async with aclosing(batched(_count(1000), max_items=2, max_latency=60)) as batches:
+            async for batch in batches:
+                if batch[0] >= 4:
+                    break
+        await asyncio.sleep(0)
+        assert len(asyncio.all_tasks()) == tasks_before
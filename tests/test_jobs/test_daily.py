@@ -0,0 +1,108 @@
+"""Tests for the daily job."""
+
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.jobs import daily
+from app.jobs.daily import send_digest_emails
+
+ISSUE_DATE = date(2026, 1, 15)
+
+
+@pytest.fixture
+def settings():
+    """Settings with email sending enabled."""
+    return MagicMock(resend_api_key="re_test")
+
+
+class TestSendDigestEmails:
+    """Tests for send_digest_emails."""
+
+    async def test_template_error_skips_sending(self, settings):
+        """Should log and return 0 without opening the subscriber cursor."""
+        db = MagicMock(stream=AsyncMock())
+        with (
+            patch.object(daily, "_fetch_missed_items", AsyncMock(return_value=[])),
+            patch.object(daily, "render_digest_html", side_effect=ValueError("bad template")),
+        ):
+            assert await send_digest_emails(db, ISSUE_DATE, [], settings=settings) == 0
+
+        db.stream.assert_not_awaited()
+
+    async def test_closes_cursor_when_a_batch_fails(self, settings):
+        """Should close the server-side cursor if sending a batch raises."""
+        subscribers = MagicMock(close=AsyncMock())
+
+        async def partitions(size):
+            yield [MagicMock(id=1, email="a@example.com")]
+
+        subscribers.partitions = partitions
+        db = MagicMock(stream=AsyncMock(return_value=subscribers))
+        claim_session = MagicMock(__aenter__=AsyncMock(), __aexit__=AsyncMock(return_value=None))
+        with (
+            patch.object(daily, "_fetch_missed_items", AsyncMock(return_value=[])),
+            patch.object(daily, "render_digest_html", return_value="<html>"),
+            patch.object(daily, "AsyncSessionLocal", return_value=claim_session),
+            patch.object(daily, "claim_deliveries", AsyncMock(side_effect=RuntimeError("db down"))),
+            pytest.raises(RuntimeError, match="db down"),
+        ):
+            await send_digest_emails(db, ISSUE_DATE, [], settings=settings)
+
+        subscribers.close.assert_awaited_once()
+
+    async def test_uses_prefetched_missed_items(self, settings):
+        """Should render with the caller's missed items instead of querying again."""
+        missed = [{"headline": "Missed", "teaser": "Yesterday"}]
+        db = MagicMock(stream=AsyncMock())
+        with (
+            patch.object(daily, "_fetch_missed_items", AsyncMock()) as fetch_missed,
+            patch.object(daily, "render_digest_html", side_effect=ValueError("stop")) as render,
+        ):
+            await send_digest_emails(db, ISSUE_DATE, [], missed, settings=settings)
+
+        fetch_missed.assert_not_awaited()
+        assert render.call_args.kwargs["missed_items"] is missed
+
+
+class TestMainMediaGeneration:
+    """Tests for the media generation step of main()."""
+
+    async def test_video_and_podcast_generate_concurrently(self):
+        """Should run the podcast while video generation is still in progress."""
+        podcast_started = asyncio.Event()
+
+        async def generate_videos(**kwargs):
+            # Only completes if the podcast branch gets to run in the meantime
+            await asyncio.wait_for(podcast_started.wait(), timeout=1)
+            return []
+
+        async def generate_podcast(**kwargs):
+            podcast_started.set()
+            return {"success": True}
+
+        no_issue = MagicMock(scalar_one_or_none=MagicMock(return_value=None))
+        session = MagicMock(commit=AsyncMock(), execute=AsyncMock(return_value=no_issue))
+        session_cm = MagicMock(
+            __aenter__=AsyncMock(return_value=session), __aexit__=AsyncMock(return_value=None)
+        )
+        with (
+            patch.object(daily, "setup_logging"),
+            patch.object(daily, "AsyncSessionLocal", return_value=session_cm),
+            patch.object(daily, "build_daily_issue", AsyncMock(return_value={})),
+            patch.object(daily, "get_issue_items", AsyncMock(return_value=[])),
+            patch.object(daily, "build_digest_payloads", return_value={}),
+            patch.object(daily, "ENABLED_CHANNELS", frozenset({"video", "podcast"})),
+            patch.object(daily, "DISPATCHERS", {}),
+            patch.object(
+                daily, "create_dispatch_client", return_value=MagicMock(aclose=AsyncMock())
+            ),
+            patch.object(daily, "generate_videos_for_issue", side_effect=generate_videos),
+            patch.object(daily, "generate_podcast_for_issue", side_effect=generate_podcast),
+            patch.object(daily, "_notify_dispatch_error", AsyncMock()) as notify,
+        ):
+            await daily.main(skip_email=True)
+
+        notify.assert_not_awaited()
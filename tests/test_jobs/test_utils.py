@@ -0,0 +1,126 @@
+"""Tests for shared job utilities."""
+
+from datetime import date
+
+from app.jobs.utils import (
+    determine_topic,
+    get_clusters_for_date,
+    get_stories_for_date,
+    summary_to_distill_output,
+)
+from app.models.cluster import Cluster, ClusterSummary, ConfidenceLevel, DominantTopic
+
+ISSUE_DATE = date(2026, 1, 15)
+
+
+def make_summary(**overrides) -> ClusterSummary:
+    """Build an unsaved ClusterSummary with sensible defaults."""
+    fields = {
+        "headline": "Test Headline",
+        "teaser": "Test teaser for the cluster.",
+        "takeaway": "Key takeaway for engineers.",
+        "why_care": "Why this matters to you.",
+        "bullets_json": ["First bullet point", "Second bullet point"],
+        "citations_json": [{"url": "https://example.com", "label": "Source"}],
+        "confidence": ConfidenceLevel.HIGH,
+    }
+    fields.update(overrides)
+    return ClusterSummary(**fields)
+
+
+class TestSummaryToDistillOutput:
+    """Tests for summary_to_distill_output."""
+
+    def test_pads_bullets_and_defaults_citations(self):
+        """Should pad to two bullets and fall back to the default citation."""
+        output = summary_to_distill_output(
+            make_summary(bullets_json=["Only bullet"], citations_json=[])
+        )
+
+        assert output.bullets == ["Only bullet", "See full story for details."]
+        assert [c.url for c in output.citations] == ["https://noyau.news"]
+
+    def test_returns_independent_models(self):
+        """Should build a fresh model per call so callers can modify their copy."""
+        first = summary_to_distill_output(make_summary())
+        first.bullets.append("Extra")
+
+        assert summary_to_distill_output(make_summary()).bullets == [
+            "First bullet point",
+            "Second bullet point",
+        ]
+
+
+class TestDetermineTopic:
+    """Tests for determine_topic."""
+
+    def test_maps_cluster_topics_to_media_topics(self):
+        """Should map known topics and fall back to general."""
+        expected = {
+            DominantTopic.SECURITY: "security",
+            DominantTopic.OSS: "oss",
+            DominantTopic.MACRO: "ai",
+            DominantTopic.DEEPDIVE: "ai",
+            DominantTopic.DEV: "general",
+            DominantTopic.SAUCE: "general",
+            None: "general",
+        }
+        for topic, media_topic in expected.items():
+            assert determine_topic(Cluster(dominant_topic=topic)) == media_topic
+
+
+class TestGetClustersForDate:
+    """Tests for get_clusters_for_date."""
+
+    async def test_returns_only_summarized_clusters_by_score(self, db_session, cluster_factory):
+        """Should skip clusters without a summary and order by score."""
+        low = await cluster_factory(issue_date=ISSUE_DATE, score=1.0)
+        high = await cluster_factory(issue_date=ISSUE_DATE, score=5.0)
+        await cluster_factory(issue_date=ISSUE_DATE, score=9.0, with_summary=False)
+        await cluster_factory(issue_date=date(2026, 1, 14), score=7.0)
+
+        clusters = await get_clusters_for_date(db_session, ISSUE_DATE)
+
+        assert [c.id for c in clusters] == [high.id, low.id]
+        assert all(c.summary is not None for c in clusters)
+
+    async def test_limit(self, db_session, cluster_factory):
+        """Should return at most limit clusters, highest score first."""
+        for score in (1.0, 3.0, 2.0):
+            await cluster_factory(issue_date=ISSUE_DATE, score=score)
+
+        clusters = await get_clusters_for_date(db_session, ISSUE_DATE, limit=2)
+
+        assert [c.cluster_score for c in clusters] == [3.0, 2.0]
+
+    async def test_summary_is_fully_loaded_for_media(self, db_session, cluster_factory):
+        """Should load every field media conversion reads, without lazy loads."""
+        await cluster_factory(issue_date=ISSUE_DATE)
+        await db_session.commit()
+        db_session.expunge_all()
+
+        [cluster] = await get_clusters_for_date(db_session, ISSUE_DATE)
+
+        output = summary_to_distill_output(cluster.summary)
+        assert output.headline == "Test Headline"
+        assert "total_tokens" not in cluster.summary.__dict__
+
+
+class TestGetStoriesForDate:
+    """Tests for get_stories_for_date."""
+
+    async def test_builds_media_stories(self, db_session, cluster_factory):
+        """Should convert summary columns into distill outputs with a topic."""
+        cluster = await cluster_factory(issue_date=ISSUE_DATE)
+        await cluster_factory(issue_date=ISSUE_DATE, score=0.5, with_summary=False)
+
+        stories = await get_stories_for_date(db_session, ISSUE_DATE, limit=5)
+
+        assert len(stories) == 1
+        story = stories[0]
+        assert story.cluster_id == cluster.id
+        assert story.topic == "general"
+        assert story.summary.headline == "Test Headline"
+        assert story.summary.bullets == ["First bullet point", "Second bullet point"]
+        assert story.summary.citations[0].url == "https://example.com"
+        assert story.summary.confidence == "high"
@@ -0,0 +1,223 @@
+"""Tests for the video dispatch job."""
+
+import asyncio
+from datetime import date
+from unittest.mock import patch
+
+import httpx
+import pytest
+from sqlalchemy import select
+
+from app.jobs.video_dispatch import (
+    dispatch_youtube,
+    download_from_s3,
+    get_issue_items,
+    get_videos_for_date,
+)
+from app.models.video import Video, VideoStatus
+
+ISSUE_DATE = date(2026, 1, 15)
+
+
+class TestGetIssueItems:
+    """Tests for get_issue_items."""
+
+    async def test_returns_summaries_by_score(self, db_session, cluster_factory):
+        """Should build caption items from summarized clusters, highest score first."""
+        await cluster_factory(issue_date=ISSUE_DATE, score=1.0)
+        await cluster_factory(issue_date=ISSUE_DATE, score=9.0, with_summary=False)
+        await cluster_factory(issue_date=ISSUE_DATE, score=5.0)
+        await cluster_factory(issue_date=date(2026, 1, 14), score=7.0)
+
+        items = await get_issue_items(db_session, ISSUE_DATE)
+
+        assert len(items) == 2
+        assert items[0]["headline"] == "Test Headline"
+        assert set(items[0]) == {"headline", "teaser", "takeaway", "bullets", "citations"}
+
+
+class TestDownloadFromS3:
+    """Tests for download_from_s3."""
+
+    async def test_streams_body_to_file(self, tmp_path):
+        """Should write the full body through the injected client."""
+        body = b"x" * (3 * 1024 * 1024 + 7)
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+        output = tmp_path / "video.mp4"
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            ok = await download_from_s3("https://bucket/video.mp4", output, client=client)
+
+        assert ok
+        assert output.read_bytes() == body
+
+    async def test_returns_false_on_http_error(self, tmp_path):
+        """Should report failure instead of raising on a non-2xx response."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(404))
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            ok = await download_from_s3(
+                "https://bucket/missing.mp4", tmp_path / "video.mp4", client=client
+            )
+
+        assert not ok
+
+    async def test_skips_oversized_object(self, tmp_path):
+        """Should refuse a body larger than the video size limit without writing it."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, headers={"Content-Length": str(2**40)})
+        )
+        output = tmp_path / "video.mp4"
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            ok = await download_from_s3("https://bucket/huge.mp4", output, client=client)
+
+        assert not ok
+        assert not output.exists()
+
+
+class TestGetVideosForDate:
+    """Tests for get_videos_for_date."""
+
+    async def test_loads_dispatch_columns_by_rank(self, db_session):
+        """Should return the date's videos by rank with dispatch columns loaded."""
+        for rank in (2, 1):
+            db_session.add(
+                Video(
+                    cluster_id=f"cluster-{rank}",
+                    issue_date=ISSUE_DATE,
+                    rank=rank,
+                    s3_url=f"https://bucket/{rank}.mp4",
+                    error_message="unused",
+                )
+            )
+        db_session.add(Video(cluster_id="other", issue_date=date(2026, 1, 14), rank=1))
+        await db_session.commit()
+        db_session.expunge_all()
+
+        videos = await get_videos_for_date(db_session, ISSUE_DATE)
+
+        assert [v.rank for v in videos] == [1, 2]
+        assert [v.s3_url for v in videos] == ["https://bucket/1.mp4", "https://bucket/2.mp4"]
+        assert "error_message" not in videos[0].__dict__
+
+        videos[0].status = VideoStatus.PUBLISHED
+        await db_session.commit()
+
+
+class FakeUploader:
+    """Records how many uploads run at the same time."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def upload_video(self, video_path, metadata):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return f"yt-{metadata.title[:8]}", "https://youtube.com/shorts/x"
+
+
+class TestDispatchYoutube:
+    """Tests for dispatch_youtube."""
+
+    async def test_uploads_concurrently_and_records_ids(self, db_session, tmp_path):
+        """Should overlap uploads and mark every video as published."""
+        videos = []
+        for rank in (1, 2, 3):
+            path = tmp_path / f"video_{rank}.mp4"
+            path.write_bytes(b"mp4")
+            video = Video(
+                cluster_id=f"cluster-{rank}",
+                issue_date=ISSUE_DATE,
+                rank=rank,
+                video_path=str(path),
+            )
+            db_session.add(video)
+            videos.append(video)
+        await db_session.flush()
+        items = [
+            {"headline": f"Headline {rank}", "teaser": "Teaser", "citations": []}
+            for rank in (1, 2, 3)
+        ]
+        uploader = FakeUploader()
+
+        with patch("app.jobs.video_dispatch._get_uploader", return_value=uploader):
+            success, message = await dispatch_youtube(db_session, videos, items)
+
+        assert success
+        assert message == "Uploaded 3 videos to YouTube"
+        assert uploader.peak > 1
+        assert all(v.status == VideoStatus.PUBLISHED for v in videos)
+        assert all(v.youtube_video_id for v in videos)
+
+        stored = await db_session.execute(
+            select(Video.status, Video.youtube_video_id).where(Video.issue_date == ISSUE_DATE)
+        )
+        assert {status for status, _ in stored} == {VideoStatus.PUBLISHED}
+
+    async def test_reports_failed_s3_download(self, db_session, tmp_path):
+        """Should skip the upload and report videos whose S3 download failed."""
+        video = Video(
+            cluster_id="cluster-1",
+            issue_date=ISSUE_DATE,
+            rank=1,
+            s3_url="https://bucket.s3.amazonaws.com/video.mp4",
+        )
+        db_session.add(video)
+        await db_session.flush()
+        items = [{"headline": "Headline", "teaser": "Teaser", "citations": []}]
+        uploader = FakeUploader()
+
+        with (
+            patch("app.jobs.video_dispatch._get_uploader", return_value=uploader),
+            patch("app.jobs.video_dispatch.download_from_s3", return_value=False),
+        ):
+            success, message = await dispatch_youtube(db_session, [video], items)
+
+        assert not success
+        assert message == "Upload failed: Rank 1: Failed to download from S3"
+        assert uploader.peak == 0
+
+    async def test_cancels_pending_downloads_when_upload_raises(self, db_session, tmp_path):
+        """Should stop in-flight S3 downloads before cleaning up if an upload raises."""
+        path = tmp_path / "video_1.mp4"
+        path.write_bytes(b"mp4")
+        local = Video(cluster_id="cluster-1", issue_date=ISSUE_DATE, rank=1, video_path=str(path))
+        remote = Video(
+            cluster_id="cluster-2",
+            issue_date=ISSUE_DATE,
+            rank=2,
+            s3_url="https://bucket.s3.amazonaws.com/video.mp4",
+        )
+        db_session.add_all([local, remote])
+        await db_session.flush()
+        items = [{"headline": f"Headline {r}", "teaser": "Teaser", "citations": []} for r in (1, 2)]
+        download_started = asyncio.Event()
+        download_cancelled = False
+
+        async def slow_download(s3_url, output_path, client=None):
+            nonlocal download_cancelled
+            download_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                download_cancelled = True
+                raise
+            return True
+
+        class FailingUploader:
+            async def upload_video(self, video_path, metadata):
+                await download_started.wait()
+                raise RuntimeError("quota exceeded")
+
+        with (
+            patch("app.jobs.video_dispatch._get_uploader", return_value=FailingUploader()),
+            patch("app.jobs.video_dispatch.download_from_s3", side_effect=slow_download),
+            pytest.raises(RuntimeError, match="quota exceeded"),
+        ):
+            await dispatch_youtube(db_session, [local, remote], items)
+
+        assert download_cancelled
@@ -0,0 +1,58 @@
+"""Tests for engagement calculation."""
+
+import pytest
+from sqlalchemy import select
+
+from app.metrics.engagement import calculate_engagement, engagement_expr
+from app.models.content import ContentItem, ContentSource, MetricsSnapshot
+
+
+class TestCalculateEngagement:
+    """Tests for calculate_engagement."""
+
+    @pytest.mark.parametrize(
+        ("source", "metrics", "expected"),
+        [
+            ("x", {"likes": 10, "retweets": 3, "replies": 2}, 18.0),
+            ("reddit", {"upvotes": 100, "comments": 5}, 110.0),
+            ("youtube", {"views": 5000, "comments": 4}, 13.0),
+            ("github", {"stars": 7, "forks": 2}, 9.0),
+            ("devto", {"reactions": 4, "comments": 1}, 6.0),
+            ("bluesky", {"likes": 1, "reposts": 1, "replies": 1}, 4.0),
+            ("rss", {"likes": 50}, 0.0),
+        ],
+    )
+    def test_weighted_formula_per_source(self, source, metrics, expected):
+        """Should apply each source's weights and ignore unknown sources."""
+        assert calculate_engagement(metrics, source) == pytest.approx(expected)
+
+    def test_missing_metrics_count_as_zero(self):
+        """Should treat absent metrics as zero."""
+        assert calculate_engagement({"likes": 5}, "x") == 5.0
+
+
+class TestEngagementExpr:
+    """Tests for engagement_expr."""
+
+    @pytest.mark.asyncio
+    async def test_matches_python_formula(self, db_session, content_item_factory):
+        """Should score each source in SQL exactly as calculate_engagement does."""
+        cases = [
+            (ContentSource.X, {"likes": 10, "retweets": 3}),
+            (ContentSource.YOUTUBE, {"views": 1500, "comments": 2}),
+            (ContentSource.GITHUB, {"stars": 7, "forks": 2, "ignored": 50}),
+            (ContentSource.RSS, {"likes": 50}),
+        ]
+        expected = {}
+        for source, metrics in cases:
+            item = await content_item_factory(source=source, metrics=metrics)
+            expected[item.id] = calculate_engagement(metrics, source.value)
+
+        result = await db_session.execute(
+            select(
+                ContentItem.id,
+                engagement_expr(ContentItem.source, MetricsSnapshot.metrics_json),
+            ).join(MetricsSnapshot, MetricsSnapshot.item_id == ContentItem.id)
+        )
+
+        assert dict(result.all()) == pytest.approx(expected)
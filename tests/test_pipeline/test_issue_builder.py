@@ -0,0 +1,34 @@
+"""Tests for issue builder queries."""
+
+from datetime import timedelta
+
+import pytest
+
+from app.core.datetime_utils import utc_now
+from app.models.content import ContentSource, MetricsSnapshot
+from app.pipeline.issue_builder import build_historical_metrics
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestBuildHistoricalMetrics:
+    """Tests for build_historical_metrics."""
+
+    async def test_scores_latest_snapshot_per_source(self, db_session, content_item_factory):
+        """Should build per-source distributions from each item's latest snapshot."""
+        item = await content_item_factory(source=ContentSource.X, metrics={"likes": 1})
+        db_session.add(
+            MetricsSnapshot(
+                item_id=item.id,
+                captured_at=utc_now() + timedelta(minutes=5),
+                metrics_json={"likes": 10, "retweets": 5},
+            )
+        )
+        await content_item_factory(source=ContentSource.X, metrics={"replies": 3})
+        await content_item_factory(source=ContentSource.REDDIT, metrics={"upvotes": 4})
+        await content_item_factory(source=ContentSource.GITHUB)
+        await db_session.flush()
+
+        historical = await build_historical_metrics(db_session)
+
+        assert historical.distributions == {"x": [3.0, 20.0], "reddit": [4.0]}
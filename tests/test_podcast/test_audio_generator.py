@@ -0,0 +1,106 @@
+"""Tests for podcast audio generation."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.podcast import audio_generator, tts_cache
+from app.podcast.audio_generator import PODCAST_INTRO, PODCAST_OUTRO, PodcastAudioGenerator
+from app.schemas.podcast import PodcastScript, PodcastStorySegment
+
+
+@pytest.fixture
+def generator(tmp_path: Path):
+    """Generator with a fake TTS that writes a file per call, and no real audio decoding."""
+
+    async def synthesize(text: str, path: Path) -> MagicMock:
+        path.write_bytes(text.encode())
+        return MagicMock(audio_path=path)
+
+    tts = MagicMock(voice="nova", model="tts-1-hd")
+    tts.synthesize = AsyncMock(side_effect=synthesize)
+    tts.aclose = AsyncMock()
+    with (
+        patch.object(audio_generator, "OpenAITTS", return_value=tts),
+        patch.object(audio_generator, "AudioFileClip", side_effect=lambda path: path),
+        patch.object(tts_cache, "CACHE_DIR", tmp_path / "cache"),
+    ):
+        yield PodcastAudioGenerator()
+
+
+class TestGenerateSection:
+    """Tests for PodcastAudioGenerator._generate_section."""
+
+    async def test_branded_lines_are_synthesized_once(self, generator, tmp_path: Path):
+        """Should serve the constant intro/outro from the cache after the first run."""
+        for run in range(2):
+            await generator._generate_section(PODCAST_INTRO, tmp_path / f"intro_{run}.mp3")
+            await generator._generate_section(PODCAST_OUTRO, tmp_path / f"outro_{run}.mp3")
+
+        assert generator.tts.synthesize.await_count == 2
+
+    async def test_variable_text_is_not_cached(self, generator, tmp_path: Path):
+        """Should synthesize LLM-written text every time and leave the cache empty."""
+        for run in range(2):
+            await generator._generate_section("Today's stories", tmp_path / f"intro_{run}.mp3")
+
+        assert generator.tts.synthesize.await_count == 2
+        assert not (tmp_path / "cache").exists()
+
+
+class TestGenerate:
+    """Tests for PodcastAudioGenerator.generate."""
+
+    async def test_branded_clips_share_their_chapter(self, generator, tmp_path: Path):
+        """Should put the branded and written intro/outro clips in one chapter each."""
+        script = PodcastScript(
+            intro="Today's stories",
+            stories=[
+                PodcastStorySegment(
+                    transition="First up",
+                    headline="Story one",
+                    body="Body",
+                    source_attribution="via GitHub",
+                )
+            ],
+            outro="Thanks",
+        )
+        clip = MagicMock(duration=2.0)
+        with (
+            patch.object(audio_generator, "AudioFileClip", return_value=clip),
+            patch.object(audio_generator, "concatenate_audioclips", return_value=MagicMock()),
+        ):
+            result = await generator.generate(
+                script, tmp_path / "out.mp3", include_background_music=False
+            )
+
+        assert result is not None
+        assert [(c.title, c.start_time, c.end_time) for c in result.chapters] == [
+            ("Introduction", 0.0, 4.0),
+            ("Story one", 4.0, 6.0),
+            ("Outro", 6.0, 10.0),
+        ]
+        assert generator.tts.synthesize.await_count == 5
+        generator.tts.aclose.assert_awaited_once()
+
+    async def test_closes_tts_client_when_synthesis_fails(self, generator, tmp_path: Path):
+        """Should release the TTS client even if synthesizing the sections raises."""
+        script = PodcastScript(
+            intro="Today's stories",
+            stories=[
+                PodcastStorySegment(
+                    transition="First up",
+                    headline="Story one",
+                    body="Body",
+                    source_attribution="via GitHub",
+                )
+            ],
+            outro="Thanks",
+        )
+        generator.tts.synthesize.side_effect = RuntimeError("api down")
+
+        with pytest.raises(RuntimeError, match="api down"):
+            await generator.generate(script, tmp_path / "out.mp3", include_background_music=False)
+
+        generator.tts.aclose.assert_awaited_once()
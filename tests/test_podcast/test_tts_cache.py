@@ -0,0 +1,62 @@
+"""Tests for the podcast TTS cache."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.podcast import tts_cache
+from app.podcast.tts_cache import cache_key, get_or_synthesize
+
+
+@pytest.fixture(autouse=True)
+def temp_cache_dir(tmp_path: Path):
+    """Point the cache at a temp directory."""
+    with patch.object(tts_cache, "CACHE_DIR", tmp_path / "cache"):
+        yield
+
+
+class TestCacheKey:
+    """Tests for cache_key."""
+
+    def test_key_depends_on_voice_model_and_text(self):
+        """Should change when any part of the request changes."""
+        base = cache_key("nova", "tts-1-hd", "Hello")
+        assert base == cache_key("nova", "tts-1-hd", "Hello")
+        assert base != cache_key("alloy", "tts-1-hd", "Hello")
+        assert base != cache_key("nova", "tts-1", "Hello")
+        assert base != cache_key("nova", "tts-1-hd", "Hello!")
+
+
+class TestGetOrSynthesize:
+    """Tests for get_or_synthesize."""
+
+    async def test_synthesizes_once_then_hits_cache(self, tmp_path: Path):
+        """Should call synthesize on a miss only."""
+        calls = []
+
+        async def synthesize(path: Path) -> Path:
+            calls.append(path)
+            path.write_bytes(b"mp3")
+            return path
+
+        key = cache_key("nova", "tts-1-hd", "Hello")
+        first = await get_or_synthesize(key, tmp_path / "a.mp3", synthesize)
+        second = await get_or_synthesize(key, tmp_path / "b.mp3", synthesize)
+
+        assert len(calls) == 1
+        assert first is not None and first.read_bytes() == b"mp3"
+        assert second is not None and second.read_bytes() == b"mp3"
+
+    async def test_failed_synthesis_is_not_cached(self, tmp_path: Path):
+        """Should return None and retry synthesis on the next call."""
+        calls = []
+
+        async def synthesize(path: Path) -> Path | None:
+            calls.append(path)
+            return None
+
+        key = cache_key("nova", "tts-1-hd", "Hello")
+        assert await get_or_synthesize(key, tmp_path / "a.mp3", synthesize) is None
+        assert await get_or_synthesize(key, tmp_path / "a.mp3", synthesize) is None
+        assert len(calls) == 2
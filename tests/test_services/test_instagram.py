@@ -0,0 +1,38 @@
+"""Tests for Instagram Reels service."""
+
+import asyncio
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from app.services.instagram_service import InstagramPostResult, send_instagram_reels
+
+
+class TestSendInstagramReels:
+    """Tests for send_instagram_reels."""
+
+    async def test_posts_reels_concurrently_in_rank_order(self):
+        """Reels overlap up to the concurrency limit and results keep rank order."""
+        config = MagicMock()
+        config.instagram.enabled = True
+        config.instagram.business_account_id = "123"
+        config.instagram.reels_per_day = 3
+        active = peak = 0
+
+        async def fake_post(video_url, item, rank):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return InstagramPostResult(media_id=f"m{rank}", success=True)
+
+        videos = [{"s3_url": f"https://bucket/{rank}.mp4"} for rank in (1, 2, 3)]
+        with (
+            patch("app.services.instagram_service.get_config", return_value=config),
+            patch("app.services.instagram_service.post_instagram_reel", side_effect=fake_post),
+        ):
+            result = await send_instagram_reels(date(2026, 1, 15), videos, [], concurrency=2)
+
+        assert result.success
+        assert [r.media_id for r in result.results] == ["m1", "m2", "m3"]
+        assert peak == 2
@@ -16,6 +16,7 @@ from app.services.twitter_service import (
     _extract_primary_source_url,
     build_intro_tweet,
     build_story_tweet,
+    build_thread_tweets,
     post_twitter_thread,
     send_twitter_digest,
 )
@@ -121,6 +122,15 @@ class TestTweetFormatting:
         assert len(result) <= 280
         assert "Headline Without URL" in result
 
+    def test_build_thread_tweets_order_and_cap(self):
+        """Thread is intro, at most 10 stories, then outro."""
+        items = [{"headline": f"Story {i}", "teaser": "Teaser."} for i in range(12)]
+        result = build_thread_tweets(date(2026, 1, 11), items)
+        assert len(result) == 12
+        assert "January 11, 2026" in result[0]
+        assert "Story 0" in result[1]
+        assert "Story 9" in result[10]
+
 
 class TestSourceExtraction:
     """Tests for URL extraction from citations."""
@@ -0,0 +1,53 @@
+"""Tests for background music fetching."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.video import background_music
+from app.video.background_music import MusicTrack, fetch_background_music
+
+
+@pytest.fixture
+def track() -> MusicTrack:
+    """A Freesound search hit."""
+    return MusicTrack(
+        id=42,
+        name="Ambient Loop",
+        duration=90.0,
+        url="https://freesound.org/s/42/",
+        preview_url="https://cdn.freesound.org/previews/42.mp3",
+        tags=["ambient"],
+        license="CC0",
+    )
+
+
+@pytest.fixture
+def client(track: MusicTrack) -> MagicMock:
+    """Freesound client whose downloads write a small file."""
+
+    async def download(_track: MusicTrack, output_path: Path) -> Path:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(b"mp3")
+        return output_path
+
+    client = MagicMock()
+    client.search_music = AsyncMock(return_value=[track])
+    client.download_track = AsyncMock(side_effect=download)
+    return client
+
+
+class TestFetchBackgroundMusic:
+    """Tests for fetch_background_music."""
+
+    async def test_reuses_cached_track(self, tmp_path: Path, client: MagicMock):
+        """Should download a track once and serve it from the cache afterwards."""
+        with patch.object(background_music, "CACHE_DIR", tmp_path / "cache"):
+            first = await fetch_background_music("general", 60, tmp_path / "run1", client)
+            second = await fetch_background_music("general", 60, tmp_path / "run2", client)
+
+        assert first == tmp_path / "run1" / "background_42.mp3"
+        assert second == tmp_path / "cache" / "background_42.mp3"
+        assert second.read_bytes() == b"mp3"
+        client.download_track.assert_awaited_once()
@@ -1,7 +1,10 @@
 """Tests for video generation orchestrator."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
 from datetime import date
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -178,6 +181,13 @@ class TestVideoConfig:
         """Should have default combined duration target of 60 seconds."""
         assert mock_combined_config.combined_duration_target == 60
 
+    def test_config_is_frozen(self, mock_video_config):
+        """The cached config is shared, so it must reject mutation."""
+        with pytest.raises(FrozenInstanceError):
+            mock_video_config.combined_mode = True
+        with pytest.raises(FrozenInstanceError):
+            mock_video_config.style.font_size = 12
+
 
 # -----------------------------------------------------------------------------
 # Single Video Generation Tests
@@ -289,6 +299,63 @@ class TestGenerateCombinedVideo:
 
             assert result is None
 
+    async def test_generate_combined_video_composes_in_pool(
+        self, three_summaries, mock_combined_config, mock_combined_script, tmp_path
+    ):
+        """Should run the combined compose in the compose pool, off the event loop."""
+        compose_threads: list[threading.Thread] = []
+        composed = CombinedVideoGenerationResult(
+            video_path=str(tmp_path / "noyau_digest.mp4"),
+            duration_seconds=60.0,
+            script=mock_combined_script,
+            story_headlines=[s.headline for s in three_summaries],
+        )
+
+        def fake_compose(**kwargs):
+            compose_threads.append(threading.current_thread())
+            return composed
+
+        pool = ThreadPoolExecutor(max_workers=1)
+        script_result = CombinedVideoScriptResult(
+            script=mock_combined_script,
+            prompt_tokens=300,
+            completion_tokens=200,
+            total_tokens=500,
+        )
+        with (
+            patch("app.video.orchestrator.generate_combined_script", return_value=script_result),
+            patch(
+                "app.video.orchestrator.synthesize_combined_script",
+                new=AsyncMock(return_value=MagicMock(duration=60.0, subtitles=[])),
+            ),
+            patch("app.video.orchestrator.generate_srt"),
+            patch("app.video.orchestrator.fetch_clips_for_script", new=AsyncMock(return_value=[])),
+            patch(
+                "app.video.orchestrator.fetch_background_music", new=AsyncMock(return_value=None)
+            ),
+            patch(
+                "app.video.orchestrator._step_upload_combined_s3", new=AsyncMock(return_value=None)
+            ),
+            patch("app.video.orchestrator.compose_combined_video", side_effect=fake_compose),
+            patch("app.video.orchestrator._get_compose_pool", return_value=pool) as mock_pool,
+        ):
+            try:
+                result = await generate_combined_video(
+                    summaries=three_summaries,
+                    topics=["oss", "ai", "security"],
+                    issue_date=date(2026, 1, 13),
+                    cluster_ids=["id1", "id2", "id3"],
+                    output_dir=tmp_path,
+                    config=mock_combined_config,
+                    skip_youtube=True,
+                )
+            finally:
+                pool.shutdown()
+
+        assert result is composed
+        mock_pool.assert_called_once()
+        assert compose_threads and compose_threads[0] is not threading.main_thread()
+
 
 # -----------------------------------------------------------------------------
 # Routing Tests
@@ -4,6 +4,7 @@ import pytest
 
 from app.schemas.video import CombinedVideoScript, StorySegment, VideoScript
 from app.video.tts.base import TTSProvider
+from app.video.tts.openai_tts import OpenAITTS
 
 # -----------------------------------------------------------------------------
 # Fixtures
@@ -215,3 +216,32 @@ class TestCombinedTTSFormatting:
         finally_pos = text.find("And finally.")
 
         assert first_up_pos < next_up_pos < finally_pos
+
+
+# -----------------------------------------------------------------------------
+# OpenAI Provider Tests
+# -----------------------------------------------------------------------------
+
+
+class TestOpenAITTS:
+    """Tests for the OpenAI TTS provider."""
+
+    async def test_aclose_closes_shared_client(self):
+        """Should close the lazily created client and build a fresh one on next use."""
+        tts = OpenAITTS(api_key="sk-test")
+        client = tts._get_client()
+        assert tts._get_client() is client
+
+        await tts.aclose()
+
+        assert client.is_closed()
+        assert tts._get_client() is not client
+        await tts.aclose()
+
+    async def test_aclose_without_client_is_noop(self):
+        """Should do nothing if no request was ever made."""
+        tts = OpenAITTS(api_key="sk-test")
+
+        await tts.aclose()
+
+        assert tts._client is None